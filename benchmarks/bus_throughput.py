@@ -0,0 +1,64 @@
+"""Achievable sampling rate of one serial bus per read plan.
+
+Run with ``python benchmarks/bus_throughput.py``. The controllers are
+emulated by a local Modbus RTU slave (see
+``eurothermlib.controllers.modbus_slave``), so the numbers include the
+complete client path (framing, decoding, retries) and the configured
+response latency of the instruments. The transmission time on a real
+serial line is not included, so it is estimated from the bytes of the
+RTU frames (11 bits per character).
+
+The block plan saves one transaction but transfers 178 instead of 63
+bytes per sample (102 vs 36 ms at 19200 Bd), so it only pays off if the
+response latency of an instrument exceeds the additional ~66 ms of wire
+time per sample.
+"""
+
+import time
+
+from eurothermlib.configuration import SerialPortConfig
+from eurothermlib.controllers import GenericEurothermController, ModbusSerialConnection
+from eurothermlib.controllers.modbus_slave import EurothermModbusSlave
+
+SAMPLES = 200
+BAUD_RATE = SerialPortConfig().baudRate
+LATENCIES = (0.0, 0.005, 0.020)  # response time of the instrument [s]
+
+
+def bench(slave: EurothermModbusSlave, read_plan: str):
+    connection = ModbusSerialConnection(SerialPortConfig(port=slave.url))
+    controller = GenericEurothermController(1, connection, read_plan=read_plan)
+    controller.get_process_values()  # warm up (connect)
+
+    requests = slave.statistics.requests
+    size = slave.statistics.bytes
+    start = time.perf_counter()
+    for _ in range(SAMPLES):
+        controller.get_process_values()
+    elapsed = time.perf_counter() - start
+    transactions = (slave.statistics.requests - requests) / SAMPLES
+    size = (slave.statistics.bytes - size) / SAMPLES
+    wire = size * 11 / BAUD_RATE
+
+    print(
+        f'{read_plan:<10} {slave[1].latency * 1e3:6.1f} ms '
+        f'{transactions:4.0f} {elapsed / SAMPLES * 1e3:10.2f} ms '
+        f'{SAMPLES / elapsed:10.1f} {size:6.0f} B {wire * 1e3:8.2f} ms'
+    )
+
+
+def main():
+    print(
+        'plan       latency  transactions  per sample  samples/s'
+        f'  frames  wire time ({BAUD_RATE} Bd)'
+    )
+    for latency in LATENCIES:
+        with EurothermModbusSlave(latency=latency) as slave:
+            for read_plan in ('separate', 'block'):
+                bench(slave, read_plan)
+            connection = ModbusSerialConnection.__connections__.pop(slave.url)
+            connection.close()
+
+
+if __name__ == '__main__':
+    main()
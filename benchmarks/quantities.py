@@ -0,0 +1,53 @@
+"""Per-sample cost of the quantities created on the acquisition path.
+
+Run with ``python benchmarks/quantities.py``. For every sample, the
+controller decodes its registers into four quantities and every client
+converts the received protobuf message back into five quantities.
+"""
+
+import timeit
+
+from eurothermlib.controllers.generic import (
+    INT_BLOCK_SIZE,
+    GenericEurothermController,
+)
+from eurothermlib.server.acquisition import TData
+from eurothermlib.utils import TemperatureQ
+
+NUMBER = 20_000
+REPEAT = 5
+
+
+def bench(name: str, fn):
+    fn()  # warm up (unit parsing, caches)
+    best = min(timeit.repeat(fn, number=NUMBER, repeat=REPEAT)) / NUMBER
+    print(f'{name:<32} {best * 1e6:8.2f} µs')
+
+
+def main():
+    registers = [250] * INT_BLOCK_SIZE
+    values = GenericEurothermController._decode_int_block(registers, 0, 1)
+    data = TData(
+        deviceName='bench',
+        timestamp=values.timestamp,
+        processValue=values.processValue,
+        setpoint=values.setpoint,
+        workingSetpoint=values.workingSetpoint,
+        remoteSetpoint=values.setpoint,
+        workingOutput=values.workingOutput,
+        status=values.status,
+        rampStatus=0,
+    )
+    response = data.to_grpc_response()
+
+    bench('TemperatureQ(value, °C)', lambda: TemperatureQ(25.0, '°C'))
+    bench(
+        'decode register block',
+        lambda: GenericEurothermController._decode_int_block(registers, 0, 1),
+    )
+    bench('TData.from_grpc_response', lambda: TData.from_grpc_response(response))
+    bench('TData.to_grpc_response', data.to_grpc_response)
+
+
+if __name__ == '__main__':
+    main()
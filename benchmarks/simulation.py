@@ -0,0 +1,59 @@
+"""Cost of simulating many devices per sampling period.
+
+Run with ``python benchmarks/simulation.py``. Each device is sampled once
+per second (four loop steps of 0.25 s), either by one `EurothermSimulator`
+per device or by a shared `SimulationEngine` advancing all devices in one
+vectorized step.
+"""
+
+import timeit
+
+from eurothermlib.controllers import EurothermSimulator, SimulationEngine
+from eurothermlib.controllers.controller import RemoteSetpointState
+from eurothermlib.utils import TemperatureQ
+
+DEVICES = (1, 10, 50, 500)
+PERIODS = 20
+REPEAT = 5
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def setup(controllers):
+    for controller in controllers:
+        controller.toggle_remote_setpoint(RemoteSetpointState.ENABLE)
+        controller.write_remote_setpoint(TemperatureQ(300.0, '°C'))
+    return controllers
+
+
+def bench(name: str, count: int, controllers, clock: Clock):
+    def sample():
+        clock.now += 1.0
+        for controller in controllers:
+            controller.get_process_values()
+
+    best = min(timeit.repeat(sample, number=PERIODS, repeat=REPEAT)) / PERIODS
+    print(f'{name:<12} {count:6d} {best * 1e3:10.3f} ms')
+
+
+def main():
+    print('engine       devices  per period')
+    for count in DEVICES:
+        clock = Clock()
+        simulators = setup([EurothermSimulator(time_fn=clock) for _ in range(count)])
+        bench('simulators', count, simulators, clock)
+
+        clock = Clock()
+        engine = SimulationEngine(time_fn=clock)
+        virtual = setup([engine.controller(f'device{k}') for k in range(count)])
+        bench('engine', count, virtual, clock)
+
+
+if __name__ == '__main__':
+    main()
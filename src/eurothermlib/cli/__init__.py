@@ -1,4 +1,4 @@
-from . import alarm_cli, cli, remote_cli, server_cli, trigger_cli, ui_cli, wait_cli
+from . import alarm_cli, cli, remote_cli, server_cli, trigger_cli, tune_cli, ui_cli, wait_cli
 
 __all__ = [
     cli,
@@ -7,5 +7,6 @@ __all__ = [
     server_cli,
     ui_cli,
     trigger_cli,
+    tune_cli,
     wait_cli,
 ]  # type: ignore
@@ -40,7 +40,8 @@ def enable(ctx: click.Context, device: str):
         client.toggle_remote_setpoint(device, servicer.RemoteSetpointState.ENABLE)
 
         logger.info(f'[{repr(device)}] Checking remote setpoint status')
-        status = client.current_process_values(device).status
+        # force a fresh sample acquired after toggling the selector
+        status = client.current_process_values(device, TimeQ(0, 's')).status
         if InstrumentStatus.LocalRemoteSPSelect not in status:
             logger.warning(f'[{repr(device)}] Could not enable remote setpoint')
             logger.warning(f'[{repr(device)}] Instrument status: {pretty_repr(status)}')
@@ -66,7 +67,8 @@ def disable(ctx: click.Context, device: str):
         client.toggle_remote_setpoint(device, servicer.RemoteSetpointState.DISBALE)
 
         logger.info(f'[{repr(device)}] Checking remote setpoint status')
-        status = client.current_process_values(device).status
+        # force a fresh sample acquired after toggling the selector
+        status = client.current_process_values(device, TimeQ(0, 's')).status
         if InstrumentStatus.LocalRemoteSPSelect in status:
             logger.warning(f'[{repr(device)}] Could not disable remote setpoint')
             logger.warning(f'[{repr(device)}] Instrument status: {pretty_repr(status)}')
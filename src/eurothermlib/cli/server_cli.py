@@ -1,17 +1,15 @@
 import logging
 from concurrent import futures
-from typing import List
 
-import click
-import pandas as pd
-import reactivex as rx
-import reactivex.operators as op
+import time
 
-from eurothermlib.logging import FileDataLogger
-from eurothermlib.server.acquisition import TData
+import click
 
+from ..configuration import Config
+from ..controllers import modbus_slave
 from ..server import servicer
-from .cli import cli, get_configuration
+from ..utils import TimeQ
+from .cli import cli, get_configuration, validate_time
 
 logger = logging.getLogger(__name__)
 
@@ -34,33 +32,14 @@ def start(ctx):
     if servicer.is_alive(cfg.server):
         logger.warning('Server is already running... do nothing.')
     else:
-        future = servicer.serve(cfg)
+        # process values are logged by the server itself
+        future = servicer.serve(cfg, log_data=True)
         try:
-            client = servicer.connect(cfg)
-
-            data_logger = FileDataLogger(cfg.logging)
-
-            def do_log(data: List[TData]):
-                if data:
-                    df = pd.DataFrame(data)
-                    data_logger.log_data(df)
-
-            subscription = (
-                rx.from_iterable(client.stream_process_values())
-                .pipe(
-                    op.buffer_with_time(cfg.logging.write_interval.to_timedelta()),
-                    # op.do(lambda data: data_logger.log_data(pd.DataFrame(data))),
-                )
-                .subscribe(do_log)
-            )
-
             while True:
                 _, not_done = futures.wait([future], timeout=2.0)
                 if not not_done:
                     break
 
-            subscription.dispose()
-
         except KeyboardInterrupt:
             logger.warning('Keyboard interrupt detected. Trying to stop server...')
             client = servicer.connect(cfg.server)
@@ -80,3 +59,56 @@ def stop(ctx):
         logger.info('Requesting server to stop.')
         client = servicer.connect(cfg.server)
         client.stop_server()
+
+
+@server.command()
+@click.pass_context
+@click.option(
+    '--latency',
+    default='0ms',
+    callback=validate_time,
+    show_default=True,
+    help='Response time of the simulated controllers.',
+)
+@click.option(
+    '--error-rate',
+    type=click.FloatRange(0.0, 1.0),
+    default=0.0,
+    show_default=True,
+    help='Probability of answering a request with a Modbus exception.',
+)
+@click.option(
+    '--timeout-rate',
+    type=click.FloatRange(0.0, 1.0),
+    default=0.0,
+    show_default=True,
+    help='Probability of not answering a request at all.',
+)
+def simulate(ctx, latency: TimeQ, error_rate: float, timeout_rate: float):
+    """Simulates the Modbus controllers of the configured devices.
+
+    Only devices whose port is a socket URL (e.g. socket://127.0.0.1:5020)
+    are simulated, such that the server can be run without hardware.
+    """
+    cfg: Config = ctx.obj['config']
+    slaves = modbus_slave.create_slaves(
+        cfg.devices,
+        latency=latency.m_as('s'),
+        error_rate=error_rate,
+        timeout_rate=timeout_rate,
+    )
+    if not slaves:
+        logger.warning('No device is configured with a socket URL as port.')
+        return
+
+    for slave in slaves:
+        slave.start()
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        logger.warning('Keyboard interrupt detected. Stopping simulation...')
+    finally:
+        for slave in slaves:
+            slave.stop()
+            logger.info(f'{slave.url}: {slave.statistics}')
@@ -149,9 +149,9 @@ def every(
             T0 = client.current_process_values(device).processValue
             with Progress() as progress:
                 task = progress.add_task('Waiting...', total=1.0, completed=0.0)
-                for data in client.stream_process_values():
-                    if data.deviceName != device:
-                        continue
+                for data in client.stream_process_values(
+                    devices=[device], fields=['processValue']
+                ):
                     dT = abs(data.processValue - T0)
                     progress.update(task, completed=dT / temperature_interval)
                     if dT > temperature_interval:
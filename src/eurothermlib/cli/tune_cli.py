@@ -0,0 +1,186 @@
+import logging
+from typing import Optional
+
+import click
+
+from ..plant import ThermalPlant
+from ..tuning import best, parse_range, sweep
+from ..utils import TemperatureQ, TimeQ
+from .cli import cli, validate_temperature, validate_time
+
+logger = logging.getLogger(__name__)
+
+
+def validate_range(ctx: click.Context, param, value):
+    try:
+        return parse_range(value)
+    except ValueError as ex:
+        logger.error(str(ex))
+        raise click.BadParameter(
+            f'{value} is neither a list (a,b,c) nor a range (start:stop:num[:log]).'
+        )
+
+
+@cli.command()
+@click.pass_context
+@click.option(
+    '--kp',
+    default='0.01:1:10:log',
+    show_default=True,
+    callback=validate_range,
+    help='Proportional gains, a list (a,b,c) or range (start:stop:num[:log]).',
+)
+@click.option(
+    '--ki',
+    default='1e-5:1e-2:10:log',
+    show_default=True,
+    callback=validate_range,
+    help='Integral gains [1/s].',
+)
+@click.option(
+    '--kd',
+    default='0',
+    show_default=True,
+    callback=validate_range,
+    help='Derivative gains [s].',
+)
+@click.option(
+    '--start',
+    default='20degC',
+    show_default=True,
+    callback=validate_temperature,
+    help='Initial (and room) temperature.',
+)
+@click.option(
+    '--setpoint',
+    default='300degC',
+    show_default=True,
+    callback=validate_temperature,
+    help='The setpoint of the step.',
+)
+@click.option(
+    '--max-power',
+    type=float,
+    default=ThermalPlant.max_power,
+    show_default=True,
+    help='Heater power of the plant [W].',
+)
+@click.option(
+    '--heat-capacity',
+    type=float,
+    default=ThermalPlant.heat_capacity,
+    show_default=True,
+    help='Heat capacity of the plant [J/K].',
+)
+@click.option(
+    '--heat-loss',
+    type=float,
+    default=ThermalPlant.heat_loss,
+    show_default=True,
+    help='Heat loss of the plant [W/K].',
+)
+@click.option(
+    '--duration',
+    default='3h',
+    show_default=True,
+    callback=validate_time,
+    help='Simulated time.',
+)
+@click.option(
+    '--dt', default='1s', show_default=True, callback=validate_time, help='Time step.'
+)
+@click.option(
+    '--band',
+    type=float,
+    default=2.0,
+    show_default=True,
+    help='Settling band [% of the step].',
+)
+@click.option(
+    '--max-overshoot',
+    type=float,
+    default=5.0,
+    show_default=True,
+    help='Largest acceptable overshoot [% of the step].',
+)
+@click.option(
+    '--workers',
+    type=int,
+    default=1,
+    show_default=True,
+    help='Number of processes simulating the candidates.',
+)
+@click.option(
+    '--top', type=int, default=10, show_default=True, help='Number of tunings shown.'
+)
+@click.option(
+    '-o',
+    '--output',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='Write the metrics of all candidates to a CSV file.',
+)
+def tune(
+    ctx: click.Context,
+    kp,
+    ki,
+    kd,
+    start: TemperatureQ,
+    setpoint: TemperatureQ,
+    max_power: float,
+    heat_capacity: float,
+    heat_loss: float,
+    duration: TimeQ,
+    dt: TimeQ,
+    band: float,
+    max_overshoot: float,
+    workers: int,
+    top: int,
+    output: Optional[str],
+):
+    """Find PID tunings by simulating a step response (offline).
+
+    All combinations of the gains control a simulated thermal plant
+    heated from START to SETPOINT. The tunings are ranked by settling
+    time among those that do not overshoot more than MAX-OVERSHOOT.
+    """
+    room_temperature = start.m_as('degC')
+    plant = ThermalPlant(
+        temperature=room_temperature,
+        room_temperature=room_temperature,
+        max_power=max_power,
+        heat_capacity=heat_capacity,
+        heat_loss=heat_loss,
+    )
+    final = plant.steady_state(1.0)
+    if setpoint.m_as('degC') >= final:
+        logger.warning(
+            f'The setpoint is not below the highest temperature of the plant '
+            f'({final:.1f} °C), no tuning will settle.'
+        )
+
+    count = len(kp) * len(ki) * len(kd)
+    logger.info(f'Simulating {count} tunings ...')
+    results = sweep(
+        kp,
+        ki,
+        kd,
+        plant,
+        setpoint.m_as('degC'),
+        duration.m_as('s'),
+        dt=dt.m_as('s'),
+        band=band / 100,
+        workers=workers,
+    )
+    if output is not None:
+        results.to_csv(output, index=False)
+        logger.info(f'Results written to {output}.')
+
+    ranking = best(results, max_overshoot=max_overshoot, count=top)
+    if ranking.empty:
+        logger.warning('None of the tunings settles within the limits.')
+        return
+
+    logger.info('Best tunings (times in s, overshoot in %, IAE in K s):')
+    for line in ranking.to_string(index=False).splitlines():
+        logger.info(line)
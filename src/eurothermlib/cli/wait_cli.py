@@ -93,9 +93,9 @@ def reach(
         initial_dT = abs(temperature - T0)
         with Progress() as progress:
             task = progress.add_task('Waiting...', total=1.0, completed=0.0)
-            for data in client.stream_process_values():
-                if data.deviceName != device:
-                    continue
+            for data in client.stream_process_values(
+                devices=[device], fields=['processValue']
+            ):
                 dT = abs(temperature - data.processValue)
                 progress.update(task, completed=1.0 - dT / initial_dT)
                 if dT < tolerance:
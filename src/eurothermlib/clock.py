@@ -0,0 +1,42 @@
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+
+class SamplingClock:
+    """Sampling clock based on absolute monotonic deadlines.
+
+    The deadline of the n-th sample is ``t0 + n * interval``, independent
+    of the time spent on I/O. Slots that have already passed when a sample
+    completes are skipped (and counted) instead of being sampled in a
+    burst.
+    """
+
+    def __init__(self, interval: float, time_fn: Callable[[], float] = time.monotonic):
+        self.interval = interval
+        self.time_fn = time_fn
+        self.missed = 0
+
+        # first sample is due immediately
+        self._t0 = time_fn()
+        self._t0_wall = datetime.now()
+        self.deadline = self._t0
+
+    def delay(self) -> float:
+        """Time in seconds until the current slot is due."""
+        return max(0.0, self.deadline - self.time_fn())
+
+    def scheduled_datetime(self) -> datetime:
+        """Wall clock time of the current slot."""
+        return self._t0_wall + timedelta(seconds=self.deadline - self._t0)
+
+    def advance(self) -> int:
+        """Move to the next slot and return the number of skipped slots."""
+        now = self.time_fn()
+        self.deadline += self.interval
+        skipped = 0
+        if self.deadline < now:
+            skipped = int((now - self.deadline) / self.interval) + 1
+            self.deadline += skipped * self.interval
+            self.missed += skipped
+        return skipped
@@ -16,18 +16,36 @@ logger = logging.getLogger(__name__)
 OmegaConf.register_new_resolver('now', lambda fmt: datetime.now().strftime(fmt))
 
 
+AcquisitionEngine = Literal['threads', 'asyncio']
+ServicerEngine = Literal['threads', 'asyncio']
+LoggingBackend = Literal['csv', 'parquet']
+FlushPolicy = Literal['none', 'flush', 'fsync']
+OverflowPolicy = Literal['drop-oldest', 'drop-newest', 'coalesce', 'disconnect']
+
+
 class ServerConfig(BaseModel):
     ip: IPv4Address = IPv4Address('127.0.0.1')
     port: int = 50061
     timeout: Annotated[TimeQ, Field(validate_default=True)] = '5s'
+    acquisition: AcquisitionEngine = 'threads'
+    # gRPC server: thread pool or asyncio (grpc.aio, no thread per stream)
+    servicer: ServicerEngine = 'threads'
+    # maximum number of samples (or batches) waiting to be sent to a stream
+    # client and what to do if a client does not keep up (see StreamQueue)
+    stream_queue_size: int = 1000
+    stream_overflow: OverflowPolicy = 'drop-oldest'
 
 
 class SerialPortConfig(BaseModel):
     port: str = 'COM1'
     baudRate: int = 19200
+    # poll the devices on this port through a BusScheduler (threaded engine
+    # only, ignored by the asyncio engine)
+    scheduled: bool = False
 
 
 Driver = Literal['simulate', 'generic', 'model3208']
+ReadPlan = Literal['separate', 'block']
 
 
 class DeviceConfig(BaseModel):
@@ -36,6 +54,14 @@ class DeviceConfig(BaseModel):
     connection: SerialPortConfig = SerialPortConfig()
     sampling_rate: Annotated[FrequencyQ, Field(validate_default=True)] = '1 Hz'
     driver: Driver = 'simulate'
+    # 'block' saves a transaction but transfers ~3x the bytes of 'separate'
+    # (75 registers) and reads scaled integers (lower resolution), so it is
+    # only faster if the response latency of the instrument dominates
+    # (see benchmarks/bus_throughput.py)
+    read_plan: ReadPlan = 'separate'
+    decimal_places: int = 1
+    # number of recent samples kept in memory by the server
+    history_size: int = 36000
 
 
 class TriggerConfig(BaseModel):
@@ -44,12 +70,22 @@ class TriggerConfig(BaseModel):
 
 
 class LoggingConfig(BaseModel):
+    # 'parquet' requires pyarrow (extra 'parquet') and replaces the suffix of
+    # `filename`
+    backend: LoggingBackend = 'csv'
     directory: str = './output/{:%Y-%m-%d}'
     filename: str = 'eurotherm-{:%Y-%m-%dT%H-%M-%S}.csv'
     format: str = "%.6g"
     separator: str = ";"
     rotate_every: Annotated[TimeQ, Field(validate_default=True)] = '1min'
     write_interval: Annotated[TimeQ, Field(validate_default=True)] = '10s'
+    # after each written batch: keep data in buffers ('none'), flush buffers
+    # to the OS ('flush') or additionally sync the file to disk ('fsync')
+    flush: FlushPolicy = 'flush'
+    # maximum number of batches waiting to be written (others are dropped)
+    queue_size: int = 16
+    # add 'deviceName' to serve logged samples of several devices by
+    # GetHistory (samples of different devices cannot be told apart otherwise)
     columns: List[str] = [
         'timestamp',
         'processValue',
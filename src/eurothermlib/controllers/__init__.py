@@ -1,11 +1,15 @@
-from .connection import ModbusSerialConnection
+from .connection import AsyncModbusSerialConnection, ModbusSerialConnection
 from .controller import (
+    AsyncControllerAdapter,
+    AsyncEurothermController,
     EurothermController,
     EurothermSimulator,
     InstrumentStatus,
     ProcessValues,
 )
-from .generic import GenericEurothermController
+from .generic import AsyncGenericEurothermController, GenericEurothermController
+from .scheduler import BusScheduler, BusStatistics
+from .simulation import SimulationEngine, VirtualController
 from .series3200 import EurothermSeries3200
 
 __all__ = [
@@ -14,6 +18,14 @@ __all__ = [
     EurothermController,
     EurothermSimulator,
     ModbusSerialConnection,
+    BusScheduler,
+    BusStatistics,
     GenericEurothermController,
+    AsyncEurothermController,
+    AsyncControllerAdapter,
+    AsyncModbusSerialConnection,
+    AsyncGenericEurothermController,
     EurothermSeries3200,
+    SimulationEngine,
+    VirtualController,
 ]
@@ -1,7 +1,8 @@
+import asyncio
 from concurrent import futures
 import logging
 from ..configuration import SerialPortConfig
-from pymodbus.client import ModbusSerialClient
+from pymodbus.client import AsyncModbusSerialClient, ModbusSerialClient
 
 logger = logging.getLogger(__name__)
 
@@ -71,3 +72,62 @@ class ModbusSerialConnection:
             register_address,
             value,
         )
+
+
+class AsyncModbusSerialConnection:
+    __connections__ = {}
+
+    def __init__(self, cfg: SerialPortConfig):
+        if getattr(self, '_initialized', False):
+            return
+        self._initialized = True
+        self.client = AsyncModbusSerialClient(cfg.port, baudrate=cfg.baudRate)
+        self._lock = asyncio.Lock()
+
+    def __new__(cls, cfg: SerialPortConfig):
+        if cfg.port in AsyncModbusSerialConnection.__connections__:
+            return AsyncModbusSerialConnection.__connections__[cfg.port]
+        else:
+            instance = super().__new__(cls)
+            AsyncModbusSerialConnection.__connections__[cfg.port] = instance
+            return instance
+
+    def close(self):
+        return self.client.close()
+
+    async def _ensure_connected(self):
+        if not self.client.connected:
+            await self.client.connect()
+
+    async def read_holding_registers(
+        self, unit_address: int, register_address: int, num_registers: int = 1
+    ):
+        # only one transaction at a time on the serial line
+        async with self._lock:
+            await self._ensure_connected()
+            logger.debug(
+                (
+                    f'Read holding register(s): unit={unit_address},'
+                    f'register={register_address}, count={num_registers}'
+                )
+            )
+            return await self.client.read_holding_registers(
+                address=register_address,
+                count=num_registers,
+                slave=unit_address,
+            )
+
+    async def write_holding_register(
+        self, unit_address: int, register_address: int, value: int
+    ):
+        async with self._lock:
+            await self._ensure_connected()
+            logger.debug(
+                (
+                    f'Write holding register: unit={unit_address},'
+                    f'register={register_address}, value={value}'
+                )
+            )
+            return await self.client.write_register(
+                address=register_address, value=value, slave=unit_address
+            )
@@ -1,13 +1,23 @@
 from dataclasses import dataclass
 from datetime import datetime
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from enum import IntEnum, IntFlag, auto
-from typing import cast
+from typing import Callable, Optional, cast
 
 import numpy as np
 
-from ..utils import DimensionlessQ, TemperatureQ, VoltageQ
+from ..pid import PID
+from ..plant import ROOM_TEMPERATURE, ThermalPlant
+from ..utils import (
+    ZERO_CELSIUS,
+    DimensionlessQ,
+    LazyQuantity,
+    TemperatureQ,
+    VoltageQ,
+)
 
 # ureg = pint.application_registry.get()
 logger = logging.getLogger(__name__)
@@ -38,11 +48,13 @@ class RemoteSetpointState(IntEnum):
 
 @dataclass
 class ProcessValues:
+    # temperatures are stored in K, the working output in % (numbers
+    # assigned to these fields are taken to be in these units)
     timestamp: datetime
-    processValue: TemperatureQ
-    setpoint: TemperatureQ
-    workingSetpoint: TemperatureQ
-    workingOutput: DimensionlessQ
+    processValue: TemperatureQ = LazyQuantity(TemperatureQ, 'K')
+    setpoint: TemperatureQ = LazyQuantity(TemperatureQ, 'K')
+    workingSetpoint: TemperatureQ = LazyQuantity(TemperatureQ, 'K')
+    workingOutput: DimensionlessQ = LazyQuantity(DimensionlessQ, '%')
     status: InstrumentStatus
 
 
@@ -74,59 +86,199 @@ class EurothermController(ABC):
         pass
 
 
+# thermo voltage of Type K thermocouples [T (°C), U (mV)]
+TYPE_K_TEMPERATURE, TYPE_K_VOLTAGE = np.array(
+    [
+        [0, 0],
+        [100, 4.096],
+        [200, 8.138],
+        [300, 12.209],
+        [400, 16.397],
+        [500, 20.644],
+        [600, 24.905],
+        [700, 29.129],
+        [800, 33.275],
+        [900, 37.326],
+        [1000, 41.276],
+        [1100, 45.119],
+        [1200, 48.838],
+        [1250, 50.644],
+        [1300, 52.410],
+    ]
+).T.copy()
+
+
 class EurothermSimulator(EurothermController):
-    def __init__(self):
-        self._process_value = TemperatureQ(20, 'degC')
-        self._setpoint = self._process_value
+    """Simulated controller heating a `ThermalPlant` with a PID loop.
+
+    The loop is advanced in steps of `sample_time` (simulated time, by
+    default real time from `time_fn`) whenever the controller is accessed.
+    The working setpoint follows the local or the remote setpoint (as
+    selected by `toggle_remote_setpoint`), limited to `setpoint_rate`
+    [K/s] if given, like the setpoint rate limit of the instrument.
+    """
+
+    def __init__(
+        self,
+        plant: Optional[ThermalPlant] = None,
+        pid: Optional[PID] = None,
+        setpoint: float = ROOM_TEMPERATURE,
+        setpoint_rate: Optional[float] = None,
+        sample_time: float = 0.25,
+        time_fn: Callable[[], float] = time.monotonic,
+    ):
+        self.plant = plant if plant is not None else ThermalPlant()
+        # temperatures in °C, output as fraction of the heater power
+        self.pid = (
+            pid
+            if pid is not None
+            else PID(0.1, 2e-4, 0.0, sample_time=None, output_limits=(0.0, 1.0))
+        )
+        self.pid.setpoint = setpoint
+        self.sample_time = sample_time
+        self.setpoint_rate = setpoint_rate
+        self.time_fn = time_fn
+
+        self._lock = threading.Lock()
+        self._setpoint = setpoint
+        self._remote_setpoint = setpoint
+        self._remote = False
+        self._output = 0.0
+        self._last_time = time_fn()
+
+    # region simulation
+
+    def _target(self) -> float:
+        return self._remote_setpoint if self._remote else self._setpoint
+
+    def _ramping(self) -> bool:
+        return self.pid.setpoint != self._target()
+
+    def _step(self, dt: float):
+        target = self._target()
+        if self.setpoint_rate is None:
+            self.pid.setpoint = target
+        else:
+            delta = target - self.pid.setpoint
+            step = self.setpoint_rate * dt
+            self.pid.setpoint += max(-step, min(step, delta))
+
+        self._output = self.pid(self.plant.temperature, dt=dt)
+        self.plant.update(self._output, dt)
+
+    def _advance(self):
+        # advance in full steps only, the remainder is kept for the next call
+        now = self.time_fn()
+        steps = int((now - self._last_time) / self.sample_time)
+        for _ in range(steps):
+            self._step(self.sample_time)
+        self._last_time += steps * self.sample_time
+
+    # endregion
 
     @property
-    def process_value(self):
-        return cast(TemperatureQ, self._process_value)
+    def process_value(self) -> TemperatureQ:
+        with self._lock:
+            self._advance()
+            return TemperatureQ(self.plant.temperature, 'degC')
 
     @property
-    def measured_value(self):
-        T = self._process_value.m_as('degC')
-
-        # thermo voltage of Type K thermocouple [T (°C), U (mV)]
-        type_k_data = np.array(
-            [
-                [0, 0],
-                [100, 4.096],
-                [200, 8.138],
-                [300, 12.209],
-                [400, 16.397],
-                [500, 20.644],
-                [600, 24.905],
-                [700, 29.129],
-                [800, 33.275],
-                [900, 37.326],
-                [1000, 41.276],
-                [1100, 45.119],
-                [1200, 48.838],
-                [1250, 50.644],
-                [1300, 52.410],
-            ]
+    def measured_value(self) -> VoltageQ:
+        voltage = np.interp(
+            self.process_value.m_as('degC'), TYPE_K_TEMPERATURE, TYPE_K_VOLTAGE
         )
-        voltage = np.interp(T, *type_k_data.T)
         return cast(VoltageQ, VoltageQ(voltage, 'mV'))
 
     @property
     def setpoint(self) -> TemperatureQ:
-        return cast(TemperatureQ, self._setpoint)
+        return TemperatureQ(self._setpoint, 'degC')
 
     @property
     def working_setpoint(self) -> TemperatureQ:
-        return cast(TemperatureQ, self._setpoint)
+        with self._lock:
+            self._advance()
+            return TemperatureQ(self.pid.setpoint, 'degC')
 
     @property
-    def working_output(self):
-        return DimensionlessQ(0.0, '%')
+    def working_output(self) -> DimensionlessQ:
+        with self._lock:
+            self._advance()
+            return DimensionlessQ(100.0 * self._output, '%')
+
+    @property
+    def status(self) -> InstrumentStatus:
+        with self._lock:
+            self._advance()
+            return self._status()
+
+    def _status(self) -> InstrumentStatus:
+        status = InstrumentStatus.Ok
+        if self._remote:
+            status |= InstrumentStatus.LocalRemoteSPSelect
+        if self._ramping():
+            status |= InstrumentStatus.TimerRampRunning
+        return status
+
+    def get_process_values(self) -> ProcessValues:
+        with self._lock:
+            self._advance()
+            # magnitudes in K and %, respectively (see ProcessValues)
+            return ProcessValues(
+                timestamp=datetime.now(),
+                processValue=self.plant.temperature + ZERO_CELSIUS,
+                setpoint=self._setpoint + ZERO_CELSIUS,
+                workingSetpoint=self.pid.setpoint + ZERO_CELSIUS,
+                workingOutput=100.0 * self._output,
+                status=self._status(),
+            )
 
     def toggle_remote_setpoint(self, state: RemoteSetpointState):
-        pass
+        with self._lock:
+            self._advance()
+            self._remote = state == RemoteSetpointState.ENABLE
 
     def write_remote_setpoint(self, value: TemperatureQ):
-        pass
+        with self._lock:
+            self._advance()
+            self._remote_setpoint = value.m_as('degC')
 
     def acknowledge_all_alarms(self):
         pass
+
+
+class AsyncEurothermController(ABC):
+    @abstractmethod
+    async def get_process_values(self) -> ProcessValues:
+        pass
+
+    @abstractmethod
+    async def toggle_remote_setpoint(self, state: RemoteSetpointState):
+        pass
+
+    @abstractmethod
+    async def write_remote_setpoint(self, value: TemperatureQ):
+        pass
+
+    @abstractmethod
+    async def acknowledge_all_alarms(self):
+        pass
+
+
+class AsyncControllerAdapter(AsyncEurothermController):
+    """Exposes a (non-blocking) synchronous controller, e.g. the simulator,
+    to the asyncio acquisition engine."""
+
+    def __init__(self, controller: EurothermController):
+        self.controller = controller
+
+    async def get_process_values(self) -> ProcessValues:
+        return self.controller.get_process_values()
+
+    async def toggle_remote_setpoint(self, state: RemoteSetpointState):
+        self.controller.toggle_remote_setpoint(state)
+
+    async def write_remote_setpoint(self, value: TemperatureQ):
+        self.controller.write_remote_setpoint(value)
+
+    async def acknowledge_all_alarms(self):
+        self.controller.acknowledge_all_alarms()
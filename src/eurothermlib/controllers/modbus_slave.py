@@ -0,0 +1,320 @@
+import asyncio
+import logging
+import random
+import struct
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from pymodbus.datastore import ModbusServerContext
+from pymodbus.datastore.context import ModbusBaseSlaveContext
+from pymodbus.framer import FramerType
+from pymodbus.pdu import ExceptionResponse, ModbusExceptions
+from pymodbus.server import ModbusTcpServer
+
+from ..configuration import DeviceConfig
+from .generic import GenericAddress
+
+logger = logging.getLogger(__name__)
+
+FLOAT_BASE = 0x8000
+READ_FUNCTION_CODES = (3, 4)
+
+# parameters which are transmitted as plain integers (not scaled by the
+# decimal places of the display resolution)
+UNSCALED = (GenericAddress.STAT, GenericAddress.LR, GenericAddress.AcALL)
+# alarm bits (Alarm1..4 and NewAlarm) cleared by acknowledging all alarms
+ALARM_BITS = 0b0001_0000_0000_1111
+
+
+class EurothermRegisters(ModbusBaseSlaveContext):
+    """Register map of a single Eurotherm controller (one unit address).
+
+    Parameters are stored in engineering units (°C, %, bitmaps) and are
+    served both as scaled 16 bit integers at their parameter address and
+    as IEEE floats at ``0x8000 + 2 * address`` (high word first). Writes
+    behave like the instrument: RmSP/LR select the working setpoint and
+    AcALL clears the alarm bits of STAT.
+    """
+
+    def __init__(self, decimal_places: int = 1, latency: float = 0.0):
+        self.decimal_places = decimal_places
+        # response time of the instrument [s]
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._values: Dict[int, float] = {
+            GenericAddress.PVIN: 20.0,
+            GenericAddress.TGSP: 20.0,
+            GenericAddress.WRKOP: 0.0,
+            GenericAddress.WKGSP: 20.0,
+            GenericAddress.MVIN: 0.798,
+            GenericAddress.RmSP: 20.0,
+            GenericAddress.STAT: 0,
+            GenericAddress.LR: 0,
+            GenericAddress.AcALL: 0,
+        }
+
+    def __str__(self):
+        return 'Eurotherm register map'
+
+    def __getitem__(self, address: int) -> float:
+        with self._lock:
+            return self._values.get(address, 0)
+
+    def __setitem__(self, address: int, value: float):
+        with self._lock:
+            self._set(address, value)
+
+    # region register encoding
+
+    def _scale(self, address: int) -> int:
+        if address in UNSCALED:
+            return 0
+        # the working output is always transmitted with one decimal place
+        if address == GenericAddress.WRKOP:
+            return 1
+        return self.decimal_places
+
+    def _encode_int(self, address: int) -> int:
+        value = int(round(self._values.get(address, 0) * 10 ** self._scale(address)))
+        return struct.unpack('H', struct.pack('h', value))[0]
+
+    def _decode_int(self, address: int, register: int) -> float:
+        value = struct.unpack('h', struct.pack('H', register))[0]
+        scale = self._scale(address)
+        return value / 10**scale if scale else value
+
+    def _encode_float(self, register: int) -> int:
+        address, word = divmod(register - FLOAT_BASE, 2)
+        low, high = struct.unpack('HH', struct.pack('f', self._values.get(address, 0)))
+        return low if word else high
+
+    def _set(self, address: int, value: float):
+        self._values[address] = value
+        match address:
+            case GenericAddress.AcALL if value:
+                stat = int(self._values[GenericAddress.STAT])
+                self._values[GenericAddress.STAT] = stat & ~ALARM_BITS
+                self._values[GenericAddress.AcALL] = 0
+            case GenericAddress.LR | GenericAddress.RmSP | GenericAddress.TGSP:
+                if self._values[GenericAddress.LR]:
+                    setpoint = self._values[GenericAddress.RmSP]
+                else:
+                    setpoint = self._values[GenericAddress.TGSP]
+                self._values[GenericAddress.WKGSP] = setpoint
+
+    # endregion
+
+    # region datastore interface (pymodbus)
+
+    def reset(self):
+        pass
+
+    def validate(self, fc_as_hex: int, address: int, count: int = 1) -> bool:
+        if address >= FLOAT_BASE:
+            # floats can only be read as a whole (two registers each)
+            return (
+                fc_as_hex in READ_FUNCTION_CODES
+                and (address - FLOAT_BASE) % 2 == 0
+                and count % 2 == 0
+                and address + count <= 0x10000
+            )
+        return address + count <= FLOAT_BASE
+
+    def getValues(self, fc_as_hex: int, address: int, count: int = 1):
+        registers = range(address, address + count)
+        with self._lock:
+            if address >= FLOAT_BASE:
+                return [self._encode_float(r) for r in registers]
+            return [self._encode_int(r) for r in registers]
+
+    def setValues(self, fc_as_hex: int, address: int, values):
+        with self._lock:
+            for k, register in enumerate(values):
+                self._set(address + k, self._decode_int(address + k, register))
+
+    async def async_getValues(self, fc_as_hex: int, address: int, count: int = 1):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.getValues(fc_as_hex, address, count)
+
+    # endregion
+
+
+@dataclass
+class SlaveStatistics:
+    requests: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    # RTU frame bytes of requests and responses (as they would be on the bus)
+    bytes: int = 0
+
+
+class EurothermModbusSlave:
+    """Local Modbus RTU slave emulating one or more Eurotherm controllers.
+
+    RTU frames are served over a TCP loopback socket, so the slave is
+    reachable by `ModbusSerialConnection` through the pyserial URL
+    `url` (``socket://host:port``) instead of a serial port. The server
+    runs its own event loop in a background thread.
+
+    Faults are injected into responses either at random (`error_rate`
+    and `timeout_rate` are probabilities per request) or for the next
+    requests (`fail_next`). An error is answered with a Modbus exception,
+    a timeout is not answered at all.
+    """
+
+    def __init__(
+        self,
+        units: Iterable[int] = (1,),
+        *,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        decimal_places: int = 1,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.units = {
+            unit: EurothermRegisters(decimal_places, latency) for unit in units
+        }
+        self.host = host
+        self.port = port
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.statistics = SlaveStatistics()
+        self._random = random.Random(seed)
+        self._faults: deque[Optional[int]] = deque()
+        self._server: Optional[ModbusTcpServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f'socket://{self.host}:{self.port}'
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'EurothermModbusSlave':
+        location = urlparse(url)
+        if location.scheme != 'socket':
+            raise ValueError(f'Not a socket URL (socket://host:port): {url}')
+        return cls(host=location.hostname, port=location.port, **kwargs)
+
+    def __getitem__(self, unit: int) -> EurothermRegisters:
+        return self.units[unit]
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def fail_next(self, count: int = 1, timeout: bool = False):
+        """Let the next `count` requests fail with an error (or time out)."""
+        fault = None if timeout else ModbusExceptions.SlaveFailure
+        self._faults.extend([fault] * count)
+
+    @staticmethod
+    def _frame_size(pdu) -> int:
+        # unit address, function code, data and CRC
+        return len(pdu.encode()) + 4
+
+    def _trace(self, request, *addr):
+        self.statistics.requests += 1
+        self.statistics.bytes += self._frame_size(request)
+
+    def _manipulate(self, response):
+        if self._faults:
+            fault = self._faults.popleft()
+        elif self._random.random() < self.timeout_rate:
+            fault = None
+        elif self._random.random() < self.error_rate:
+            fault = ModbusExceptions.SlaveFailure
+        else:
+            self.statistics.bytes += self._frame_size(response)
+            return response, False
+
+        if fault is None:
+            self.statistics.timeouts += 1
+            return None, False
+        self.statistics.errors += 1
+        error = ExceptionResponse(
+            response.function_code,
+            fault,
+            slave=response.slave_id,
+            transaction=response.transaction_id,
+        )
+        self.statistics.bytes += self._frame_size(error)
+        return error, False
+
+    async def _serve(self, started: threading.Event):
+        self._loop = asyncio.get_running_loop()
+        context = ModbusServerContext(slaves=self.units, single=False)
+        self._server = ModbusTcpServer(
+            context,
+            framer=FramerType.RTU,
+            address=(self.host, self.port),
+            response_manipulator=self._manipulate,
+            request_tracer=self._trace,
+        )
+        listening = await self._server.listen()
+        if listening:
+            # resolve the port if the system picked a free one
+            self.port = self._server.transport.sockets[0].getsockname()[1]
+            logger.info(f'Modbus slave listening at {self.url}')
+        started.set()
+        if listening:
+            await self._server.serving
+
+    def start(self):
+        started = threading.Event()
+        # asyncio.run also cancels the tasks left behind by pymodbus (e.g.
+        # re-listening after a client disconnected)
+        self._thread = threading.Thread(
+            target=asyncio.run,
+            args=(self._serve(started),),
+            name='EurothermModbusSlave',
+            daemon=True,
+        )
+        self._thread.start()
+        started.wait()
+        if self._server.transport is None:
+            self._thread.join()
+            raise OSError(f'Unable to listen at {self.host}:{self.port}')
+
+    def stop(self):
+        if self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._server.shutdown(), self._loop)
+        self._thread.join()
+        self._thread = None
+        logger.info(f'Modbus slave at {self.url} stopped')
+
+
+def create_slaves(
+    devices: Iterable[DeviceConfig], **kwargs
+) -> List[EurothermModbusSlave]:
+    """Slaves for all Modbus devices whose port is a socket URL.
+
+    Devices sharing a port are served by the same slave (one unit per
+    device). Keyword arguments are passed to `EurothermModbusSlave`.
+    """
+    ports: Dict[str, List[DeviceConfig]] = {}
+    for device in devices:
+        if device.driver == 'simulate':
+            continue
+        if device.connection.port.startswith('socket://'):
+            ports.setdefault(device.connection.port, []).append(device)
+
+    slaves = []
+    for port, members in ports.items():
+        units = [device.unitAddress for device in members]
+        slave = EurothermModbusSlave.from_url(port, units=units, **kwargs)
+        for device in members:
+            slave[device.unitAddress].decimal_places = device.decimal_places
+        slaves.append(slave)
+    return slaves
@@ -0,0 +1,180 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent import futures
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from ..clock import SamplingClock
+from ..configuration import SerialPortConfig
+
+logger = logging.getLogger(__name__)
+
+TPoll = Callable[[datetime], None]
+
+
+@dataclass
+class BusStatistics:
+    requested: float  # requested sampling rate [Hz]
+    achieved: float  # achieved sampling rate [Hz]
+    missed: int  # number of skipped polling slots
+
+
+@dataclass
+class _PollJob:
+    name: str
+    poll: TPoll
+    clock: SamplingClock
+    history: Deque[float] = field(default_factory=lambda: deque(maxlen=20))
+
+    @property
+    def achieved(self):
+        if len(self.history) < 2:
+            return 0.0
+        return (len(self.history) - 1) / (self.history[-1] - self.history[0])
+
+
+class BusScheduler:
+    """Owns the polling timetable of all devices sharing one serial port.
+
+    Every slot on the bus executes either one pending write or the poll of
+    the device with the earliest deadline, so reads and writes of different
+    units never compete for the connection in random order.
+    """
+
+    __schedulers__ = {}
+
+    def __new__(cls, cfg: SerialPortConfig):
+        if cfg.port in BusScheduler.__schedulers__:
+            return BusScheduler.__schedulers__[cfg.port]
+        else:
+            instance = super().__new__(cls)
+            BusScheduler.__schedulers__[cfg.port] = instance
+            return instance
+
+    def __init__(self, cfg: SerialPortConfig):
+        if getattr(self, '_initialized', False):
+            return
+        self._initialized = True
+        self.port = cfg.port
+        self.report_interval = 60.0  # seconds
+        self._condition = threading.Condition()
+        self._jobs: Dict[str, _PollJob] = {}
+        self._writes: Deque[Tuple[futures.Future, Callable, tuple]] = deque()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, sampling_rate: float, poll: TPoll):
+        with self._condition:
+            if name in self._jobs:
+                raise ValueError(f'[{self.port}] Device {name} already registered')
+            logger.info(
+                f'[{self.port}] Scheduling device {name} at {sampling_rate:.3g} Hz'
+            )
+            self._jobs[name] = _PollJob(
+                name=name,
+                poll=poll,
+                clock=SamplingClock(1.0 / sampling_rate),
+            )
+            self._ensure_running()
+            self._condition.notify()
+
+    def unregister(self, name: str):
+        with self._condition:
+            if self._jobs.pop(name, None) is not None:
+                logger.info(f'[{self.port}] Removed device {name} from schedule')
+            self._condition.notify()
+
+    def submit(self, fn: Callable, *args) -> futures.Future:
+        """Queue a (write) operation to be executed in the next free slot."""
+        future = futures.Future()
+        with self._condition:
+            self._writes.append((future, fn, args))
+            self._ensure_running()
+            self._condition.notify()
+        return future
+
+    def statistics(self) -> Dict[str, BusStatistics]:
+        with self._condition:
+            return {
+                job.name: BusStatistics(
+                    requested=1.0 / job.clock.interval,
+                    achieved=job.achieved,
+                    missed=job.clock.missed,
+                )
+                for job in self._jobs.values()
+            }
+
+    def _ensure_running(self):
+        # must be called while holding the lock
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f'BusScheduler({self.port})', daemon=True
+            )
+            self._thread.start()
+
+    def _next_action(self):
+        # wait for the next slot; returns either a pending write or a poll job
+        with self._condition:
+            while True:
+                if self._writes:
+                    return self._writes.popleft(), None
+                if not self._jobs:
+                    self._thread = None
+                    return None, None
+                job = min(self._jobs.values(), key=lambda job: job.clock.deadline)
+                delay = job.clock.delay()
+                if delay <= 0:
+                    return None, job
+                self._condition.wait(delay)
+
+    def _run(self):
+        logger.info(f'[{self.port}] Bus scheduler started')
+        last_report = time.monotonic()
+        while True:
+            write, job = self._next_action()
+            if write is not None:
+                self._execute_write(*write)
+            elif job is not None:
+                self._execute_poll(job)
+            else:
+                break
+
+            now = time.monotonic()
+            if now - last_report >= self.report_interval:
+                self.log_statistics()
+                last_report = now
+        logger.info(f'[{self.port}] Bus scheduler stopped')
+
+    def _execute_write(self, future: futures.Future, fn: Callable, args: tuple):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except Exception as ex:
+            future.set_exception(ex)
+
+    def _execute_poll(self, job: _PollJob):
+        # a failed poll (e.g. a transient bus error) only costs its slot,
+        # the device stays scheduled
+        try:
+            job.poll(job.clock.scheduled_datetime())
+            failed = False
+        except Exception:
+            logger.exception(f'[{self.port}] Polling device {job.name} failed')
+            failed = True
+
+        with self._condition:
+            if not failed:
+                job.history.append(time.monotonic())
+            job.clock.advance()
+
+    def log_statistics(self):
+        for name, stats in self.statistics().items():
+            logger.info(
+                (
+                    f'[{self.port}] [{repr(name)}] requested={stats.requested:.3g} Hz, '
+                    f'achieved={stats.achieved:.3g} Hz, missed={stats.missed}'
+                )
+            )
@@ -0,0 +1,224 @@
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from ..pid import BatchPID
+from ..plant import ROOM_TEMPERATURE, ThermalPlant
+from ..utils import ZERO_CELSIUS, DimensionlessQ, TemperatureQ, VoltageQ
+from .controller import (
+    TYPE_K_TEMPERATURE,
+    TYPE_K_VOLTAGE,
+    EurothermController,
+    InstrumentStatus,
+    ProcessValues,
+    RemoteSetpointState,
+)
+
+# default tunings of the simulated loops (see EurothermSimulator)
+TUNINGS = (0.1, 2e-4, 0.0)
+
+
+class SimulationEngine:
+    """Simulates many controllers (see `EurothermSimulator`) at once.
+
+    The thermal plants and PID loops of all devices are kept in numpy
+    arrays and advanced together, one vectorized step per `sample_time`
+    of simulated time, whenever any of the devices is accessed. Devices
+    are served as `VirtualController`s by `controller`, which creates
+    the device on first use (the state of a device is kept as long as the
+    engine exists).
+    """
+
+    _shared: Optional['SimulationEngine'] = None
+
+    def __init__(
+        self,
+        sample_time: float = 0.25,
+        time_fn: Callable[[], float] = time.monotonic,
+    ):
+        self.sample_time = sample_time
+        self.time_fn = time_fn
+        self._lock = threading.Lock()
+        self._controllers: Dict[str, VirtualController] = {}
+        self._last_time = time_fn()
+
+        def empty():
+            return np.empty(0)
+
+        self.plant = ThermalPlant(
+            temperature=empty(),
+            room_temperature=empty(),
+            max_power=empty(),
+            heat_capacity=empty(),
+            heat_loss=empty(),
+        )
+        # temperatures in °C, outputs as fraction of the heater power, the
+        # setpoints of the loops are the working setpoints
+        self.pid = BatchPID(sample_time=None, output_limits=(0.0, 1.0), size=0)
+        # local and remote setpoints [°C] and rate limit [K/s]
+        self.setpoint = empty()
+        self.remote_setpoint = empty()
+        self.remote = np.empty(0, dtype=bool)
+        self.setpoint_rate = empty()
+        # relative heater output (0..1)
+        self.output = empty()
+
+    @classmethod
+    def shared(cls) -> 'SimulationEngine':
+        """Engine used for the simulated devices of the acquisition."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def __len__(self):
+        return len(self._controllers)
+
+    def controller(
+        self,
+        name: str,
+        plant: Optional[ThermalPlant] = None,
+        tunings=TUNINGS,
+        setpoint: float = ROOM_TEMPERATURE,
+        setpoint_rate: Optional[float] = None,
+    ) -> 'VirtualController':
+        """Controller of device `name` (parameters only apply to new devices)."""
+        with self._lock:
+            if name not in self._controllers:
+                self._advance()
+                index = len(self._controllers)
+                self._add(plant or ThermalPlant(), tunings, setpoint, setpoint_rate)
+                self._controllers[name] = VirtualController(self, index)
+            return self._controllers[name]
+
+    def _add(self, plant: ThermalPlant, tunings, setpoint, setpoint_rate):
+        # devices are rarely added, so the arrays are simply reallocated
+        append = np.append
+        p = self.plant
+        p.temperature = append(p.temperature, plant.temperature)
+        p.room_temperature = append(p.room_temperature, plant.room_temperature)
+        p.max_power = append(p.max_power, plant.max_power)
+        p.heat_capacity = append(p.heat_capacity, plant.heat_capacity)
+        p.heat_loss = append(p.heat_loss, plant.heat_loss)
+
+        loop = BatchPID(
+            *tunings, setpoint, sample_time=None, output_limits=(0.0, 1.0), size=1
+        )
+        self.pid.extend(loop)
+
+        self.setpoint = append(self.setpoint, setpoint)
+        self.remote_setpoint = append(self.remote_setpoint, setpoint)
+        self.remote = append(self.remote, False)
+        rate = np.inf if setpoint_rate is None else setpoint_rate
+        self.setpoint_rate = append(self.setpoint_rate, rate)
+        self.output = append(self.output, 0.0)
+
+    # region simulation
+
+    def _target(self) -> np.ndarray:
+        return np.where(self.remote, self.remote_setpoint, self.setpoint)
+
+    def _step(self, dt: float):
+        # working setpoints approach their targets (rate limited)
+        step = self.setpoint_rate * dt
+        delta = np.clip(self._target() - self.pid.setpoint, -step, step)
+        self.pid.setpoint = self.pid.setpoint + delta
+
+        self.output = self.pid(self.plant.temperature, dt=dt)
+        self.plant.update(self.output, dt)
+
+    def _advance(self):
+        # advance in full steps only, the remainder is kept for the next call
+        now = self.time_fn()
+        steps = int((now - self._last_time) / self.sample_time)
+        if len(self):
+            for _ in range(steps):
+                self._step(self.sample_time)
+        self._last_time += steps * self.sample_time
+
+    @contextmanager
+    def advanced(self):
+        """Holds the engine with all devices advanced to the current time."""
+        with self._lock:
+            self._advance()
+            yield self
+
+    # endregion
+
+
+class VirtualController(EurothermController):
+    """A device of a `SimulationEngine`."""
+
+    def __init__(self, engine: SimulationEngine, index: int):
+        self.engine = engine
+        self.index = index
+
+    @property
+    def process_value(self) -> TemperatureQ:
+        with self.engine.advanced() as engine:
+            return TemperatureQ(float(engine.plant.temperature[self.index]), 'degC')
+
+    @property
+    def measured_value(self) -> VoltageQ:
+        voltage = np.interp(
+            self.process_value.m_as('degC'), TYPE_K_TEMPERATURE, TYPE_K_VOLTAGE
+        )
+        return VoltageQ(voltage, 'mV')
+
+    @property
+    def setpoint(self) -> TemperatureQ:
+        return TemperatureQ(float(self.engine.setpoint[self.index]), 'degC')
+
+    @property
+    def working_setpoint(self) -> TemperatureQ:
+        with self.engine.advanced() as engine:
+            return TemperatureQ(float(engine.pid.setpoint[self.index]), 'degC')
+
+    @property
+    def working_output(self) -> DimensionlessQ:
+        with self.engine.advanced() as engine:
+            return DimensionlessQ(100.0 * float(engine.output[self.index]), '%')
+
+    @property
+    def status(self) -> InstrumentStatus:
+        with self.engine.advanced():
+            return self._status()
+
+    def _status(self) -> InstrumentStatus:
+        engine, k = self.engine, self.index
+        status = InstrumentStatus.Ok
+        if engine.remote[k]:
+            status |= InstrumentStatus.LocalRemoteSPSelect
+            target = engine.remote_setpoint[k]
+        else:
+            target = engine.setpoint[k]
+        if engine.pid.setpoint[k] != target:
+            status |= InstrumentStatus.TimerRampRunning
+        return status
+
+    def get_process_values(self) -> ProcessValues:
+        k = self.index
+        with self.engine.advanced() as engine:
+            # magnitudes in K and %, respectively (see ProcessValues)
+            return ProcessValues(
+                timestamp=datetime.now(),
+                processValue=engine.plant.temperature[k] + ZERO_CELSIUS,
+                setpoint=engine.setpoint[k] + ZERO_CELSIUS,
+                workingSetpoint=engine.pid.setpoint[k] + ZERO_CELSIUS,
+                workingOutput=100.0 * engine.output[k],
+                status=self._status(),
+            )
+
+    def toggle_remote_setpoint(self, state: RemoteSetpointState):
+        with self.engine.advanced() as engine:
+            engine.remote[self.index] = state == RemoteSetpointState.ENABLE
+
+    def write_remote_setpoint(self, value: TemperatureQ):
+        with self.engine.advanced() as engine:
+            engine.remote_setpoint[self.index] = value.m_as('degC')
+
+    def acknowledge_all_alarms(self):
+        pass
@@ -4,7 +4,8 @@ from .app_logging import (
     TimeStampedFileHandler,
     configure_app_logging,
 )
-from .file_data_logger import FileDataLogger
+from .data_logger_sink import DataLoggerSink
+from .file_data_logger import FileDataLogger, ParquetDataLogger, create_data_logger
 
 __all__ = [
     AppLoggingMode,
@@ -12,4 +13,7 @@ __all__ = [
     TimedRotatingFileHandler,
     TimeStampedFileHandler,
     FileDataLogger,
+    ParquetDataLogger,
+    create_data_logger,
+    DataLoggerSink,
 ]
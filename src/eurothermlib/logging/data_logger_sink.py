@@ -0,0 +1,151 @@
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, List, Optional
+
+import pandas as pd
+import reactivex
+from reactivex.abc import DisposableBase
+
+from ..configuration import LoggingConfig
+from .file_data_logger import FileDataLogger, create_data_logger
+
+logger = logging.getLogger(__name__)
+
+
+class DataLoggerSink:
+    """Logs the process values of an observable (in the server process).
+
+    Samples are collected into batches spanning `write_interval`. Complete
+    batches are handed to a dedicated writer thread through a bounded
+    queue, so that slow file operations never block the thread delivering
+    the samples. If the queue is full, the batch is dropped (and counted);
+    batches waiting longer than `write_interval` are counted as delayed.
+    """
+
+    def __init__(
+        self,
+        cfg: LoggingConfig,
+        data_logger: Optional[FileDataLogger] = None,
+        to_frame: Callable[[List[Any]], pd.DataFrame] = pd.DataFrame,
+    ):
+        self.cfg = cfg
+        self.data_logger = data_logger or create_data_logger(cfg)
+        self.to_frame = to_frame  # converts a batch of samples
+        self.dropped = 0  # number of dropped batches
+        self.delayed = 0  # number of batches written late
+        self._interval = cfg.write_interval.m_as('s')
+        self._lock = threading.Lock()
+        self._buffer: List[Any] = []
+        self._started = time.monotonic()  # start of current batch
+        self._queue = queue.Queue(maxsize=cfg.queue_size)
+        self._closed = threading.Event()
+        self._subscription: Optional[DisposableBase] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def attach(self, observable: reactivex.Observable):
+        """Subscribe to the observable and start the writer thread."""
+        self._subscription = observable.subscribe(
+            self.put,
+            on_completed=self.close,
+            on_error=self._errored,
+        )
+        # not a daemon: the final flush must not be cut off at exit
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__)
+        self._thread.start()
+
+    def put(self, data: Any):
+        with self._lock:
+            self._buffer.append(data)
+            if time.monotonic() - self._started >= self._interval:
+                self._seal()
+
+    def flush(self):
+        """Write all pending samples in the calling thread."""
+        with self._lock:
+            sealed, data = time.monotonic(), self._buffer
+            self._buffer, self._started = [], sealed
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self._write(*item)
+        if data:
+            self._write(sealed, data)
+
+    def read(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """Read logged process values (see `FileDataLogger.read`)."""
+        return self.data_logger.read(start, end)
+
+    def close(self, timeout: Optional[float] = 30.0):
+        """Stop the writer thread and write all buffered samples.
+
+        Waits (at most `timeout` seconds) until the samples are written, also
+        if the sink is already being closed by another thread (e.g. on
+        completion of the observable).
+        """
+        if not self._closed.is_set():
+            self._closed.set()
+            if self._subscription is not None:
+                self._subscription.dispose()
+            self._queue.put(None)  # wake up the writer
+
+        thread = self._thread
+        if thread is None or thread is threading.current_thread():
+            return
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning(f'[log] Writer did not finish within {timeout} s')
+
+    def _errored(self, ex: Exception):
+        logger.exception('[log] Error on observable.', exc_info=ex)
+        self.close()
+
+    def _seal(self):
+        # hand the current batch over to the writer (must hold the lock)
+        now = time.monotonic()
+        data, self._buffer, self._started = self._buffer, [], now
+        if not data:
+            return
+        try:
+            self._queue.put_nowait((now, data))
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(
+                f'[log] Writer queue full: dropped {len(data)} samples '
+                f'({self.dropped} batches in total)'
+            )
+
+    def _run(self):
+        while not self._closed.is_set():
+            try:
+                item = self._queue.get(timeout=self._interval)
+            except queue.Empty:
+                # no new batch for a while: seal what has been buffered
+                with self._lock:
+                    if time.monotonic() - self._started >= self._interval:
+                        self._seal()
+                continue
+            if item is not None:
+                self._write(*item)
+
+        self.flush()
+        self.data_logger.close()
+        logger.info(
+            f'[log] Data logger stopped (dropped={self.dropped}, '
+            f'delayed={self.delayed} batches)'
+        )
+
+    def _write(self, sealed: float, data: List[Any]):
+        if time.monotonic() - sealed > self._interval:
+            self.delayed += 1
+        try:
+            self.data_logger.log_data(self.to_frame(data))
+        except Exception:
+            logger.exception('[log] Writing process values failed')
@@ -1,8 +1,10 @@
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterable, List, Mapping, Optional
+from typing import IO, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 import pint
 
@@ -12,47 +14,129 @@ logger = logging.getLogger(__name__)
 
 
 class FileDataLogger:
+    suffix: Optional[str] = None  # file suffix enforced by the backend
+
     def __init__(self, cfg: LoggingConfig):
         self.cfg = cfg
         self.last_rotation: datetime = datetime.now()
         self.current_file: Optional[Path] = None
+        # files written by this logger and the time they were created
+        self.files: List[Tuple[datetime, Path]] = []
+        # handle of the current file (kept open until the next rotation)
+        self._file: Optional[IO] = None
 
     def log_data(self, data: pd.DataFrame):
         self._ensure_file()
         lines = self._build_lines(data)
         self._write(lines)
 
-    def _build_lines(self, data: pd.DataFrame):
-        # select columns
-        df = data[self.cfg.columns]
+    def close(self):
+        self._close_file()
+        self.current_file = None
+
+    def read(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """Read the process values logged by this logger in [start, end].
+
+        Files rotated before `start` are skipped (their samples were all
+        recorded before the next file was created).
+        Quantity columns hold magnitudes in the configured units (see
+        ``frame.attrs['units']``).
+        """
+        frames = []
+        for index, (_, path) in enumerate(self.files):
+            if start is not None and index + 1 < len(self.files):
+                if self.files[index + 1][0] < start:
+                    continue
+            try:
+                frame = self._read_file(path)
+            except Exception:
+                logger.exception(f'[log] Reading data log file {path} failed')
+                continue
+            if frame is None or frame.empty:
+                continue
+
+            timestamps = pd.to_datetime(frame['timestamp'], errors='coerce')
+            mask = timestamps.notna()
+            if start is not None:
+                mask &= timestamps >= start
+            if end is not None:
+                mask &= timestamps <= end
+            frames.append(frame.assign(timestamp=timestamps)[mask])
 
-        # iterate over rows
-        for row in df.itertuples():
-            yield self._format_line(row._asdict())
+        if frames:
+            data = pd.concat(frames, ignore_index=True)
+        else:
+            data = pd.DataFrame(columns=self.cfg.columns)
+        data.attrs['units'] = dict(self.cfg.units)
+        return data
+
+    def _read_file(self, path: Path) -> Optional[pd.DataFrame]:
+        # incomplete (last) lines of the current file are skipped
+        return pd.read_csv(path, sep=self.cfg.separator, on_bad_lines='skip')
 
-    def _format_line(self, values: Mapping[str, Any]):
-        values = [self._format_value(key, values[key]) for key in self.cfg.columns]
-        return self._join_columns(values)
+    def _build_lines(self, data: pd.DataFrame) -> List[str]:
+        if data.empty:
+            return []
 
-    def _format_value(self, key: str, value):
+        # convert each column once per batch (instead of once per value)
+        formats, columns = zip(
+            *(self._convert_column(data, key) for key in self.cfg.columns)
+        )
+        line_format = self._join_columns(formats)
+        return [line_format % row for row in zip(*columns)]
+
+    def _convert_column(self, data: pd.DataFrame, key: str):
+        # returns the %-format and the (converted) values of a column
         if key in self.cfg.units:
-            units = self.cfg.units[key]
-            value = value.m_as(units)
+            return self.cfg.format, self._column_magnitudes(data, key)
 
-        if isinstance(value, str):
-            return value
-        elif isinstance(value, datetime):
-            return value.isoformat()
+        values = data[key].tolist()
+        first = values[0]
+        if isinstance(first, str):
+            return '%s', values
+        elif isinstance(first, datetime):
+            return '%s', [value.isoformat() for value in values]
         else:
-            return self.cfg.format % value
+            return self.cfg.format, values
+
+    def _column_magnitudes(self, data: pd.DataFrame, key: str) -> np.ndarray:
+        # magnitudes of a column in the configured units; columns may either
+        # hold quantities or plain magnitudes (with units in `data.attrs`)
+        units = self.cfg.units[key]
+        source = data.attrs.get('units', {}).get(key)
+        if source is None:
+            return self._magnitudes(data[key].tolist(), units)
+        magnitudes = data[key].to_numpy(dtype=float)
+        if source == units:
+            return magnitudes
+        return pint.Quantity(magnitudes, source).m_as(units)
+
+    @staticmethod
+    def _magnitudes(values: Sequence[pint.Quantity], units: str) -> np.ndarray:
+        # quantities of a column typically share their units, so that
+        # the magnitudes can be converted in a single vectorized operation
+        source = {value.units for value in values}
+        if len(source) == 1:
+            magnitudes = np.fromiter((value.m for value in values), dtype=float)
+            return pint.Quantity(magnitudes, source.pop()).m_as(units)
+        return np.array([value.m_as(units) for value in values], dtype=float)
 
     def _join_columns(self, values: List[str]):
         return self.cfg.separator.join(values)
 
     def _write(self, lines: Iterable[str]):
-        with open(self.current_file, mode='a', encoding='utf-8') as file:
-            for line in lines:
-                file.write(f'{line}\n')
+        self._file.write(''.join(f'{line}\n' for line in lines))
+        self._sync()
+
+    def _sync(self):
+        match self.cfg.flush:
+            case 'flush':
+                self._file.flush()
+            case 'fsync':
+                self._file.flush()
+                os.fsync(self._file.fileno())
 
     def _ensure_file(self):
         # current time
@@ -67,7 +151,7 @@ class FileDataLogger:
             logger.info(f'[log] {time:.4~P} elapsed since last file rotation')
             # we need to create a new file
             self.last_rotation = now
-            self.current_file = None
+            self.close()
 
         if self.current_file is None:
             # create directory, if necessary
@@ -78,8 +162,101 @@ class FileDataLogger:
             # build file path
             filename = self.cfg.filename.format(now)
             self.current_file = path / filename
+            if self.suffix is not None:
+                self.current_file = self.current_file.with_suffix(self.suffix)
             logger.info(f'[log] New data log file: {self.current_file}')
+            self.files.append((now, self.current_file))
+            self._open_file()
+
+    def _open_file(self):
+        self._file = open(self.current_file, mode='a', encoding='utf-8')
+
+        # log header
+        header = self._join_columns(self.cfg.columns)
+        self._write([header])
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ParquetDataLogger(FileDataLogger):
+    """Writes process values as typed columns to Parquet files.
+
+    Every call of `log_data` appends a row group to the current file. Quantity
+    columns are stored in the configured units (see field metadata). A file
+    is only complete (readable) after it has been closed, i.e. on rotation
+    or when the logger is closed.
+    """
+
+    suffix = '.parquet'
+
+    def __init__(self, cfg: LoggingConfig):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as ex:
+            raise ValueError(
+                'The parquet logging backend requires pyarrow '
+                '(install the extra: eurothermlib[parquet])'
+            ) from ex
+
+        super().__init__(cfg)
+        self._pa = pyarrow
+        self._writer: Optional[pyarrow.parquet.ParquetWriter] = None
+
+    def log_data(self, data: pd.DataFrame):
+        if data.empty:
+            return
+        self._ensure_file()
+        table = self._build_table(data)
+        if self._writer is None:
+            self._writer = self._pa.parquet.ParquetWriter(self._file, table.schema)
+        else:
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table)
+        self._sync()
+
+    def _build_table(self, data: pd.DataFrame):
+        pa = self._pa
+        columns, fields = [], []
+        for key in self.cfg.columns:
+            values = data[key].tolist()
+            if key in self.cfg.units:
+                array = pa.array(self._column_magnitudes(data, key))
+                metadata = {'units': self.cfg.units[key]}
+            elif isinstance(values[0], int) and not isinstance(values[0], bool):
+                # e.g. instrument status flags
+                array = pa.array(np.asarray(values, dtype=np.int64))
+                metadata = None
+            else:
+                array = pa.array(values)
+                metadata = None
+            columns.append(array)
+            fields.append(pa.field(key, array.type, metadata=metadata))
+        return pa.Table.from_arrays(columns, schema=pa.schema(fields))
+
+    def _read_file(self, path: Path) -> Optional[pd.DataFrame]:
+        if path == self.current_file:
+            return None  # not readable before it is closed
+        return self._pa.parquet.read_table(path).to_pandas()
+
+    def _open_file(self):
+        # the writer is created with the schema of the first batch
+        self._file = open(self.current_file, mode='wb')
+        self._writer = None
+
+    def _close_file(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        super()._close_file()
+
 
-            # log header
-            header = self._join_columns(self.cfg.columns)
-            self._write([header])
+def create_data_logger(cfg: LoggingConfig) -> FileDataLogger:
+    match cfg.backend:
+        case 'parquet':
+            return ParquetDataLogger(cfg)
+        case _:
+            return FileDataLogger(cfg)
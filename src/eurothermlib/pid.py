@@ -20,6 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import numpy as np
+
 
 def _clamp(value, limits):
     lower, upper = limits
@@ -315,3 +317,329 @@ class PID(object):
         self._last_time = self.time_fn()
         self._last_output = None
         self._last_input = None
+
+
+def _select(condition, if_true, if_false):
+    # np.where(condition, if_true(), if_false()), evaluating only the branches
+    # needed (typically, the mode is the same for all loops)
+    if condition.all():
+        return if_true()
+    elif not condition.any():
+        return if_false()
+    return np.where(condition, if_true(), if_false())
+
+
+class BatchPID(object):
+    """Many PID controllers (loops) updated in one vectorized call.
+
+    The loops behave like `PID` controllers with the same parameters,
+    which may be given per loop (arrays of length `size`) or for all loops
+    (scalars). Loops share the time base: `sample_time`, `time_fn`,
+    `error_map` and the time step of each call. Outputs that have not
+    been computed yet are NaN (where `PID` returns None).
+    """
+
+    def __init__(
+        self,
+        Kp=1.0,
+        Ki=0.0,
+        Kd=0.0,
+        setpoint=0,
+        sample_time=0.01,
+        output_limits=(None, None),
+        auto_mode=True,
+        proportional_on_measurement=False,
+        differential_on_measurement=True,
+        error_map=None,
+        time_fn=None,
+        starting_output=0.0,
+        size=None,
+    ):
+        """
+        Initialize N PID controllers (see :meth:`PID.__init__`).
+
+        :param size: The number of loops, or None to take it from the
+            lengths of the parameters given as arrays.
+        """
+        shapes = [
+            np.shape(value)
+            for value in (
+                Kp,
+                Ki,
+                Kd,
+                setpoint,
+                auto_mode,
+                proportional_on_measurement,
+                differential_on_measurement,
+                starting_output,
+                *(output_limits or ()),
+            )
+            if value is not None
+        ]
+        if size is not None:
+            shapes.append((size,))
+        self._shape = np.broadcast_shapes((1,), *shapes)
+        if len(self._shape) != 1:
+            raise ValueError('parameters must be scalars or one-dimensional')
+
+        self.tunings = Kp, Ki, Kd
+        self.setpoint = self._per_loop(setpoint)
+        self.sample_time = sample_time
+
+        self._min_output = self._per_loop(-np.inf)
+        self._max_output = self._per_loop(np.inf)
+        self._auto_mode = self._per_loop(auto_mode, bool)
+        self.proportional_on_measurement = self._per_loop(
+            proportional_on_measurement, bool
+        )
+        self.differential_on_measurement = self._per_loop(
+            differential_on_measurement, bool
+        )
+        self.error_map = error_map
+
+        if time_fn is not None:
+            self.time_fn = time_fn
+        else:
+            import time
+
+            self.time_fn = time.monotonic
+
+        self._proportional = self._per_loop(0.0)
+        self._integral = self._per_loop(0.0)
+        self._derivative = self._per_loop(0.0)
+
+        self._last_output = self._per_loop(np.nan)
+        self._last_error = self._per_loop(np.nan)
+        self._last_input = self._per_loop(np.nan)
+
+        self.output_limits = output_limits
+        self.reset()
+
+        # Set initial state of the controllers
+        self._integral = self._clamp(self._per_loop(starting_output))
+
+    def _per_loop(self, value, dtype=float):
+        return np.array(np.broadcast_to(value, self._shape), dtype=dtype)
+
+    def _clamp(self, value):
+        # faster than np.clip for small arrays, NaN is kept
+        return np.minimum(np.maximum(value, self._min_output), self._max_output)
+
+    def __len__(self):
+        return self._shape[0]
+
+    def __call__(self, input_, dt=None):
+        """
+        Update the PID controllers with the inputs *input_* (one per loop).
+
+        Returns the outputs of all loops (see :meth:`PID.__call__`). Loops in
+        manual mode keep their last output. If less than sample_time seconds
+        have passed since the last update, only loops without an output yet
+        are updated.
+        """
+        now = self.time_fn()
+        if dt is None:
+            dt = now - self._last_time if (now - self._last_time) else 1e-16
+        elif dt <= 0:
+            raise ValueError('dt has negative value {}, must be positive'.format(dt))
+
+        due = self.sample_time is None or dt >= self.sample_time
+        active = (
+            self._auto_mode if due else self._auto_mode & np.isnan(self._last_output)
+        )
+        if not active.any():
+            return self._last_output.copy()
+
+        input_ = np.array(input_, dtype=float)
+        if input_.shape != self._shape:
+            input_ = self._per_loop(input_)
+
+        # Compute error terms (no change for the first update of a loop)
+        error = self.setpoint - input_
+        last_input, last_error = self._last_input, self._last_error
+        if (fresh := np.isnan(last_input)).any():
+            last_input = np.where(fresh, input_, last_input)
+        if (fresh := np.isnan(last_error)).any():
+            last_error = np.where(fresh, error, last_error)
+        d_input = input_ - last_input
+        d_error = error - last_error
+
+        # Check if must map the error
+        if self.error_map is not None:
+            error = self.error_map(error)
+
+        # Compute the proportional term
+        proportional = _select(
+            self.proportional_on_measurement,
+            lambda: self._proportional - self.Kp * d_input,
+            lambda: self.Kp * error,
+        )
+
+        # Compute integral (avoiding windup) and derivative terms
+        integral = self._clamp(self._integral + self.Ki * error * dt)
+        derivative = _select(
+            self.differential_on_measurement,
+            lambda: -self.Kd * d_input / dt,
+            lambda: self.Kd * d_error / dt,
+        )
+
+        # Compute final output
+        output = self._clamp(proportional + integral + derivative)
+
+        # Keep track of the state of the updated loops
+        if not active.all():
+
+            def keep(new, old):
+                return np.where(active, new, old)
+
+            proportional = keep(proportional, self._proportional)
+            integral = keep(integral, self._integral)
+            derivative = keep(derivative, self._derivative)
+            output = keep(output, self._last_output)
+            input_ = keep(input_, self._last_input)
+            error = keep(error, self._last_error)
+
+        self._proportional = proportional
+        self._integral = integral
+        self._derivative = derivative
+        self._last_output = output
+        self._last_input = input_
+        self._last_error = error
+        if due or active.all():
+            self._last_time = now
+
+        return output.copy()
+
+    def __repr__(self):
+        return (
+            '{self.__class__.__name__}('
+            'Kp={self.Kp!r}, Ki={self.Ki!r}, Kd={self.Kd!r}, '
+            'setpoint={self.setpoint!r}, sample_time={self.sample_time!r}, '
+            'output_limits={self.output_limits!r}, auto_mode={self.auto_mode!r}, '
+            'proportional_on_measurement={self.proportional_on_measurement!r}, '
+            'differential_on_measurement={self.differential_on_measurement!r}, '
+            'error_map={self.error_map!r}'
+            ')'
+        ).format(self=self)
+
+    @property
+    def components(self):
+        """The P-, I- and D-terms of all loops from the last computation."""
+        return self._proportional, self._integral, self._derivative
+
+    @property
+    def tunings(self):
+        """The tunings used by the controllers as a tuple: (Kp, Ki, Kd)."""
+        return self.Kp, self.Ki, self.Kd
+
+    @tunings.setter
+    def tunings(self, tunings):
+        """Set the PID tunings (of all loops or per loop)."""
+        self.Kp, self.Ki, self.Kd = (self._per_loop(value) for value in tunings)
+
+    @property
+    def auto_mode(self):
+        """Whether the loops are currently enabled (in auto mode) or not."""
+        return self._auto_mode.copy()
+
+    @auto_mode.setter
+    def auto_mode(self, enabled):
+        """Enable or disable the loops."""
+        self.set_auto_mode(enabled)
+
+    def set_auto_mode(self, enabled, last_output=None):
+        """
+        Enable or disable loops, optionally setting their last output values.
+
+        Loops switching from manual to auto mode are reset and start with
+        *last_output* as their I-term (see :meth:`PID.set_auto_mode`). The
+        shared time base is not reset.
+        """
+        enabled = self._per_loop(enabled, bool)
+        switched = enabled & ~self._auto_mode
+        if switched.any():
+            start = self._per_loop(0 if last_output is None else last_output)
+
+            def reset(value, current):
+                return np.where(switched, value, current)
+
+            self._proportional = reset(0.0, self._proportional)
+            self._integral = reset(self._clamp(start), self._integral)
+            self._derivative = reset(0.0, self._derivative)
+            self._last_output = reset(np.nan, self._last_output)
+            self._last_input = reset(np.nan, self._last_input)
+
+        self._auto_mode = enabled
+
+    @property
+    def output_limits(self):
+        """
+        The current output limits as a 2-tuple of arrays: (lower, upper).
+
+        Missing limits are given as -inf and inf, respectively.
+        """
+        return self._min_output, self._max_output
+
+    @output_limits.setter
+    def output_limits(self, limits):
+        """Set the output limits (of all loops or per loop)."""
+        lower, upper = (None, None) if limits is None else limits
+        lower = self._per_loop(-np.inf if lower is None else lower)
+        upper = self._per_loop(np.inf if upper is None else upper)
+
+        if np.any(upper < lower):
+            raise ValueError('lower limit must be less than upper limit')
+
+        self._min_output, self._max_output = lower, upper
+
+        self._integral = self._clamp(self._integral)
+        self._last_output = self._clamp(self._last_output)
+
+    def reset(self):
+        """
+        Reset the internals of all loops (see :meth:`PID.reset`).
+        """
+        self._proportional = self._per_loop(0.0)
+        self._integral = self._clamp(self._per_loop(0.0))
+        self._derivative = self._per_loop(0.0)
+
+        self._last_time = self.time_fn()
+        self._last_output = self._per_loop(np.nan)
+        self._last_input = self._per_loop(np.nan)
+
+    def extend(self, other: 'BatchPID'):
+        """
+        Append the loops of *other* (with their current state).
+
+        The time base (sample_time, time_fn, error_map) of *other* is ignored.
+        """
+        names = [
+            'Kp',
+            'Ki',
+            'Kd',
+            'setpoint',
+            'proportional_on_measurement',
+            'differential_on_measurement',
+            '_auto_mode',
+            '_min_output',
+            '_max_output',
+            '_proportional',
+            '_integral',
+            '_derivative',
+            '_last_output',
+            '_last_input',
+            '_last_error',
+        ]
+        size = len(other)
+        values = {
+            name: np.concatenate(
+                [
+                    np.broadcast_to(getattr(self, name), self._shape),
+                    np.broadcast_to(getattr(other, name), (size,)),
+                ]
+            )
+            for name in names
+        }
+        self._shape = (len(self) + size,)
+        for name, value in values.items():
+            setattr(self, name, value)
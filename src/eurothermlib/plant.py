@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+ROOM_TEMPERATURE = 20.0  # [°C]
+
+
+@dataclass
+class ThermalPlant:
+    """First-order thermal model of a heated sample (furnace zone).
+
+    A heater of `max_power` heats a body of `heat_capacity` which loses
+    heat to the environment proportionally to its excess temperature
+    (`heat_loss`). The default parameters describe a 200x50x50 mm³ block
+    (3.756 J/cm³/K) heated by 600 W, losing all of it 480 K above room
+    temperature. Values are plain floats in SI units (temperatures in °C)
+    to keep the update cheap, or numpy arrays to model many plants at once.
+    """
+
+    temperature: float = ROOM_TEMPERATURE  # [°C]
+    room_temperature: float = ROOM_TEMPERATURE  # [°C]
+    max_power: float = 600.0  # [W]
+    heat_capacity: float = 3.756 * 200 * 50 * 50 / 1000  # [J/K]
+    heat_loss: float = 600.0 / 480.0  # [W/K]
+
+    @property
+    def time_constant(self) -> float:
+        """Time constant of the plant [s]."""
+        return self.heat_capacity / self.heat_loss
+
+    def steady_state(self, output):
+        """Final temperature for a constant relative heater `output` (0..1)."""
+        return self.room_temperature + output * self.max_power / self.heat_loss
+
+    def update(self, output, dt: float):
+        """Advance by `dt` seconds with constant heater `output` (0..1).
+
+        The exact solution for a constant output is used, so the update is
+        stable for any time step.
+        """
+        final = self.steady_state(output)
+        decay = np.exp(-dt / self.time_constant)
+        self.temperature = final + (self.temperature - final) * decay
+        return self.temperature
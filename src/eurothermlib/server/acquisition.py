@@ -1,26 +1,46 @@
+import dataclasses
 import logging
+import queue
 import threading
 import time
 from abc import ABCMeta
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import IntFlag, auto
-from typing import Callable, Dict, List, Optional
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import numpy as np
+import pandas as pd
 import reactivex
 import reactivex.operators as op
-from google.protobuf.timestamp_pb2 import Timestamp
 from reactivex.scheduler import ThreadPoolScheduler
 
 from .. import controllers
+from ..clock import SamplingClock
 from ..configuration import DeviceConfig
 from ..controllers.controller import (
     InstrumentStatus,
     ProcessValues,
     RemoteSetpointState,
 )
-from ..utils import DimensionlessQ, TemperatureQ, TemperatureRateQ, TimeQ
+from ..utils import (
+    DimensionlessQ,
+    LazyQuantity,
+    TemperatureQ,
+    TemperatureRateQ,
+    TimeQ,
+)
+from .history import HISTORY_DTYPE, SampleHistory
 from .proto import service_pb2
 
 
@@ -31,48 +51,254 @@ class TemperatureRampState(IntFlag):
     Finished = auto()
 
 
+# fields of process values (besides deviceName and timestamp) and their
+# conversion to the protocol buffer representation (temperatures in K and
+# the working output in %, i.e. the units in which TData stores them)
+GRPC_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    'processValue': LazyQuantity.magnitude_getter('processValue'),
+    'setpoint': LazyQuantity.magnitude_getter('setpoint'),
+    'workingSetpoint': LazyQuantity.magnitude_getter('workingSetpoint'),
+    'remoteSetpoint': LazyQuantity.magnitude_getter('remoteSetpoint'),
+    'workingOutput': LazyQuantity.magnitude_getter('workingOutput'),
+    'status': lambda data: int(data.status),
+    'rampStatus': lambda data: int(data.rampStatus),
+    'scheduledTimestamp': None,  # message field (set via FromDatetime)
+}
+
+# magnitudes of the quantities of ProcessValues (in the units of TData)
+PROCESS_VALUE_MAGNITUDES = LazyQuantity.magnitude_getter(
+    'processValue', 'setpoint', 'workingSetpoint', 'workingOutput'
+)
+
+# reference for (naive) timestamps in batches of process values
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_microseconds(timestamp: Optional[datetime]) -> int:
+    if timestamp is None:
+        return 0
+    return (timestamp - EPOCH) // timedelta(microseconds=1)
+
+
+def from_microseconds(value: int) -> Optional[datetime]:
+    if value == 0:
+        return None
+    return EPOCH + timedelta(microseconds=value)
+
+
 @dataclass
 class TData:
+    # quantities are stored as plain magnitudes and only created on access
     deviceName: str
     timestamp: datetime
-    processValue: TemperatureQ
-    setpoint: TemperatureQ
-    workingSetpoint: TemperatureQ
-    remoteSetpoint: TemperatureQ
-    workingOutput: DimensionlessQ
+    processValue: TemperatureQ = LazyQuantity(TemperatureQ, 'K')
+    setpoint: TemperatureQ = LazyQuantity(TemperatureQ, 'K')
+    workingSetpoint: TemperatureQ = LazyQuantity(TemperatureQ, 'K')
+    remoteSetpoint: TemperatureQ = LazyQuantity(TemperatureQ, 'K')
+    workingOutput: DimensionlessQ = LazyQuantity(DimensionlessQ, '%')
     status: controllers.InstrumentStatus
     rampStatus: TemperatureRampState
+    scheduledTimestamp: Optional[datetime] = None
+    sequence: int = 0  # sample number (per device, assigned on emission)
 
-    def to_grpc_response(self):
-        timestamp = Timestamp()
-        timestamp.FromDatetime(self.timestamp)
+    def to_grpc_response(self, fields: Optional[Collection[str]] = None):
+        """Convert to a protocol buffer message.
+
+        If `fields` is given, only these fields are set (besides `deviceName`,
+        `timestamp` and `sequence`); all other fields keep their default values.
+        """
         response = service_pb2.ProcessValues(
-            deviceName=self.deviceName,
-            timestamp=timestamp,
-            processValue=self.processValue.m_as('K'),
-            setpoint=self.setpoint.m_as('K'),
-            workingSetpoint=self.workingSetpoint.m_as('K'),
-            remoteSetpoint=self.remoteSetpoint.m_as('K'),
-            workingOutput=self.workingOutput.m_as('%'),
-            status=int(self.status),
-            rampStatus=int(self.rampStatus),
+            deviceName=self.deviceName, sequence=self.sequence
         )
+        response.timestamp.FromDatetime(self.timestamp)
+        for field in GRPC_FIELDS if fields is None else fields:
+            if field == 'scheduledTimestamp':
+                if self.scheduledTimestamp is not None:
+                    response.scheduledTimestamp.FromDatetime(self.scheduledTimestamp)
+            else:
+                setattr(response, field, GRPC_FIELDS[field](self))
         return response
 
+    @staticmethod
+    def from_process_values(
+        device: str,
+        values: ProcessValues,
+        remote_setpoint: TemperatureQ,
+        ramp_status: TemperatureRampState,
+        scheduled: Optional[datetime] = None,
+    ):
+        # copy magnitudes (instead of quantities) from the controller
+        processValue, setpoint, workingSetpoint, workingOutput = (
+            PROCESS_VALUE_MAGNITUDES(values)
+        )
+        return TData(
+            deviceName=device,
+            timestamp=values.timestamp,
+            processValue=processValue,
+            setpoint=setpoint,
+            workingSetpoint=workingSetpoint,
+            remoteSetpoint=remote_setpoint,
+            workingOutput=workingOutput,
+            status=values.status,
+            rampStatus=ramp_status,
+            scheduledTimestamp=scheduled,
+        )
+
     @staticmethod
     def from_grpc_response(response: service_pb2.ProcessValues):
         return TData(
             deviceName=response.deviceName,
             timestamp=response.timestamp.ToDatetime(),
-            processValue=TemperatureQ(response.processValue, 'K'),  # type: ignore
-            setpoint=TemperatureQ(response.setpoint, 'K'),  # type: ignore
-            workingSetpoint=TemperatureQ(response.workingSetpoint, 'K'),  # type: ignore
-            remoteSetpoint=TemperatureQ(response.remoteSetpoint, 'K'),  # type: ignore
-            workingOutput=DimensionlessQ(response.workingOutput, '%'),  # type: ignore
+            processValue=response.processValue,
+            setpoint=response.setpoint,
+            workingSetpoint=response.workingSetpoint,
+            remoteSetpoint=response.remoteSetpoint,
+            workingOutput=response.workingOutput,
             status=controllers.InstrumentStatus(response.status),
             rampStatus=TemperatureRampState(response.rampStatus),
+            scheduledTimestamp=(
+                response.scheduledTimestamp.ToDatetime()
+                if response.HasField('scheduledTimestamp')
+                else None
+            ),
+            sequence=response.sequence,
         )
 
+    @staticmethod
+    def to_grpc_batch(
+        batch: Sequence['TData'], fields: Optional[Collection[str]] = None
+    ):
+        """Pack a sequence of samples into one message with an array per field."""
+        response = service_pb2.ProcessValuesBatch()
+        devices: Dict[str, int] = {}
+        for data in batch:
+            devices.setdefault(data.deviceName, len(devices))
+        response.devices.extend(devices)
+        response.deviceIndex.extend(devices[data.deviceName] for data in batch)
+        response.timestamp.extend(to_microseconds(data.timestamp) for data in batch)
+        response.sequence.extend(data.sequence for data in batch)
+        for field in GRPC_FIELDS if fields is None else fields:
+            if field == 'scheduledTimestamp':
+                values = (to_microseconds(data.scheduledTimestamp) for data in batch)
+            else:
+                values = map(GRPC_FIELDS[field], batch)
+            getattr(response, field).extend(values)
+        return response
+
+    @staticmethod
+    def from_grpc_batch(response: service_pb2.ProcessValuesBatch) -> List['TData']:
+        n = len(response.timestamp)
+
+        def column(name: str):
+            # fields excluded by a field mask are empty
+            values = getattr(response, name)
+            return values if len(values) == n else [0] * n
+
+        return [
+            TData(
+                deviceName=response.devices[index],
+                timestamp=from_microseconds(timestamp),
+                processValue=processValue,
+                setpoint=setpoint,
+                workingSetpoint=workingSetpoint,
+                remoteSetpoint=remoteSetpoint,
+                workingOutput=workingOutput,
+                status=controllers.InstrumentStatus(status),
+                rampStatus=TemperatureRampState(rampStatus),
+                scheduledTimestamp=from_microseconds(scheduled),
+                sequence=sequence,
+            )
+            for (
+                index,
+                timestamp,
+                processValue,
+                setpoint,
+                workingSetpoint,
+                remoteSetpoint,
+                workingOutput,
+                status,
+                rampStatus,
+                scheduled,
+                sequence,
+            ) in zip(
+                response.deviceIndex,
+                response.timestamp,
+                column('processValue'),
+                column('setpoint'),
+                column('workingSetpoint'),
+                column('remoteSetpoint'),
+                column('workingOutput'),
+                column('status'),
+                column('rampStatus'),
+                column('scheduledTimestamp'),
+                column('sequence'),
+            )
+        ]
+
+    @staticmethod
+    def from_history(device: str, records: np.ndarray) -> List['TData']:
+        """Convert history records (see `SampleHistory`) of a device."""
+        return [
+            TData(
+                deviceName=device,
+                timestamp=timestamp,
+                processValue=processValue,
+                setpoint=setpoint,
+                workingSetpoint=workingSetpoint,
+                remoteSetpoint=remoteSetpoint,
+                workingOutput=workingOutput,
+                status=controllers.InstrumentStatus(status),
+                rampStatus=TemperatureRampState(rampStatus),
+                scheduledTimestamp=scheduled,
+                sequence=sequence,
+            )
+            for (
+                timestamp,
+                processValue,
+                setpoint,
+                workingSetpoint,
+                remoteSetpoint,
+                workingOutput,
+                status,
+                rampStatus,
+                scheduled,
+                sequence,
+            ) in zip(
+                # datetime64[us] values are converted to datetime (NaT to None)
+                records['timestamp'].tolist(),
+                records['processValue'].tolist(),
+                records['setpoint'].tolist(),
+                records['workingSetpoint'].tolist(),
+                records['remoteSetpoint'].tolist(),
+                records['workingOutput'].tolist(),
+                records['status'].tolist(),
+                records['rampStatus'].tolist(),
+                records['scheduledTimestamp'].tolist(),
+                records['sequence'].tolist(),
+            )
+        ]
+
+    @classmethod
+    def to_frame(cls, batch: Sequence['TData']) -> pd.DataFrame:
+        """Convert samples to a data frame (without creating quantities).
+
+        Quantity columns hold plain magnitudes; their units are given by
+        ``frame.attrs['units']``.
+        """
+        columns: Dict[str, Any] = {}
+        units: Dict[str, str] = {}
+        for field in dataclasses.fields(cls):
+            descriptor = vars(cls).get(field.name)
+            if isinstance(descriptor, LazyQuantity):
+                units[field.name] = descriptor.units
+                getter = LazyQuantity.magnitude_getter(field.name)
+            else:
+                getter = attrgetter(field.name)
+            columns[field.name] = [getter(data) for data in batch]
+        frame = pd.DataFrame(columns)
+        frame.attrs['units'] = units
+        return frame
+
 
 logger = logging.getLogger(__name__)
 TEmitter = Callable[[TData], None]
@@ -88,13 +314,37 @@ class SingletonMeta(ABCMeta):
 
 
 class EurothermIO(metaclass=SingletonMeta):
+    """Acquisition engine running a thread for each device.
+
+    Device threads hand their samples to a dispatcher thread through an
+    unbounded queue, which never blocks. Only the dispatcher delivers
+    samples to the subscribers (in the order of emission), so that neither
+    slow subscribers nor control calls holding the lock (e.g. `start` or
+    `stop`) delay the acquisition.
+    """
+
     def __init__(self, cfg: List[DeviceConfig]) -> None:
         super().__init__()
         self.cfg = cfg
         self._lock = threading.RLock()
+        self._history_lock = threading.Lock()
         self._threads: Dict[str, IOThread] = {}
         self._observable: Optional[reactivex.Subject[TData]] = None
         self._pool = ThreadPoolScheduler()
+        # latest sample of each device and its time of arrival (monotonic)
+        self._latest: Dict[str, Tuple[float, TData]] = {}
+        # recent samples of each device
+        self._history: Dict[str, SampleHistory] = {}
+        # number of the last sample of each device (kept across restarts)
+        self._sequence: Dict[str, int] = {}
+        # samples (and completion requests) waiting for the dispatcher
+        self._outbox: queue.SimpleQueue = queue.SimpleQueue()
+        self._dispatcher = threading.Thread(
+            target=self._dispatch,
+            name=f'{self.__class__.__name__}.dispatch',
+            daemon=True,
+        )
+        self._dispatcher.start()
 
     def _iter_threads(self):
         for thread in self._threads.values():
@@ -124,9 +374,34 @@ class EurothermIO(metaclass=SingletonMeta):
                 return self._observable
 
     def _emit(self, data: TData):
-        observable = self._try_get_observable()
-        if observable:
-            observable.on_next(data)
+        # samples of one device are emitted by a single thread (or task)
+        data.sequence = self._sequence[data.deviceName] = (
+            self._sequence.get(data.deviceName, 0) + 1
+        )
+        self._latest[data.deviceName] = (time.monotonic(), data)
+        self._get_history(data.deviceName).append(data)
+        self._outbox.put(data)
+
+    def _dispatch(self):
+        while True:
+            item = self._outbox.get()
+            if isinstance(item, threading.Event):
+                # completion request: complete the current subscribers
+                with self._lock:
+                    observable, self._observable = self._observable, None
+                if observable is not None:
+                    observable.on_completed()
+                item.set()
+                continue
+
+            # without subscribers, no observable has been created yet
+            observable = self._observable
+            if observable is None:
+                continue
+            try:
+                observable.on_next(item)
+            except Exception:
+                logger.exception('Delivering process values failed')
 
     @property
     def observable(self):
@@ -136,6 +411,66 @@ class EurothermIO(metaclass=SingletonMeta):
         else:
             raise ValueError('Could not obtain observable')
 
+    @property
+    def dispatched(self):
+        """Observable emitting on the dispatcher thread.
+
+        Observers are called by the dispatcher itself and must not block
+        (e.g. only hand the samples over to another thread or event loop).
+        """
+        observable = self._try_get_observable()
+        if observable:
+            return observable
+        else:
+            raise ValueError('Could not obtain observable')
+
+    def _get_history(self, device: str) -> SampleHistory:
+        if (history := self._history.get(device)) is None:
+            with self._history_lock:
+                capacity = next(
+                    (item.history_size for item in self.cfg if item.name == device),
+                    DeviceConfig.model_fields['history_size'].default,
+                )
+                history = self._history.setdefault(device, SampleHistory(capacity))
+        return history
+
+    def history(
+        self,
+        device: str,
+        count: Optional[int] = None,
+        since: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """Copy of the recent samples of a device (see `SampleHistory.window`)."""
+        if (history := self._history.get(device)) is None:
+            return np.zeros(0, dtype=HISTORY_DTYPE)
+        return history.window(count, since)
+
+    def latest(self, device: str) -> Optional[Tuple[TData, float]]:
+        """Latest sample of a device and its age in seconds (if any)."""
+        if (entry := self._latest.get(device)) is None:
+            return None
+        received, data = entry
+        return data, time.monotonic() - received
+
+    def current_process_values(
+        self, device: str, max_age: Optional[float] = None
+    ) -> TData:
+        """Return the latest sample of a device.
+
+        The cached sample is returned immediately unless it is older than
+        `max_age` (in seconds). In that case, or if no sample has been
+        received yet, the call blocks until the next sample arrives.
+        """
+        if (latest := self.latest(device)) is not None:
+            data, age = latest
+            if (max_age is None) or (age <= max_age):
+                return data
+
+        return self.observable.pipe(
+            op.filter(lambda x: x.deviceName == device),
+            op.take(1),
+        ).run()
+
     def start(self):
         with self._lock:
             if not self._threads:
@@ -160,12 +495,9 @@ class EurothermIO(metaclass=SingletonMeta):
                 logger.debug('Acquisition threads already running.')
 
     def stop(self):
+        logger.info('Signal completion of process value streams')
         self.complete()
         with self._lock:
-            logger.info('Signal completion of process value streams')
-            if self._observable:
-                self._observable.on_completed()
-
             if not self._threads:
                 return
             logger.info('Cancelling IO threads.')
@@ -176,19 +508,31 @@ class EurothermIO(metaclass=SingletonMeta):
                 thread.join()
 
             self._threads.clear()
+            self._latest.clear()
             logger.info('IO threads terminated')
 
     def complete(self):
-        with self._lock:
-            if self._observable is not None:
-                self._observable.on_completed()
-                self._observable = None
+        """Complete the subscribers after delivering all pending samples."""
+        completed = threading.Event()
+        self._outbox.put(completed)
+        if threading.current_thread() is not self._dispatcher:
+            completed.wait(timeout=5)
 
     def toggle_remote_setpoint(self, device: str, state: RemoteSetpointState):
         self._get_thread(device).toggle_remote_setpoint(state)
 
     def set_remote_setpoint(self, device: str, value: TemperatureQ):
         self._get_thread(device).remote_setpoint = value
+        self._update_latest_remote_setpoint(device, value)
+
+    def _update_latest_remote_setpoint(self, device: str, value: TemperatureQ):
+        # reflect the new remote setpoint in the cache immediately
+        if (entry := self._latest.get(device)) is not None:
+            received, data = entry
+            self._latest[device] = (
+                received,
+                dataclasses.replace(data, remoteSetpoint=value),
+            )
 
     def start_temperature_ramp(
         self, device: str, to: TemperatureQ, rate: TemperatureRateQ
@@ -199,6 +543,14 @@ class EurothermIO(metaclass=SingletonMeta):
     def stop_temperature_ramp(self, device: str):
         self._get_thread(device).stop_temperature_ramp()
 
+    def bus_statistics(self):
+        with self._lock:
+            return {
+                name: thread.bus_statistics
+                for name, thread in self._threads.items()
+                if thread.bus_statistics is not None
+            }
+
     def acknowledge_all_alarms(self, device: str):
         if device == '*':
             logger.info('Acknowledge alarms on all devices')
@@ -216,23 +568,33 @@ class IOThread(threading.Thread):
     ):
         super().__init__()
         self._lock = threading.RLock()
+        # separate lock: the ramp thread updates the remote setpoint while it
+        # is joined under `_lock` (when a ramp is replaced or stopped)
+        self._setpoint_lock = threading.Lock()
         self.device = device
         self.cancel_event = threading.Event()
         self._emit = emit
-        self.controller: controllers.EurothermController = (
-            controllers.EurothermSimulator()
-        )
+        self.controller: controllers.EurothermController
         self._remote_setpoint = TemperatureQ(28.0, '°C')
         self._ramp_thread: Optional[TemperatureRampThread] = None
+        self._scheduler: Optional[controllers.BusScheduler] = None
+        self._clock: Optional[SamplingClock] = None
 
         match self.device.driver:
             case 'simulate':
-                pass
+                # all simulated devices are advanced together
+                engine = controllers.SimulationEngine.shared()
+                self.controller = engine.controller(self.device.name)
             case 'generic':
                 connection = controllers.ModbusSerialConnection(self.device.connection)
                 self.controller = controllers.GenericEurothermController(
-                    self.device.unitAddress, connection
+                    self.device.unitAddress,
+                    connection,
+                    read_plan=self.device.read_plan,
+                    decimal_places=self.device.decimal_places,
                 )
+                if self.device.connection.scheduled:
+                    self._scheduler = controllers.BusScheduler(self.device.connection)
             # case 'model3208':
             #     self.controller = EurothermModel3208(None)
             case _:
@@ -261,12 +623,12 @@ class IOThread(threading.Thread):
 
     @property
     def remote_setpoint(self):
-        with self._lock:
+        with self._setpoint_lock:
             return self._remote_setpoint
 
     @remote_setpoint.setter
     def remote_setpoint(self, value: TemperatureQ):
-        with self._lock:
+        with self._setpoint_lock:
             self._remote_setpoint = value
 
     @property
@@ -281,15 +643,32 @@ class IOThread(threading.Thread):
             else:
                 return TemperatureRampState.Running
 
+    @property
+    def bus_statistics(self) -> Optional[controllers.BusStatistics]:
+        if self._scheduler is None:
+            return None
+        return self._scheduler.statistics().get(self.device.name)
+
+    def _execute(self, fn: Callable, *args):
+        # route controller access through the bus scheduler (if any), so
+        # that it is interleaved with the polling of other units on the port
+        if self._scheduler is not None:
+            return self._scheduler.submit(fn, *args).result()
+        return fn(*args)
+
     def toggle_remote_setpoint(self, state: RemoteSetpointState):
         if not self.cancelled:
-            self.controller.toggle_remote_setpoint(state)
+            self._execute(self.controller.toggle_remote_setpoint, state)
 
     def acknowledge_all_alarms(self):
         if not self.cancelled:
-            self.controller.acknowledge_all_alarms()
+            self._execute(self.controller.acknowledge_all_alarms)
 
     def start_temperature_ramp(self, to: TemperatureQ, rate: TemperatureRateQ):
+        # read current temperature (before locking: with a bus scheduler, the
+        # read waits for the poll of this device, which needs the lock to emit)
+        T_start = self._execute(self.controller.get_process_values).processValue
+
         logger.debug('Acquire lock...')
         with self._lock:
             logger.debug('...lock acquired.')
@@ -306,9 +685,6 @@ class IOThread(threading.Thread):
                 self._ramp_thread.join()
                 logger.info('...ramp cancelled')
 
-            # read current temperature
-            T_start = self.controller.get_process_values().processValue
-
             # start new ramp
             msg = (
                 'Starting temperature ramp: {0:.2f~P} to {1:.2f~P} @ {2:.2f~P}'.format(
@@ -335,17 +711,13 @@ class IOThread(threading.Thread):
 
             logger.info(self.msg('...stopped'))
 
-    def emit(self, values: ProcessValues):
-        data = TData(
-            deviceName=self.device.name,
-            timestamp=values.timestamp,
-            processValue=values.processValue,
-            setpoint=values.setpoint,
-            workingSetpoint=values.workingSetpoint,
-            remoteSetpoint=self.remote_setpoint,
-            workingOutput=values.workingOutput,
-            status=values.status,
-            rampStatus=self.ramp_status,
+    def emit(self, values: ProcessValues, scheduled: Optional[datetime] = None):
+        data = TData.from_process_values(
+            self.device.name,
+            values,
+            remote_setpoint=self.remote_setpoint,
+            ramp_status=self.ramp_status,
+            scheduled=scheduled,
         )
         self._emit(data)
 
@@ -357,21 +729,35 @@ class IOThread(threading.Thread):
         except Exception:
             logger.exception(f'Exception occurred in task: {self.__class__.__name__}')
 
-    def do_work(self):
-        time.time()
-        sampling_interval = 1.0 / self.device.sampling_rate.m_as('Hz')
-        while not self.cancel_event.is_set():
-            # read current process values
-            values = self.controller.get_process_values()
+    @property
+    def missed_samples(self):
+        return self._clock.missed if self._clock is not None else 0
 
-            # emit process values
-            self.emit(values)
+    def sample(self, scheduled: Optional[datetime] = None):
+        # read current process values
+        values = self.controller.get_process_values()
 
-            # write remote setpoint
-            if InstrumentStatus.LocalRemoteSPSelect in values.status:
-                self.controller.write_remote_setpoint(self.remote_setpoint)
+        # emit process values
+        self.emit(values, scheduled)
 
-            time.sleep(sampling_interval)
+        # write remote setpoint
+        if InstrumentStatus.LocalRemoteSPSelect in values.status:
+            self.controller.write_remote_setpoint(self.remote_setpoint)
+
+    def do_work(self):
+        sampling_rate = self.device.sampling_rate.m_as('Hz')
+        if self._scheduler is not None:
+            # polling is driven by the bus scheduler of the serial port
+            self._scheduler.register(self.device.name, sampling_rate, self.sample)
+            self.cancel_event.wait()
+            self._scheduler.unregister(self.device.name)
+        else:
+            self._clock = SamplingClock(1.0 / sampling_rate)
+            # wait for the next slot (or cancellation)
+            while not self.cancel_event.wait(self._clock.delay()):
+                self.sample(self._clock.scheduled_datetime())
+                if skipped := self._clock.advance():
+                    logger.warning(self.msg(f'Skipped {skipped} sampling slot(s)'))
 
         logger.info(self.msg('IO thread terminated'))
 
@@ -0,0 +1,342 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import reactivex
+import reactivex.operators as op
+
+from .. import controllers
+from ..clock import SamplingClock
+from ..configuration import DeviceConfig
+from ..controllers.controller import (
+    InstrumentStatus,
+    ProcessValues,
+    RemoteSetpointState,
+)
+from ..utils import TemperatureQ, TemperatureRateQ, TimeQ
+from .acquisition import EurothermIO, TData, TEmitter, TemperatureRampState
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEurothermIO(EurothermIO):
+    """Acquisition engine running all devices, ramps and writes as
+    coroutines on a single asyncio event loop (in one background thread).
+
+    Exposes the same interface as :class:`EurothermIO`, so that it can be
+    used as a drop-in replacement by the servicer.
+    """
+
+    def __init__(self, cfg: List[DeviceConfig]) -> None:
+        super().__init__(cfg)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._devices: Dict[str, AsyncDevice] = {}
+
+    def _call(self, coro):
+        # run coroutine on the event loop and wait for its result
+        loop = self._loop
+        if loop is None:
+            coro.close()
+            raise ValueError('Acquisition engine is not running')
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def _get_device(self, device: str):
+        with self._lock:
+            if device not in self._devices:
+                logger.error(f'[{repr(device)}] Unknown device name')
+                return None
+            else:
+                return self._devices[device]
+
+    def start(self):
+        with self._lock:
+            if self._loop is not None:
+                logger.debug('Acquisition engine already running.')
+                return
+            logger.info('Starting asyncio acquisition engine')
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name='AsyncEurothermIO', daemon=True
+            )
+            thread.start()
+            self._loop, self._loop_thread = loop, thread
+
+        # the lock must not be held here: the device tasks emit values
+        # (which acquires the lock) as soon as they are started
+        asyncio.run_coroutine_threadsafe(self._start_devices(), loop).result()
+
+    async def _start_devices(self):
+        for device in self.cfg:
+            if device.name in self._devices:
+                msg = f'A device with the name {device.name} already exists'
+                logger.error(msg)
+                raise ValueError(msg)
+            try:
+                self._devices[device.name] = AsyncDevice(device, self._emit)
+            except ValueError:
+                logger.warning(
+                    f'Could not start acquisition task for device: {device.name}'
+                )
+        for device in self._devices.values():
+            device.start()
+
+    def stop(self):
+        self.complete()
+        with self._lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop, self._loop_thread = None, None
+        if loop is None:
+            return
+
+        # the lock is released here, so that pending emits can complete
+        logger.info('Cancelling acquisition tasks.')
+        asyncio.run_coroutine_threadsafe(self._stop_devices(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        self._latest.clear()
+        logger.info('Acquisition engine stopped')
+
+    async def _stop_devices(self):
+        await asyncio.gather(*(device.stop() for device in self._devices.values()))
+        # the connections are bound to this event loop and cannot be reused
+        # by a later start (which runs a new loop)
+        connections = controllers.AsyncModbusSerialConnection.__connections__
+        for device in self._devices.values():
+            if (connection := device.connection) is not None:
+                connection.close()
+                connections.pop(device.device.connection.port, None)
+        self._devices.clear()
+
+    def toggle_remote_setpoint(self, device: str, state: RemoteSetpointState):
+        self._call(self._get_device(device).toggle_remote_setpoint(state))
+
+    def set_remote_setpoint(self, device: str, value: TemperatureQ):
+        self._get_device(device).remote_setpoint = value
+        self._update_latest_remote_setpoint(device, value)
+
+    def start_temperature_ramp(
+        self, device: str, to: TemperatureQ, rate: TemperatureRateQ
+    ):
+        observable = self._call(
+            self._get_device(device).start_temperature_ramp(to, rate)
+        )
+        return observable.pipe(op.observe_on(self._pool))
+
+    def stop_temperature_ramp(self, device: str):
+        self._call(self._get_device(device).stop_temperature_ramp())
+
+    def bus_statistics(self):
+        return {}
+
+    def acknowledge_all_alarms(self, device: str):
+        if device == '*':
+            logger.info('Acknowledge alarms on all devices')
+            for item in list(self._devices.values()):
+                self._call(item.acknowledge_all_alarms())
+        else:
+            self._call(self._get_device(device).acknowledge_all_alarms())
+
+
+class AsyncDevice:
+    def __init__(self, device: DeviceConfig, emit: TEmitter):
+        self.device = device
+        self._emit = emit
+        self.remote_setpoint = TemperatureQ(28.0, '°C')
+        self._task: Optional[asyncio.Task] = None
+        self._ramp: Optional[AsyncTemperatureRamp] = None
+        self._clock: Optional[SamplingClock] = None
+        self.connection: Optional[controllers.AsyncModbusSerialConnection] = None
+
+        match self.device.driver:
+            case 'simulate':
+                # all simulated devices are advanced together
+                engine = controllers.SimulationEngine.shared()
+                self.controller: controllers.AsyncEurothermController = (
+                    controllers.AsyncControllerAdapter(engine.controller(device.name))
+                )
+            case 'generic':
+                if self.device.connection.scheduled:
+                    logger.warning(
+                        self.msg(
+                            'Bus scheduling (scheduled=True) is not supported by '
+                            'the asyncio engine and is ignored, transactions on '
+                            'the port are serialized in order of arrival.'
+                        )
+                    )
+                self.connection = controllers.AsyncModbusSerialConnection(
+                    self.device.connection
+                )
+                self.controller = controllers.AsyncGenericEurothermController(
+                    self.device.unitAddress,
+                    self.connection,
+                    read_plan=self.device.read_plan,
+                    decimal_places=self.device.decimal_places,
+                )
+            case _:
+                logger.error(f'Unknown device driver: {device.driver}')
+                raise ValueError(f'Unknown device driver: {device.driver}')
+
+    def start(self):
+        logger.info(f'{self.__class__.__name__} started for device {self.device.name}')
+        self._task = asyncio.create_task(self._run(), name=self.device.name)
+
+    async def stop(self):
+        logger.info(self.msg('Cancelling acquisition task'))
+        tasks = [self._task]
+        if self._ramp is not None:
+            self._ramp.cancel()
+            tasks.append(self._ramp.task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info(self.msg('Acquisition task terminated'))
+
+    @property
+    def ramp_status(self):
+        if self._ramp is None:
+            return TemperatureRampState.NoRamp
+        elif self._ramp.cancelled:
+            return TemperatureRampState.Stopped
+        elif self._ramp.task.done():
+            return TemperatureRampState.Finished
+        else:
+            return TemperatureRampState.Running
+
+    async def toggle_remote_setpoint(self, state: RemoteSetpointState):
+        await self.controller.toggle_remote_setpoint(state)
+
+    async def acknowledge_all_alarms(self):
+        await self.controller.acknowledge_all_alarms()
+
+    async def start_temperature_ramp(self, to: TemperatureQ, rate: TemperatureRateQ):
+        if self.ramp_status == TemperatureRampState.Running:
+            logger.info(self.msg('Cancelling active ramp...'))
+            await self._ramp.stop()
+            logger.info(self.msg('...ramp cancelled'))
+
+        # read current temperature
+        T_start = (await self.controller.get_process_values()).processValue
+
+        # start new ramp
+        msg = 'Starting temperature ramp: {0:.2f~P} to {1:.2f~P} @ {2:.2f~P}'.format(
+            T_start, to, rate
+        )
+        logger.info(self.msg(msg))
+        self._ramp = AsyncTemperatureRamp(self, T_start, to, rate)
+        return self._ramp.observable
+
+    async def stop_temperature_ramp(self):
+        if not (self.ramp_status == TemperatureRampState.Running):
+            logger.warning(self.msg('There is no active temperature ramp.'))
+            return
+
+        logger.info(self.msg('Stopping temperature ramp.'))
+        await self._ramp.stop()
+        logger.info(self.msg('...stopped'))
+
+    def emit(self, values: ProcessValues, scheduled: Optional[datetime] = None):
+        data = TData.from_process_values(
+            self.device.name,
+            values,
+            remote_setpoint=self.remote_setpoint,
+            ramp_status=self.ramp_status,
+            scheduled=scheduled,
+        )
+        self._emit(data)
+
+    async def _run(self):
+        try:
+            await self.do_work()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception(self.msg('Exception occurred in acquisition task'))
+
+    @property
+    def missed_samples(self):
+        return self._clock.missed if self._clock is not None else 0
+
+    async def do_work(self):
+        clock = self._clock = SamplingClock(1.0 / self.device.sampling_rate.m_as('Hz'))
+        while True:
+            await asyncio.sleep(clock.delay())
+
+            # read current process values
+            values = await self.controller.get_process_values()
+
+            # emit process values
+            self.emit(values, clock.scheduled_datetime())
+
+            # write remote setpoint
+            if InstrumentStatus.LocalRemoteSPSelect in values.status:
+                await self.controller.write_remote_setpoint(self.remote_setpoint)
+
+            if skipped := clock.advance():
+                logger.warning(self.msg(f'Skipped {skipped} sampling slot(s)'))
+
+    def msg(self, text: str):
+        return f'[{repr(self.device.name)}] {text}'
+
+
+class AsyncTemperatureRamp:
+    def __init__(
+        self,
+        device: AsyncDevice,
+        T_start: TemperatureQ,
+        T_end: TemperatureQ,
+        temprature_rate: TemperatureRateQ,
+    ):
+        self.cancelled = False
+        self._device = device
+        self.T_start = T_start.to('K')
+        self.T_end = T_end.to('K')
+        self.rate = temprature_rate.to('K/min')
+        self.observable = reactivex.Subject[TemperatureQ]()
+        self.task = asyncio.create_task(self._run())
+
+    def cancel(self):
+        self.cancelled = True
+        self.task.cancel()
+
+    async def stop(self):
+        self.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+    async def _run(self):
+        try:
+            await self.do_work()
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception(f'Exception occurred in task: {self.__class__.__name__}')
+        finally:
+            # signal completion of temperature ramp
+            self.observable.on_completed()
+            self.observable.dispose()
+
+    async def do_work(self):
+        sampling_interval = 1.0  # seconds
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        sign = np.sign(self.T_end.m_as('K') - self.T_start.m_as('K'))
+        while True:
+            # elapsed time
+            elapsed: TimeQ = TimeQ(loop.time() - t0, 's')
+
+            # calculate new setpoint
+            current: TemperatureQ = self.T_start + sign * self.rate * elapsed
+
+            if sign * (current - self.T_end) > 0:
+                self._device.remote_setpoint = self.T_end
+                self.observable.on_next(self.T_end)
+                break  # terminate loop
+            else:
+                self._device.remote_setpoint = current
+                self.observable.on_next(current)
+
+            await asyncio.sleep(sampling_interval)
@@ -0,0 +1,336 @@
+import asyncio
+import logging
+import threading
+from concurrent import futures
+from queue import Empty as EmptyError
+from typing import Any, AsyncIterator, List, Optional
+
+import grpc
+import reactivex
+
+from ..configuration import Config
+from ..utils import TemperatureQ, TemperatureRateQ
+from .acquisition import TData
+from .proto import service_pb2, service_pb2_grpc
+from .servicer import (
+    OVERFLOW_POLICIES,
+    EurothermServicer,
+    ResumeGate,
+    StreamFilter,
+    StreamQueue,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class StreamBridge:
+    """Hands items over from another thread to a coroutine.
+
+    Items are put into a bounded `StreamQueue` (applying its overflow
+    policy) by the producing thread, which then wakes up the event loop.
+    The producer never waits for the consumer.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: StreamQueue):
+        self.queue = queue
+        self.completed = False
+        self.error: Optional[Exception] = None
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+
+    def put(self, item: Any):
+        self.queue.put(item)
+        self._notify()
+
+    def complete(self):
+        self.completed = True
+        self._notify()
+
+    def fail(self, ex: Exception):
+        logger.exception('Error on observable.', exc_info=ex)
+        self.error = ex
+        self.complete()
+
+    def _notify(self):
+        # the consumer clears the event before it checks the queue, so a set
+        # event means that the item put above will be seen anyway
+        if self._wakeup.is_set():
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            pass  # event loop closed
+
+    async def get(self, timeout: Optional[float] = None):
+        """Next item (None if completed, overflowed or timed out)."""
+        while True:
+            self._wakeup.clear()
+            try:
+                return self.queue.get(0)
+            except EmptyError:
+                pass
+            if self.completed or self.queue.overflowed:
+                return None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+
+
+class AsyncEurothermServicer(EurothermServicer):
+    """Servicer for the asyncio (grpc.aio) server.
+
+    Streams are async generators fed by the acquisition engine's dispatcher
+    thread, so they do not occupy a thread each. Blocking calls (e.g. to
+    the devices) are executed in worker threads.
+    """
+
+    def __init__(self, cfg: Config, log_data: bool = False) -> None:
+        super().__init__(cfg, log_data=log_data)
+        self.stopped = asyncio.Event()
+
+    async def StopServer(
+        self,
+        request: service_pb2.StopRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        response = await asyncio.to_thread(super().StopServer, request, context)
+        self.stopped.set()
+        return response
+
+    async def ServerHealthCheck(
+        self,
+        request: service_pb2.Empty,
+        context: grpc.aio.ServicerContext,
+    ):
+        return super().ServerHealthCheck(request, context)
+
+    async def _stream(self, request, context, convert, batched=False):
+        # stream (filtered and optionally batched) process values
+        try:
+            stream_filter = StreamFilter(request)
+        except ValueError as ex:
+            logger.error(ex)
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(ex))
+
+        # start acquisition if necessary
+        await asyncio.to_thread(self.io.start)
+
+        # the queue holds samples (also for batched streams), so that all
+        # overflow policies apply to single samples
+        bridge = StreamBridge(
+            asyncio.get_running_loop(),
+            StreamQueue(
+                self.cfg.server.stream_queue_size,
+                OVERFLOW_POLICIES.get(
+                    request.overflow, self.cfg.server.stream_overflow
+                ),
+            ),
+        )
+
+        def sink(data: TData):
+            if stream_filter(data):
+                bridge.put(data)
+
+        try:
+            observable = self.io.dispatched
+        except ValueError as ex:
+            logger.error(ex)
+            return
+
+        gate = ResumeGate(request.resumeFrom, sink)
+        subscription = observable.subscribe(
+            gate.on_next,
+            on_completed=bridge.complete,
+            on_error=bridge.fail,
+        )
+        try:
+            logger.info('Starting stream...')
+            await asyncio.to_thread(gate.replay, self.io.history)
+            if batched:
+                items = self._batches(bridge, request)
+            else:
+                items = self._items(bridge)
+            async for item in items:
+                response = convert(item, stream_filter.fields)
+                response.dropped = bridge.queue.dropped
+                yield response
+        finally:
+            # dispose subscription once iteration completes or terminates
+            subscription.dispose()
+            logger.info('...stream stopped.')
+
+        if bridge.queue.overflowed:
+            logger.warning('Stream client does not keep up: stream closed')
+            await context.abort(
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+                f'Stream queue overflow (queue size={bridge.queue.maxsize})',
+            )
+
+    @staticmethod
+    async def _items(bridge: StreamBridge) -> AsyncIterator[Any]:
+        while (item := await bridge.get()) is not None:
+            yield item
+
+    @staticmethod
+    async def _batches(
+        bridge: StreamBridge, request: service_pb2.StreamProcessValuesRequest
+    ) -> AsyncIterator[List[TData]]:
+        # a batch is complete when it has `batchSize` samples or spans
+        # `batchInterval` (default: 1s, unless only the size is given)
+        size = request.batchSize
+        if size and not request.batchInterval:
+            interval = None
+        else:
+            interval = request.batchInterval or 1.0
+
+        loop = asyncio.get_running_loop()
+        while (first := await bridge.get()) is not None:
+            batch = [first]
+            deadline = None if interval is None else loop.time() + interval
+            while not size or len(batch) < size:
+                timeout = None if deadline is None else deadline - loop.time()
+                if timeout is not None and timeout <= 0:
+                    break
+                if (item := await bridge.get(timeout)) is None:
+                    break
+                batch.append(item)
+            yield batch
+
+    async def StreamProcessValues(
+        self,
+        request: service_pb2.StreamProcessValuesRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        logger.info('[Request] StreamTemperatures')
+        async for response in self._stream(request, context, TData.to_grpc_response):
+            yield response
+
+    async def StreamProcessValuesBatched(
+        self,
+        request: service_pb2.StreamProcessValuesRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        logger.info('[Request] StreamProcessValuesBatched')
+        async for response in self._stream(
+            request, context, TData.to_grpc_batch, batched=True
+        ):
+            yield response
+
+    async def GetProcessValues(
+        self,
+        request: service_pb2.GetProcessValuesRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        return await asyncio.to_thread(super().GetProcessValues, request, context)
+
+    async def GetHistory(
+        self,
+        request: service_pb2.GetHistoryRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        return await asyncio.to_thread(super().GetHistory, request, context)
+
+    async def ToggleRemoteSetpoint(
+        self,
+        request: service_pb2.ToggleRemoteSetpointRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        return await asyncio.to_thread(super().ToggleRemoteSetpoint, request, context)
+
+    async def SetRemoteSetpoint(
+        self,
+        request: service_pb2.SetRemoteSetpointRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        return await asyncio.to_thread(super().SetRemoteSetpoint, request, context)
+
+    async def StartTemperatureRamp(
+        self,
+        request: service_pb2.StartTemperatureRampRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        device = request.deviceName
+        to = TemperatureQ(request.target, 'K')
+        rate = TemperatureRateQ(request.rate, 'K/min')
+        logger.info(
+            (
+                f'[Request] [{repr(device)}] '
+                f'Temperature ramp to {to:.2f~P} @ {rate:.2f~P}'
+            )
+        )
+
+        # start acquisition if necessary
+        await asyncio.to_thread(self.io.start)
+
+        bridge = StreamBridge(
+            asyncio.get_running_loop(),
+            StreamQueue(self.cfg.server.stream_queue_size, 'drop-oldest'),
+        )
+        observable: reactivex.Observable = await asyncio.to_thread(
+            self.io.start_temperature_ramp, device, to, rate
+        )
+        subscription = observable.subscribe(
+            bridge.put,
+            on_completed=bridge.complete,
+            on_error=bridge.fail,
+        )
+        try:
+            logger.info('Starting temperature ramp stream...')
+            while (value := await bridge.get()) is not None:
+                yield service_pb2.TemperatureRampValue(
+                    deviceName=device, current=value.m_as('K')
+                )
+        finally:
+            # dispose subscription once iteration completes or terminates
+            subscription.dispose()
+            logger.info('...temperature ramp stream stopped.')
+
+    async def StopTemperatureRamp(
+        self,
+        request: service_pb2.StopTemperatureRampRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        return await asyncio.to_thread(super().StopTemperatureRamp, request, context)
+
+    async def AcknowledgeAllAlarms(
+        self,
+        request: service_pb2.AcknowlegdeAllAlarmsRequest,
+        context: grpc.aio.ServicerContext,
+    ):
+        return await asyncio.to_thread(super().AcknowledgeAllAlarms, request, context)
+
+
+async def _serve(cfg: Config, log_data: bool, started: threading.Event):
+    server = grpc.aio.server()
+    servicer = AsyncEurothermServicer(cfg, log_data=log_data)
+    service_pb2_grpc.add_EurothermServicer_to_server(servicer, server)
+
+    server_address = f'{cfg.server.ip}:{cfg.server.port}'
+    server.add_insecure_port(server_address)
+
+    logger.info(f'Starting TCLogger asyncio server at {server_address}')
+    await server.start()
+    started.set()
+
+    logger.info('Waiting for server to terminate...')
+    await servicer.stopped.wait()
+
+    logger.info(f'Stopping server at {server_address}')
+    await server.stop(30.0)
+    logger.info('Server stopped')
+
+
+def serve_async(cfg: Config, log_data: bool = False) -> futures.Future:
+    """Run the asyncio server in a background thread (see `serve`)."""
+    started = threading.Event()
+    executor = futures.ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(asyncio.run, _serve(cfg, log_data, started))
+    executor.shutdown(wait=False)
+
+    # return once the server accepts requests (or failed to start)
+    while not started.wait(0.1):
+        if future.done():
+            future.result()  # raises the exception of the server
+            break
+    return future
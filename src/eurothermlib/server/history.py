@@ -0,0 +1,190 @@
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+import pint
+
+from ..utils import LazyQuantity
+from .proto import service_pb2
+
+if TYPE_CHECKING:
+    from .acquisition import TData
+
+# columns of the sample history (temperatures in K, working output in %)
+HISTORY_DTYPE = np.dtype(
+    [
+        ('timestamp', 'datetime64[us]'),
+        ('processValue', 'f8'),
+        ('setpoint', 'f8'),
+        ('workingSetpoint', 'f8'),
+        ('remoteSetpoint', 'f8'),
+        ('workingOutput', 'f8'),
+        ('status', 'i8'),
+        ('rampStatus', 'i8'),
+        ('scheduledTimestamp', 'datetime64[us]'),  # NaT if not scheduled
+        ('sequence', 'i8'),
+    ]
+)
+
+NAT = np.datetime64('NaT', 'us')
+
+# magnitudes of the quantity columns of a sample (see TData)
+QUANTITY_MAGNITUDES = LazyQuantity.magnitude_getter(
+    'processValue', 'setpoint', 'workingSetpoint', 'remoteSetpoint', 'workingOutput'
+)
+
+# units of the quantity columns
+HISTORY_UNITS = {
+    'processValue': 'K',
+    'setpoint': 'K',
+    'workingSetpoint': 'K',
+    'remoteSetpoint': 'K',
+    'workingOutput': '%',
+}
+
+
+class SampleHistory:
+    """Preallocated ring buffer of the most recent samples of one device.
+
+    Every sample is written twice, at index ``i`` and ``i + capacity`` of a
+    buffer of twice the capacity. Thereby, the most recent samples always
+    form a contiguous slice, which is copied in a single operation.
+
+    Windows are returned as copies: once the buffer is full, the oldest
+    sample of a window is the slot written next, so a view would change
+    with the next sample.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError(f'Capacity must be positive (capacity={capacity})')
+        self.capacity = capacity
+        self._buffer = np.zeros(2 * capacity, dtype=HISTORY_DTYPE)
+        self._lock = threading.Lock()
+        self._position = 0  # next write position (in [0, capacity))
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, data: 'TData'):
+        # TData stores the magnitudes of its quantities in the units used here
+        record = (
+            np.datetime64(data.timestamp, 'us'),
+            *QUANTITY_MAGNITUDES(data),
+            int(data.status),
+            int(data.rampStatus),
+            (
+                NAT
+                if data.scheduledTimestamp is None
+                else np.datetime64(data.scheduledTimestamp, 'us')
+            ),
+            data.sequence,
+        )
+        with self._lock:
+            position = self._position
+            self._buffer[position] = record
+            self._buffer[position + self.capacity] = record
+            self._position = (position + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def window(
+        self, count: Optional[int] = None, since: Optional[datetime] = None
+    ) -> np.ndarray:
+        """Copy of the most recent samples (oldest first).
+
+        Returns at most `count` samples and only samples recorded at or
+        after `since` (if given).
+        """
+        with self._lock:
+            end = self._position + self.capacity
+            size = self._size if count is None else min(count, self._size)
+            view = self._buffer[end - size : end]
+            if since is not None:
+                start = np.searchsorted(
+                    view['timestamp'], np.datetime64(since, 'us'), side='left'
+                )
+                view = view[start:]
+            return view.copy()
+
+
+def select(
+    records: np.ndarray,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> np.ndarray:
+    """Samples (sorted by time) recorded in the interval [start, end].
+
+    Returns a view of `records` (see `SampleHistory.window` for copies of
+    the buffer).
+    """
+    timestamps = records['timestamp']
+    first = 0 if start is None else np.searchsorted(timestamps, _us(start), 'left')
+    last = None if end is None else np.searchsorted(timestamps, _us(end), 'right')
+    return records[first:last]
+
+
+def downsample(records: np.ndarray, max_points: int) -> np.ndarray:
+    """Evenly spaced subset of at most `max_points` samples.
+
+    The first and the last sample are always kept. If `max_points` is 0,
+    all samples are returned.
+    """
+    if max_points <= 0 or len(records) <= max_points:
+        return records
+    if max_points == 1:
+        return records[-1:]
+    indices = np.linspace(0, len(records) - 1, max_points).round().astype(np.intp)
+    return records[np.unique(indices)]
+
+
+def from_frame(frame: pd.DataFrame, units: Mapping[str, str]) -> np.ndarray:
+    """Convert logged process values to history records.
+
+    Quantity columns of the frame are given in `units`. Columns missing
+    from the frame are set to NaN (quantities), 0 (flags, sequence) or NaT.
+    """
+    records = np.zeros(len(frame), dtype=HISTORY_DTYPE)
+    records['timestamp'] = pd.to_datetime(frame['timestamp']).to_numpy(
+        dtype='datetime64[us]'
+    )
+    records['scheduledTimestamp'] = NAT
+    for key, target in HISTORY_UNITS.items():
+        if key not in frame:
+            records[key] = np.nan
+            continue
+        magnitudes = frame[key].to_numpy(dtype=float)
+        source = units.get(key, target)
+        if source != target:
+            magnitudes = pint.Quantity(magnitudes, source).m_as(target)
+        records[key] = magnitudes
+    for key in ('status', 'rampStatus', 'sequence'):
+        if key in frame:
+            records[key] = frame[key].to_numpy(dtype=np.int64)
+    return records
+
+
+def to_grpc_batch(device: str, records: np.ndarray) -> service_pb2.ProcessValuesBatch:
+    """Pack history records of one device into a batch message."""
+    response = service_pb2.ProcessValuesBatch(devices=[device])
+    response.deviceIndex.extend([0] * len(records))
+    response.timestamp.extend(_microseconds(records['timestamp']))
+    for key in HISTORY_UNITS:
+        getattr(response, key).extend(records[key].tolist())
+    response.status.extend(records['status'].tolist())
+    response.rampStatus.extend(records['rampStatus'].tolist())
+    response.scheduledTimestamp.extend(_microseconds(records['scheduledTimestamp']))
+    response.sequence.extend(records['sequence'].tolist())
+    return response
+
+
+def _us(timestamp: datetime) -> np.datetime64:
+    return np.datetime64(timestamp, 'us')
+
+
+def _microseconds(timestamps: np.ndarray):
+    # microseconds since epoch (0 = unknown)
+    values = timestamps.astype(np.int64)
+    return np.where(np.isnat(timestamps), 0, values).tolist()
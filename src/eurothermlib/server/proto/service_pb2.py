@@ -15,7 +15,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rservice.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\x07\n\x05\x45mpty\"\r\n\x0bStopRequest\"\x1c\n\x1aStreamProcessValuesRequest\"-\n\x17GetProcessValuesRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t\"\xfd\x01\n\rProcessValues\x12\x12\n\ndeviceName\x18\x01 \x01(\t\x12-\n\ttimestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0e\n\x06status\x18\x03 \x01(\x05\x12\x14\n\x0cprocessValue\x18\x04 \x01(\x01\x12\x10\n\x08setpoint\x18\x05 \x01(\x01\x12\x17\n\x0fworkingSetpoint\x18\x06 \x01(\x01\x12\x16\n\x0eremoteSetpoint\x18\x07 \x01(\x01\x12\x15\n\rworkingOutput\x18\x08 \x01(\x01\x12)\n\nrampStatus\x18\t \x01(\x0e\x32\x15.TemperatureRampState\"V\n\x1bToggleRemoteSetpointRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t\x12#\n\x05state\x18\x02 \x01(\x0e\x32\x14.RemoteSetpointState\"=\n\x18SetRemoteSetpointRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01\"O\n\x1bStartTemperatureRampRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t\x12\x0e\n\x06target\x18\x02 \x01(\x01\x12\x0c\n\x04rate\x18\x03 \x01(\x01\";\n\x14TemperatureRampValue\x12\x12\n\ndeviceName\x18\x01 \x01(\t\x12\x0f\n\x07\x63urrent\x18\x02 \x01(\x01\"0\n\x1aStopTemperatureRampRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t\"1\n\x1b\x41\x63knowlegdeAllAlarmsRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t*k\n\x14TemperatureRampState\x12\x0e\n\nTRS_NORAMP\x10\x00\x12\x0f\n\x0bTRS_RAMPING\x10\x01\x12\x0f\n\x0bTRS_HOLDING\x10\x02\x12\x0f\n\x0bTRS_STOPPED\x10\x03\x12\x10\n\x0cTRS_FINISHED\x10\x04*0\n\x13RemoteSetpointState\x12\x0c\n\x08\x44ISABLED\x10\x00\x12\x0b\n\x07\x45NABLED\x10\x01\x32\xa9\x04\n\tEurotherm\x12$\n\nStopServer\x12\x0c.StopRequest\x1a\x06.Empty\"\x00\x12%\n\x11ServerHealthCheck\x12\x06.Empty\x1a\x06.Empty\"\x00\x12\x46\n\x13StreamProcessValues\x12\x1b.StreamProcessValuesRequest\x1a\x0e.ProcessValues\"\x00\x30\x01\x12>\n\x10GetProcessValues\x12\x18.GetProcessValuesRequest\x1a\x0e.ProcessValues\"\x00\x12>\n\x14ToggleRemoteSetpoint\x12\x1c.ToggleRemoteSetpointRequest\x1a\x06.Empty\"\x00\x12\x38\n\x11SetRemoteSetpoint\x12\x19.SetRemoteSetpointRequest\x1a\x06.Empty\"\x00\x12O\n\x14StartTemperatureRamp\x12\x1c.StartTemperatureRampRequest\x1a\x15.TemperatureRampValue\"\x00\x30\x01\x12<\n\x13StopTemperatureRamp\x12\x1b.StopTemperatureRampRequest\x1a\x06.Empty\"\x00\x12>\n\x14\x41\x63knowledgeAllAlarms\x12\x1c.AcknowlegdeAllAlarmsRequest\x1a\x06.Empty\"\x00\x42\x03\x90\x01\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rservice.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\x07\n\x05\x45mpty\"\r\n\x0bStopRequest\"\xa7\x02\n\x1aStreamProcessValuesRequest\x12\x13\n\x0b\x64\x65viceNames\x18\x01 \x03(\t\x12\x0f\n\x07maxRate\x18\x02 \x01(\x01\x12\x12\n\ndecimation\x18\x03 \x01(\r\x12\x0e\n\x06\x66ields\x18\x04 \x03(\t\x12\x11\n\tbatchSize\x18\x05 \x01(\r\x12\x15\n\rbatchInterval\x18\x06 \x01(\x01\x12?\n\nresumeFrom\x18\x07 \x03(\x0b\x32+.StreamProcessValuesRequest.ResumeFromEntry\x12!\n\x08overflow\x18\x08 \x01(\x0e\x32\x0f.OverflowPolicy\x1a\x31\n\x0fResumeFromEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\"M\n\x17GetProcessValuesRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t\x12\x13\n\x06maxAge\x18\x02 \x01(\x01H\x00\x88\x01\x01\x42\t\n\x07_maxAge\"\x8e\x01\n\x11GetHistoryRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t\x12)\n\x05start\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\'\n\x03\x65nd\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tmaxPoints\x18\x04 \x01(\r\"\xd8\x02\n\rProcessValues\x12\x12\n\ndeviceName\x18\x01 \x01(\t\x12-\n\ttimestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0e\n\x06status\x18\x03 \x01(\x05\x12\x14\n\x0cprocessValue\x18\x04 \x01(\x01\x12\x10\n\x08setpoint\x18\x05 \x01(\x01\x12\x17\n\x0fworkingSetpoint\x18\x06 \x01(\x01\x12\x16\n\x0eremoteSetpoint\x18\x07 \x01(\x01\x12\x15\n\rworkingOutput\x18\x08 \x01(\x01\x12)\n\nrampStatus\x18\t \x01(\x0e\x32\x15.TemperatureRampState\x12\x36\n\x12scheduledTimestamp\x18\n \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08sequence\x18\x0b \x01(\x04\x12\x0f\n\x07\x64ropped\x18\x0c \x01(\x04\"\xb7\x02\n\x12ProcessValuesBatch\x12\x0f\n\x07\x64\x65vices\x18\x01 \x03(\t\x12\x13\n\x0b\x64\x65viceIndex\x18\x02 \x03(\r\x12\x11\n\ttimestamp\x18\x03 \x03(\x03\x12\x0e\n\x06status\x18\x04 \x03(\x05\x12\x14\n\x0cprocessValue\x18\x05 \x03(\x01\x12\x10\n\x08setpoint\x18\x06 \x03(\x01\x12\x17\n\x0fworkingSetpoint\x18\x07 \x03(\x01\x12\x16\n\x0eremoteSetpoint\x18\x08 \x03(\x01\x12\x15\n\rworkingOutput\x18\t \x03(\x01\x12)\n\nrampStatus\x18\n \x03(\x0e\x32\x15.TemperatureRampState\x12\x1a\n\x12scheduledTimestamp\x18\x0b \x03(\x03\x12\x10\n\x08sequence\x18\x0c \x03(\x04\x12\x0f\n\x07\x64ropped\x18\r \x01(\x04\"V\n\x1bToggleRemoteSetpointRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t\x12#\n\x05state\x18\x02 \x01(\x0e\x32\x14.RemoteSetpointState\"=\n\x18SetRemoteSetpointRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01\"O\n\x1bStartTemperatureRampRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t\x12\x0e\n\x06target\x18\x02 \x01(\x01\x12\x0c\n\x04rate\x18\x03 \x01(\x01\";\n\x14TemperatureRampValue\x12\x12\n\ndeviceName\x18\x01 \x01(\t\x12\x0f\n\x07\x63urrent\x18\x02 \x01(\x01\"0\n\x1aStopTemperatureRampRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t\"1\n\x1b\x41\x63knowlegdeAllAlarmsRequest\x12\x12\n\ndeviceName\x18\x01 \x01(\t*f\n\x0eOverflowPolicy\x12\x14\n\x10OVERFLOW_DEFAULT\x10\x00\x12\x0f\n\x0b\x44ROP_OLDEST\x10\x01\x12\x0f\n\x0b\x44ROP_NEWEST\x10\x02\x12\x0c\n\x08\x43OALESCE\x10\x03\x12\x0e\n\nDISCONNECT\x10\x04*k\n\x14TemperatureRampState\x12\x0e\n\nTRS_NORAMP\x10\x00\x12\x0f\n\x0bTRS_RAMPING\x10\x01\x12\x0f\n\x0bTRS_HOLDING\x10\x02\x12\x0f\n\x0bTRS_STOPPED\x10\x03\x12\x10\n\x0cTRS_FINISHED\x10\x04*0\n\x13RemoteSetpointState\x12\x0c\n\x08\x44ISABLED\x10\x00\x12\x0b\n\x07\x45NABLED\x10\x01\x32\xb6\x05\n\tEurotherm\x12$\n\nStopServer\x12\x0c.StopRequest\x1a\x06.Empty\"\x00\x12%\n\x11ServerHealthCheck\x12\x06.Empty\x1a\x06.Empty\"\x00\x12\x46\n\x13StreamProcessValues\x12\x1b.StreamProcessValuesRequest\x1a\x0e.ProcessValues\"\x00\x30\x01\x12R\n\x1aStreamProcessValuesBatched\x12\x1b.StreamProcessValuesRequest\x1a\x13.ProcessValuesBatch\"\x00\x30\x01\x12>\n\x10GetProcessValues\x12\x18.GetProcessValuesRequest\x1a\x0e.ProcessValues\"\x00\x12\x37\n\nGetHistory\x12\x12.GetHistoryRequest\x1a\x13.ProcessValuesBatch\"\x00\x12>\n\x14ToggleRemoteSetpoint\x12\x1c.ToggleRemoteSetpointRequest\x1a\x06.Empty\"\x00\x12\x38\n\x11SetRemoteSetpoint\x12\x19.SetRemoteSetpointRequest\x1a\x06.Empty\"\x00\x12O\n\x14StartTemperatureRamp\x12\x1c.StartTemperatureRampRequest\x1a\x15.TemperatureRampValue\"\x00\x30\x01\x12<\n\x13StopTemperatureRamp\x12\x1b.StopTemperatureRampRequest\x1a\x06.Empty\"\x00\x12>\n\x14\x41\x63knowledgeAllAlarms\x12\x1c.AcknowlegdeAllAlarmsRequest\x1a\x06.Empty\"\x00\x42\x03\x90\x01\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -23,33 +23,43 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'service_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'\220\001\001'
-  _globals['_TEMPERATURERAMPSTATE']._serialized_start=801
-  _globals['_TEMPERATURERAMPSTATE']._serialized_end=908
-  _globals['_REMOTESETPOINTSTATE']._serialized_start=910
-  _globals['_REMOTESETPOINTSTATE']._serialized_end=958
+  _globals['_STREAMPROCESSVALUESREQUEST_RESUMEFROMENTRY']._loaded_options = None
+  _globals['_STREAMPROCESSVALUESREQUEST_RESUMEFROMENTRY']._serialized_options = b'8\001'
+  _globals['_OVERFLOWPOLICY']._serialized_start=1651
+  _globals['_OVERFLOWPOLICY']._serialized_end=1753
+  _globals['_TEMPERATURERAMPSTATE']._serialized_start=1755
+  _globals['_TEMPERATURERAMPSTATE']._serialized_end=1862
+  _globals['_REMOTESETPOINTSTATE']._serialized_start=1864
+  _globals['_REMOTESETPOINTSTATE']._serialized_end=1912
   _globals['_EMPTY']._serialized_start=50
   _globals['_EMPTY']._serialized_end=57
   _globals['_STOPREQUEST']._serialized_start=59
   _globals['_STOPREQUEST']._serialized_end=72
-  _globals['_STREAMPROCESSVALUESREQUEST']._serialized_start=74
-  _globals['_STREAMPROCESSVALUESREQUEST']._serialized_end=102
-  _globals['_GETPROCESSVALUESREQUEST']._serialized_start=104
-  _globals['_GETPROCESSVALUESREQUEST']._serialized_end=149
-  _globals['_PROCESSVALUES']._serialized_start=152
-  _globals['_PROCESSVALUES']._serialized_end=405
-  _globals['_TOGGLEREMOTESETPOINTREQUEST']._serialized_start=407
-  _globals['_TOGGLEREMOTESETPOINTREQUEST']._serialized_end=493
-  _globals['_SETREMOTESETPOINTREQUEST']._serialized_start=495
-  _globals['_SETREMOTESETPOINTREQUEST']._serialized_end=556
-  _globals['_STARTTEMPERATURERAMPREQUEST']._serialized_start=558
-  _globals['_STARTTEMPERATURERAMPREQUEST']._serialized_end=637
-  _globals['_TEMPERATURERAMPVALUE']._serialized_start=639
-  _globals['_TEMPERATURERAMPVALUE']._serialized_end=698
-  _globals['_STOPTEMPERATURERAMPREQUEST']._serialized_start=700
-  _globals['_STOPTEMPERATURERAMPREQUEST']._serialized_end=748
-  _globals['_ACKNOWLEGDEALLALARMSREQUEST']._serialized_start=750
-  _globals['_ACKNOWLEGDEALLALARMSREQUEST']._serialized_end=799
-  _globals['_EUROTHERM']._serialized_start=961
-  _globals['_EUROTHERM']._serialized_end=1514
+  _globals['_STREAMPROCESSVALUESREQUEST']._serialized_start=75
+  _globals['_STREAMPROCESSVALUESREQUEST']._serialized_end=370
+  _globals['_STREAMPROCESSVALUESREQUEST_RESUMEFROMENTRY']._serialized_start=321
+  _globals['_STREAMPROCESSVALUESREQUEST_RESUMEFROMENTRY']._serialized_end=370
+  _globals['_GETPROCESSVALUESREQUEST']._serialized_start=372
+  _globals['_GETPROCESSVALUESREQUEST']._serialized_end=449
+  _globals['_GETHISTORYREQUEST']._serialized_start=452
+  _globals['_GETHISTORYREQUEST']._serialized_end=594
+  _globals['_PROCESSVALUES']._serialized_start=597
+  _globals['_PROCESSVALUES']._serialized_end=941
+  _globals['_PROCESSVALUESBATCH']._serialized_start=944
+  _globals['_PROCESSVALUESBATCH']._serialized_end=1255
+  _globals['_TOGGLEREMOTESETPOINTREQUEST']._serialized_start=1257
+  _globals['_TOGGLEREMOTESETPOINTREQUEST']._serialized_end=1343
+  _globals['_SETREMOTESETPOINTREQUEST']._serialized_start=1345
+  _globals['_SETREMOTESETPOINTREQUEST']._serialized_end=1406
+  _globals['_STARTTEMPERATURERAMPREQUEST']._serialized_start=1408
+  _globals['_STARTTEMPERATURERAMPREQUEST']._serialized_end=1487
+  _globals['_TEMPERATURERAMPVALUE']._serialized_start=1489
+  _globals['_TEMPERATURERAMPVALUE']._serialized_end=1548
+  _globals['_STOPTEMPERATURERAMPREQUEST']._serialized_start=1550
+  _globals['_STOPTEMPERATURERAMPREQUEST']._serialized_end=1598
+  _globals['_ACKNOWLEGDEALLALARMSREQUEST']._serialized_start=1600
+  _globals['_ACKNOWLEGDEALLALARMSREQUEST']._serialized_end=1649
+  _globals['_EUROTHERM']._serialized_start=1915
+  _globals['_EUROTHERM']._serialized_end=2609
 _builder.BuildServices(DESCRIPTOR, 'service_pb2', _globals)
 # @@protoc_insertion_point(module_scope)
@@ -8,6 +8,7 @@ import builtins
 import collections.abc
 import concurrent.futures
 import google.protobuf.descriptor
+import google.protobuf.internal.containers
 import google.protobuf.internal.enum_type_wrapper
 import google.protobuf.message
 import google.protobuf.service
@@ -22,6 +23,37 @@ else:
 
 DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
 
+class _OverflowPolicy:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _OverflowPolicyEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_OverflowPolicy.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    OVERFLOW_DEFAULT: _OverflowPolicy.ValueType  # 0
+    """policy configured on the server"""
+    DROP_OLDEST: _OverflowPolicy.ValueType  # 1
+    DROP_NEWEST: _OverflowPolicy.ValueType  # 2
+    COALESCE: _OverflowPolicy.ValueType  # 3
+    """keep the latest samples of each device; batched streams of the
+    threaded servicer fall back to DROP_OLDEST (the asyncio servicer
+    coalesces batched streams as well)
+    """
+    DISCONNECT: _OverflowPolicy.ValueType  # 4
+
+class OverflowPolicy(_OverflowPolicy, metaclass=_OverflowPolicyEnumTypeWrapper): ...
+
+OVERFLOW_DEFAULT: OverflowPolicy.ValueType  # 0
+"""policy configured on the server"""
+DROP_OLDEST: OverflowPolicy.ValueType  # 1
+DROP_NEWEST: OverflowPolicy.ValueType  # 2
+COALESCE: OverflowPolicy.ValueType  # 3
+"""keep the latest samples of each device; batched streams of the
+threaded servicer fall back to DROP_OLDEST (the asyncio servicer
+coalesces batched streams as well)
+"""
+DISCONNECT: OverflowPolicy.ValueType  # 4
+global___OverflowPolicy = OverflowPolicy
+
 class _TemperatureRampState:
     ValueType = typing.NewType("ValueType", builtins.int)
     V: typing_extensions.TypeAlias = ValueType
@@ -82,9 +114,65 @@ global___StopRequest = StopRequest
 class StreamProcessValuesRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
 
+    @typing.final
+    class ResumeFromEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.str
+        value: builtins.int
+        def __init__(
+            self,
+            *,
+            key: builtins.str = ...,
+            value: builtins.int = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+    DEVICENAMES_FIELD_NUMBER: builtins.int
+    MAXRATE_FIELD_NUMBER: builtins.int
+    DECIMATION_FIELD_NUMBER: builtins.int
+    FIELDS_FIELD_NUMBER: builtins.int
+    BATCHSIZE_FIELD_NUMBER: builtins.int
+    BATCHINTERVAL_FIELD_NUMBER: builtins.int
+    RESUMEFROM_FIELD_NUMBER: builtins.int
+    OVERFLOW_FIELD_NUMBER: builtins.int
+    maxRate: builtins.float
+    """maximum rate per device [Hz] (0 = unlimited)"""
+    decimation: builtins.int
+    """only send every n-th sample per device (0 = all)"""
+    batchSize: builtins.int
+    """maximum number of samples per batch (batched stream only)"""
+    batchInterval: builtins.float
+    """maximum time span of a batch [s] (batched stream only)"""
+    overflow: global___OverflowPolicy.ValueType
+    """if the client does not keep up"""
+    @property
+    def deviceNames(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]:
+        """devices to stream (empty = all devices)"""
+
+    @property
+    def fields(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]:
+        """fields to send (empty = all fields)"""
+
+    @property
+    def resumeFrom(self) -> google.protobuf.internal.containers.ScalarMap[builtins.str, builtins.int]:
+        """replay buffered samples with a higher sequence number (per device) first"""
+
     def __init__(
         self,
+        *,
+        deviceNames: collections.abc.Iterable[builtins.str] | None = ...,
+        maxRate: builtins.float = ...,
+        decimation: builtins.int = ...,
+        fields: collections.abc.Iterable[builtins.str] | None = ...,
+        batchSize: builtins.int = ...,
+        batchInterval: builtins.float = ...,
+        resumeFrom: collections.abc.Mapping[builtins.str, builtins.int] | None = ...,
+        overflow: global___OverflowPolicy.ValueType = ...,
     ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["batchInterval", b"batchInterval", "batchSize", b"batchSize", "decimation", b"decimation", "deviceNames", b"deviceNames", "fields", b"fields", "maxRate", b"maxRate", "overflow", b"overflow", "resumeFrom", b"resumeFrom"]) -> None: ...
 
 global___StreamProcessValuesRequest = StreamProcessValuesRequest
 
@@ -93,16 +181,54 @@ class GetProcessValuesRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
 
     DEVICENAME_FIELD_NUMBER: builtins.int
+    MAXAGE_FIELD_NUMBER: builtins.int
     deviceName: builtins.str
+    maxAge: builtins.float
+    """maximum age of cached values [s]"""
     def __init__(
         self,
         *,
         deviceName: builtins.str = ...,
+        maxAge: builtins.float | None = ...,
     ) -> None: ...
-    def ClearField(self, field_name: typing.Literal["deviceName", b"deviceName"]) -> None: ...
+    def HasField(self, field_name: typing.Literal["_maxAge", b"_maxAge", "maxAge", b"maxAge"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["_maxAge", b"_maxAge", "deviceName", b"deviceName", "maxAge", b"maxAge"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing.Literal["_maxAge", b"_maxAge"]) -> typing.Literal["maxAge"] | None: ...
 
 global___GetProcessValuesRequest = GetProcessValuesRequest
 
+@typing.final
+class GetHistoryRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DEVICENAME_FIELD_NUMBER: builtins.int
+    START_FIELD_NUMBER: builtins.int
+    END_FIELD_NUMBER: builtins.int
+    MAXPOINTS_FIELD_NUMBER: builtins.int
+    deviceName: builtins.str
+    maxPoints: builtins.int
+    """maximum number of samples (0 = all samples)"""
+    @property
+    def start(self) -> google.protobuf.timestamp_pb2.Timestamp:
+        """(unset = oldest recorded sample)"""
+
+    @property
+    def end(self) -> google.protobuf.timestamp_pb2.Timestamp:
+        """(unset = most recent sample)"""
+
+    def __init__(
+        self,
+        *,
+        deviceName: builtins.str = ...,
+        start: google.protobuf.timestamp_pb2.Timestamp | None = ...,
+        end: google.protobuf.timestamp_pb2.Timestamp | None = ...,
+        maxPoints: builtins.int = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["end", b"end", "start", b"start"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["deviceName", b"deviceName", "end", b"end", "maxPoints", b"maxPoints", "start", b"start"]) -> None: ...
+
+global___GetHistoryRequest = GetHistoryRequest
+
 @typing.final
 class ProcessValues(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -116,6 +242,9 @@ class ProcessValues(google.protobuf.message.Message):
     REMOTESETPOINT_FIELD_NUMBER: builtins.int
     WORKINGOUTPUT_FIELD_NUMBER: builtins.int
     RAMPSTATUS_FIELD_NUMBER: builtins.int
+    SCHEDULEDTIMESTAMP_FIELD_NUMBER: builtins.int
+    SEQUENCE_FIELD_NUMBER: builtins.int
+    DROPPED_FIELD_NUMBER: builtins.int
     deviceName: builtins.str
     status: builtins.int
     processValue: builtins.float
@@ -124,8 +253,16 @@ class ProcessValues(google.protobuf.message.Message):
     remoteSetpoint: builtins.float
     workingOutput: builtins.float
     rampStatus: global___TemperatureRampState.ValueType
+    sequence: builtins.int
+    """sample number (per device, starting at 1)"""
+    dropped: builtins.int
+    """samples dropped from this stream so far"""
     @property
     def timestamp(self) -> google.protobuf.timestamp_pb2.Timestamp: ...
+    @property
+    def scheduledTimestamp(self) -> google.protobuf.timestamp_pb2.Timestamp:
+        """scheduled sampling time"""
+
     def __init__(
         self,
         *,
@@ -138,12 +275,85 @@ class ProcessValues(google.protobuf.message.Message):
         remoteSetpoint: builtins.float = ...,
         workingOutput: builtins.float = ...,
         rampStatus: global___TemperatureRampState.ValueType = ...,
+        scheduledTimestamp: google.protobuf.timestamp_pb2.Timestamp | None = ...,
+        sequence: builtins.int = ...,
+        dropped: builtins.int = ...,
     ) -> None: ...
-    def HasField(self, field_name: typing.Literal["timestamp", b"timestamp"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing.Literal["deviceName", b"deviceName", "processValue", b"processValue", "rampStatus", b"rampStatus", "remoteSetpoint", b"remoteSetpoint", "setpoint", b"setpoint", "status", b"status", "timestamp", b"timestamp", "workingOutput", b"workingOutput", "workingSetpoint", b"workingSetpoint"]) -> None: ...
+    def HasField(self, field_name: typing.Literal["scheduledTimestamp", b"scheduledTimestamp", "timestamp", b"timestamp"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["deviceName", b"deviceName", "dropped", b"dropped", "processValue", b"processValue", "rampStatus", b"rampStatus", "remoteSetpoint", b"remoteSetpoint", "scheduledTimestamp", b"scheduledTimestamp", "sequence", b"sequence", "setpoint", b"setpoint", "status", b"status", "timestamp", b"timestamp", "workingOutput", b"workingOutput", "workingSetpoint", b"workingSetpoint"]) -> None: ...
 
 global___ProcessValues = ProcessValues
 
+@typing.final
+class ProcessValuesBatch(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DEVICES_FIELD_NUMBER: builtins.int
+    DEVICEINDEX_FIELD_NUMBER: builtins.int
+    TIMESTAMP_FIELD_NUMBER: builtins.int
+    STATUS_FIELD_NUMBER: builtins.int
+    PROCESSVALUE_FIELD_NUMBER: builtins.int
+    SETPOINT_FIELD_NUMBER: builtins.int
+    WORKINGSETPOINT_FIELD_NUMBER: builtins.int
+    REMOTESETPOINT_FIELD_NUMBER: builtins.int
+    WORKINGOUTPUT_FIELD_NUMBER: builtins.int
+    RAMPSTATUS_FIELD_NUMBER: builtins.int
+    SCHEDULEDTIMESTAMP_FIELD_NUMBER: builtins.int
+    SEQUENCE_FIELD_NUMBER: builtins.int
+    DROPPED_FIELD_NUMBER: builtins.int
+    dropped: builtins.int
+    """samples dropped from this stream so far"""
+    @property
+    def devices(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]:
+        """device names referenced by deviceIndex"""
+
+    @property
+    def deviceIndex(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]: ...
+    @property
+    def timestamp(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]:
+        """[µs] since epoch"""
+
+    @property
+    def status(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]: ...
+    @property
+    def processValue(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]: ...
+    @property
+    def setpoint(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]: ...
+    @property
+    def workingSetpoint(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]: ...
+    @property
+    def remoteSetpoint(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]: ...
+    @property
+    def workingOutput(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]: ...
+    @property
+    def rampStatus(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[global___TemperatureRampState.ValueType]: ...
+    @property
+    def scheduledTimestamp(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]:
+        """[µs] since epoch (0 = unknown)"""
+
+    @property
+    def sequence(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]: ...
+    def __init__(
+        self,
+        *,
+        devices: collections.abc.Iterable[builtins.str] | None = ...,
+        deviceIndex: collections.abc.Iterable[builtins.int] | None = ...,
+        timestamp: collections.abc.Iterable[builtins.int] | None = ...,
+        status: collections.abc.Iterable[builtins.int] | None = ...,
+        processValue: collections.abc.Iterable[builtins.float] | None = ...,
+        setpoint: collections.abc.Iterable[builtins.float] | None = ...,
+        workingSetpoint: collections.abc.Iterable[builtins.float] | None = ...,
+        remoteSetpoint: collections.abc.Iterable[builtins.float] | None = ...,
+        workingOutput: collections.abc.Iterable[builtins.float] | None = ...,
+        rampStatus: collections.abc.Iterable[global___TemperatureRampState.ValueType] | None = ...,
+        scheduledTimestamp: collections.abc.Iterable[builtins.int] | None = ...,
+        sequence: collections.abc.Iterable[builtins.int] | None = ...,
+        dropped: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["deviceIndex", b"deviceIndex", "devices", b"devices", "dropped", b"dropped", "processValue", b"processValue", "rampStatus", b"rampStatus", "remoteSetpoint", b"remoteSetpoint", "scheduledTimestamp", b"scheduledTimestamp", "sequence", b"sequence", "setpoint", b"setpoint", "status", b"status", "timestamp", b"timestamp", "workingOutput", b"workingOutput", "workingSetpoint", b"workingSetpoint"]) -> None: ...
+
+global___ProcessValuesBatch = ProcessValuesBatch
+
 @typing.final
 class ToggleRemoteSetpointRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -282,6 +492,15 @@ class Eurotherm(google.protobuf.service.Service, metaclass=abc.ABCMeta):
     ) -> concurrent.futures.Future[global___ProcessValues]:
         """stream process values"""
 
+    @abc.abstractmethod
+    def StreamProcessValuesBatched(
+        inst: Eurotherm,  # pyright: ignore[reportSelfClsParameterName]
+        rpc_controller: google.protobuf.service.RpcController,
+        request: global___StreamProcessValuesRequest,
+        callback: collections.abc.Callable[[global___ProcessValuesBatch], None] | None,
+    ) -> concurrent.futures.Future[global___ProcessValuesBatch]:
+        """stream batches of process values (packed arrays)"""
+
     @abc.abstractmethod
     def GetProcessValues(
         inst: Eurotherm,  # pyright: ignore[reportSelfClsParameterName]
@@ -291,6 +510,19 @@ class Eurotherm(google.protobuf.service.Service, metaclass=abc.ABCMeta):
     ) -> concurrent.futures.Future[global___ProcessValues]:
         """current process values"""
 
+    @abc.abstractmethod
+    def GetHistory(
+        inst: Eurotherm,  # pyright: ignore[reportSelfClsParameterName]
+        rpc_controller: google.protobuf.service.RpcController,
+        request: global___GetHistoryRequest,
+        callback: collections.abc.Callable[[global___ProcessValuesBatch], None] | None,
+    ) -> concurrent.futures.Future[global___ProcessValuesBatch]:
+        """recorded process values of a device (packed arrays); samples older than
+        the server's buffer are read from the data log files written by the
+        running server process only, and with several devices only if the
+        logged columns include deviceName (not part of the default columns)
+        """
+
     @abc.abstractmethod
     def ToggleRemoteSetpoint(
         inst: Eurotherm,  # pyright: ignore[reportSelfClsParameterName]
@@ -363,6 +595,14 @@ class Eurotherm_Stub(Eurotherm):
     ) -> concurrent.futures.Future[global___ProcessValues]:
         """stream process values"""
 
+    def StreamProcessValuesBatched(
+        inst: Eurotherm_Stub,  # pyright: ignore[reportSelfClsParameterName]
+        rpc_controller: google.protobuf.service.RpcController,
+        request: global___StreamProcessValuesRequest,
+        callback: collections.abc.Callable[[global___ProcessValuesBatch], None] | None = ...,
+    ) -> concurrent.futures.Future[global___ProcessValuesBatch]:
+        """stream batches of process values (packed arrays)"""
+
     def GetProcessValues(
         inst: Eurotherm_Stub,  # pyright: ignore[reportSelfClsParameterName]
         rpc_controller: google.protobuf.service.RpcController,
@@ -371,6 +611,18 @@ class Eurotherm_Stub(Eurotherm):
     ) -> concurrent.futures.Future[global___ProcessValues]:
         """current process values"""
 
+    def GetHistory(
+        inst: Eurotherm_Stub,  # pyright: ignore[reportSelfClsParameterName]
+        rpc_controller: google.protobuf.service.RpcController,
+        request: global___GetHistoryRequest,
+        callback: collections.abc.Callable[[global___ProcessValuesBatch], None] | None = ...,
+    ) -> concurrent.futures.Future[global___ProcessValuesBatch]:
+        """recorded process values of a device (packed arrays); samples older than
+        the server's buffer are read from the data log files written by the
+        running server process only, and with several devices only if the
+        logged columns include deviceName (not part of the default columns)
+        """
+
     def ToggleRemoteSetpoint(
         inst: Eurotherm_Stub,  # pyright: ignore[reportSelfClsParameterName]
         rpc_controller: google.protobuf.service.RpcController,
@@ -54,11 +54,21 @@ class EurothermStub(object):
                 request_serializer=service__pb2.StreamProcessValuesRequest.SerializeToString,
                 response_deserializer=service__pb2.ProcessValues.FromString,
                 _registered_method=True)
+        self.StreamProcessValuesBatched = channel.unary_stream(
+                '/Eurotherm/StreamProcessValuesBatched',
+                request_serializer=service__pb2.StreamProcessValuesRequest.SerializeToString,
+                response_deserializer=service__pb2.ProcessValuesBatch.FromString,
+                _registered_method=True)
         self.GetProcessValues = channel.unary_unary(
                 '/Eurotherm/GetProcessValues',
                 request_serializer=service__pb2.GetProcessValuesRequest.SerializeToString,
                 response_deserializer=service__pb2.ProcessValues.FromString,
                 _registered_method=True)
+        self.GetHistory = channel.unary_unary(
+                '/Eurotherm/GetHistory',
+                request_serializer=service__pb2.GetHistoryRequest.SerializeToString,
+                response_deserializer=service__pb2.ProcessValuesBatch.FromString,
+                _registered_method=True)
         self.ToggleRemoteSetpoint = channel.unary_unary(
                 '/Eurotherm/ToggleRemoteSetpoint',
                 request_serializer=service__pb2.ToggleRemoteSetpointRequest.SerializeToString,
@@ -110,6 +120,13 @@ class EurothermServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamProcessValuesBatched(self, request, context):
+        """stream batches of process values (packed arrays)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetProcessValues(self, request, context):
         """current process values
         """
@@ -117,6 +134,16 @@ class EurothermServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetHistory(self, request, context):
+        """recorded process values of a device (packed arrays); samples older than
+        the server's buffer are read from the data log files written by the
+        running server process only, and with several devices only if the
+        logged columns include deviceName (not part of the default columns)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ToggleRemoteSetpoint(self, request, context):
         """enable/disable remote setpoint
         """
@@ -170,11 +197,21 @@ def add_EurothermServicer_to_server(servicer, server):
                     request_deserializer=service__pb2.StreamProcessValuesRequest.FromString,
                     response_serializer=service__pb2.ProcessValues.SerializeToString,
             ),
+            'StreamProcessValuesBatched': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamProcessValuesBatched,
+                    request_deserializer=service__pb2.StreamProcessValuesRequest.FromString,
+                    response_serializer=service__pb2.ProcessValuesBatch.SerializeToString,
+            ),
             'GetProcessValues': grpc.unary_unary_rpc_method_handler(
                     servicer.GetProcessValues,
                     request_deserializer=service__pb2.GetProcessValuesRequest.FromString,
                     response_serializer=service__pb2.ProcessValues.SerializeToString,
             ),
+            'GetHistory': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetHistory,
+                    request_deserializer=service__pb2.GetHistoryRequest.FromString,
+                    response_serializer=service__pb2.ProcessValuesBatch.SerializeToString,
+            ),
             'ToggleRemoteSetpoint': grpc.unary_unary_rpc_method_handler(
                     servicer.ToggleRemoteSetpoint,
                     request_deserializer=service__pb2.ToggleRemoteSetpointRequest.FromString,
@@ -292,6 +329,33 @@ class Eurotherm(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamProcessValuesBatched(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/Eurotherm/StreamProcessValuesBatched',
+            service__pb2.StreamProcessValuesRequest.SerializeToString,
+            service__pb2.ProcessValuesBatch.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetProcessValues(request,
             target,
@@ -319,6 +383,33 @@ class Eurotherm(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetHistory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Eurotherm/GetHistory',
+            service__pb2.GetHistoryRequest.SerializeToString,
+            service__pb2.ProcessValuesBatch.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def ToggleRemoteSetpoint(request,
             target,
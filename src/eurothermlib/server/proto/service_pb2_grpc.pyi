@@ -37,12 +37,28 @@ class EurothermStub:
     ]
     """stream process values"""
 
+    StreamProcessValuesBatched: grpc.UnaryStreamMultiCallable[
+        service_pb2.StreamProcessValuesRequest,
+        service_pb2.ProcessValuesBatch,
+    ]
+    """stream batches of process values (packed arrays)"""
+
     GetProcessValues: grpc.UnaryUnaryMultiCallable[
         service_pb2.GetProcessValuesRequest,
         service_pb2.ProcessValues,
     ]
     """current process values"""
 
+    GetHistory: grpc.UnaryUnaryMultiCallable[
+        service_pb2.GetHistoryRequest,
+        service_pb2.ProcessValuesBatch,
+    ]
+    """recorded process values of a device (packed arrays); samples older than
+    the server's buffer are read from the data log files written by the
+    running server process only, and with several devices only if the
+    logged columns include deviceName (not part of the default columns)
+    """
+
     ToggleRemoteSetpoint: grpc.UnaryUnaryMultiCallable[
         service_pb2.ToggleRemoteSetpointRequest,
         service_pb2.Empty,
@@ -92,12 +108,28 @@ class EurothermAsyncStub:
     ]
     """stream process values"""
 
+    StreamProcessValuesBatched: grpc.aio.UnaryStreamMultiCallable[
+        service_pb2.StreamProcessValuesRequest,
+        service_pb2.ProcessValuesBatch,
+    ]
+    """stream batches of process values (packed arrays)"""
+
     GetProcessValues: grpc.aio.UnaryUnaryMultiCallable[
         service_pb2.GetProcessValuesRequest,
         service_pb2.ProcessValues,
     ]
     """current process values"""
 
+    GetHistory: grpc.aio.UnaryUnaryMultiCallable[
+        service_pb2.GetHistoryRequest,
+        service_pb2.ProcessValuesBatch,
+    ]
+    """recorded process values of a device (packed arrays); samples older than
+    the server's buffer are read from the data log files written by the
+    running server process only, and with several devices only if the
+    logged columns include deviceName (not part of the default columns)
+    """
+
     ToggleRemoteSetpoint: grpc.aio.UnaryUnaryMultiCallable[
         service_pb2.ToggleRemoteSetpointRequest,
         service_pb2.Empty,
@@ -153,6 +185,14 @@ class EurothermServicer(metaclass=abc.ABCMeta):
     ) -> typing.Union[collections.abc.Iterator[service_pb2.ProcessValues], collections.abc.AsyncIterator[service_pb2.ProcessValues]]:
         """stream process values"""
 
+    @abc.abstractmethod
+    def StreamProcessValuesBatched(
+        self,
+        request: service_pb2.StreamProcessValuesRequest,
+        context: _ServicerContext,
+    ) -> typing.Union[collections.abc.Iterator[service_pb2.ProcessValuesBatch], collections.abc.AsyncIterator[service_pb2.ProcessValuesBatch]]:
+        """stream batches of process values (packed arrays)"""
+
     @abc.abstractmethod
     def GetProcessValues(
         self,
@@ -161,6 +201,18 @@ class EurothermServicer(metaclass=abc.ABCMeta):
     ) -> typing.Union[service_pb2.ProcessValues, collections.abc.Awaitable[service_pb2.ProcessValues]]:
         """current process values"""
 
+    @abc.abstractmethod
+    def GetHistory(
+        self,
+        request: service_pb2.GetHistoryRequest,
+        context: _ServicerContext,
+    ) -> typing.Union[service_pb2.ProcessValuesBatch, collections.abc.Awaitable[service_pb2.ProcessValuesBatch]]:
+        """recorded process values of a device (packed arrays); samples older than
+        the server's buffer are read from the data log files written by the
+        running server process only, and with several devices only if the
+        logged columns include deviceName (not part of the default columns)
+        """
+
     @abc.abstractmethod
     def ToggleRemoteSetpoint(
         self,
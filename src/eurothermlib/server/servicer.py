@@ -1,30 +1,215 @@
 from _collections_abc import Awaitable
 import logging
 import threading
+from collections import deque
 from concurrent import futures
+from datetime import datetime, timedelta
 from queue import Empty as EmptyError
 from queue import Queue
+from typing import Any, Callable, Deque, Dict, Iterable, List, Mapping, Optional
 
 import grpc
+import numpy as np
+import reactivex
 import reactivex.operators as op
 
 from eurothermlib.controllers.controller import RemoteSetpointState
-from eurothermlib.utils import TemperatureQ, TemperatureRateQ
+from eurothermlib.utils import FrequencyQ, TemperatureQ, TemperatureRateQ, TimeQ
 
-from ..configuration import Config, ServerConfig
-from .acquisition import EurothermIO, TData
+from ..configuration import Config, OverflowPolicy, ServerConfig
+from ..logging import DataLoggerSink
+from . import history
+from .acquisition import GRPC_FIELDS, EurothermIO, TData
+from .async_acquisition import AsyncEurothermIO
 from .proto import service_pb2, service_pb2_grpc
 
 logger = logging.getLogger(__name__)
 
+OVERFLOW_POLICIES: Dict[int, OverflowPolicy] = {
+    service_pb2.OverflowPolicy.DROP_OLDEST: 'drop-oldest',
+    service_pb2.OverflowPolicy.DROP_NEWEST: 'drop-newest',
+    service_pb2.OverflowPolicy.COALESCE: 'coalesce',
+    service_pb2.OverflowPolicy.DISCONNECT: 'disconnect',
+}
+
+
+class StreamFilter:
+    """Selects the samples (and fields) requested by a stream client."""
+
+    def __init__(self, request: service_pb2.StreamProcessValuesRequest):
+        self.devices = set(request.deviceNames)
+        self.min_interval = 1.0 / request.maxRate if request.maxRate > 0 else 0.0
+        self.decimation = max(1, request.decimation)
+        self.fields = list(request.fields) or None
+        self._counter: Dict[str, int] = {}
+        self._last: Dict[str, datetime] = {}
+
+        if self.fields is not None:
+            unknown = set(self.fields) - set(GRPC_FIELDS)
+            if unknown:
+                raise ValueError(f'Unknown process value fields: {sorted(unknown)}')
+
+    def __call__(self, data: TData) -> bool:
+        name = data.deviceName
+        if self.devices and (name not in self.devices):
+            return False
+
+        # decimation
+        count = self._counter.get(name, 0)
+        self._counter[name] = count + 1
+        if count % self.decimation:
+            return False
+
+        # rate limit (based on the scheduled sampling time, if available)
+        if self.min_interval:
+            timestamp = data.scheduledTimestamp or data.timestamp
+            last = self._last.get(name)
+            if last is not None:
+                elapsed = (timestamp - last).total_seconds()
+                if elapsed < self.min_interval - 1e-3:
+                    return False
+            self._last[name] = timestamp
+
+        return True
+
+
+class StreamQueue:
+    """Bounded queue between the acquisition engine and one stream client.
+
+    If the client does not keep up, the queue applies its overflow policy
+    instead of growing: 'drop-oldest' and 'drop-newest' discard samples,
+    'coalesce' replaces the oldest queued sample of the same device (so
+    that the client still receives the latest values of every device) and
+    'disconnect' stops the stream. Dropped samples are counted.
+
+    Items are either samples or (if `batched`) lists of samples. Batches
+    are not coalesced: with 'coalesce', the oldest batch is dropped instead
+    (as with 'drop-oldest').
+    """
+
+    def __init__(self, maxsize: int, policy: OverflowPolicy, batched: bool = False):
+        self.maxsize = maxsize
+        self.policy = policy
+        self.batched = batched
+        self.dropped = 0  # number of dropped samples
+        self.overflowed = False  # set by the 'disconnect' policy
+        self._items: Deque[Any] = deque()
+        self._condition = threading.Condition()
+
+    def __len__(self):
+        return len(self._items)
+
+    def put(self, item: Any):
+        with self._condition:
+            if self.overflowed:
+                return
+            if len(self._items) >= self.maxsize:
+                match self.policy:
+                    case 'drop-newest':
+                        self._drop(item)
+                        return
+                    case 'coalesce' if not self.batched:
+                        self._drop(self._coalesce(item))
+                    case 'disconnect':
+                        self.overflowed = True
+                        self._items.clear()
+                        self._condition.notify_all()
+                        return
+                    case _:
+                        self._drop(self._items.popleft())
+            self._items.append(item)
+            self._condition.notify()
+
+    def get(self, timeout: float):
+        """Remove and return the oldest item (raises `queue.Empty`)."""
+        with self._condition:
+            if not self._items and not self.overflowed:
+                self._condition.wait(timeout)
+            if not self._items:
+                raise EmptyError
+            return self._items.popleft()
+
+    def _coalesce(self, data: TData):
+        # remove the oldest queued sample of the device (or the oldest sample)
+        for index, item in enumerate(self._items):
+            if item.deviceName == data.deviceName:
+                del self._items[index]
+                return item
+        return self._items.popleft()
+
+    def _drop(self, item: Any):
+        if self.dropped == 0:
+            logger.warning(
+                f'Stream client does not keep up: dropping samples '
+                f'(policy={self.policy}, queue size={self.maxsize})'
+            )
+        self.dropped += len(item) if self.batched else 1
+
+
+class ResumeGate:
+    """Replays buffered samples before passing on live samples.
+
+    Live samples arriving during the replay are held back, and live samples
+    that have already been replayed are dropped. Thereby, a resumed stream
+    contains every sample exactly once and in order.
+    """
+
+    def __init__(self, resume_from: Mapping[str, int], sink: Callable[[TData], None]):
+        self.resume_from = dict(resume_from)
+        self.sink = sink
+        self._lock = threading.Lock()
+        self._pending: Optional[List[TData]] = []  # None after the replay
+        self._last: Dict[str, int] = {}  # last replayed sample of each device
+
+    def on_next(self, data: TData):
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(data)
+            elif data.sequence > self._last.get(data.deviceName, 0):
+                self.sink(data)
+
+    def replay(self, history: Callable[[str], np.ndarray]):
+        """Pass on the buffered samples following `resume_from`."""
+        # live samples are only held back (not passed on) until the replay
+        # has finished, so the lock is not needed while replaying
+        for device, sequence in self.resume_from.items():
+            records = history(device)
+            records = records[records['sequence'] > sequence]
+            if len(records) == 0:
+                continue
+            self._last[device] = int(records['sequence'][-1])
+            logger.info(
+                f'[{repr(device)}] Resuming stream after sample {sequence} '
+                f'(replaying {len(records)} samples)'
+            )
+            for data in TData.from_history(device, records):
+                self.sink(data)
+
+        with self._lock:
+            pending, self._pending = self._pending, None
+            for data in pending:
+                if data.sequence > self._last.get(data.deviceName, 0):
+                    self.sink(data)
+
 
 class EurothermServicer(service_pb2_grpc.EurothermServicer):
-    def __init__(self, cfg: Config) -> None:
+    def __init__(self, cfg: Config, log_data: bool = False) -> None:
         super().__init__()
+        self.cfg = cfg
         self.stop_event = threading.Event()
-        self.io = EurothermIO(cfg.devices)
+        match cfg.server.acquisition:
+            case 'asyncio':
+                self.io: EurothermIO = AsyncEurothermIO(cfg.devices)
+            case _:
+                self.io = EurothermIO(cfg.devices)
         self.io.start()
 
+        # log process values directly from the acquisition engine
+        self.data_logger: Optional[DataLoggerSink] = None
+        if log_data:
+            self.data_logger = DataLoggerSink(cfg.logging, to_frame=TData.to_frame)
+            self.data_logger.attach(self.io.observable)
+
     def StopServer(
         self,
         request: service_pb2.StopRequest,
@@ -32,6 +217,8 @@ class EurothermServicer(service_pb2_grpc.EurothermServicer):
     ):
         logger.info('[Request] StopServer')
         self.io.stop()  # stop data acquisition
+        if self.data_logger is not None:
+            self.data_logger.close()  # write remaining process values
         self.stop_event.set()
         return service_pb2.Empty()
 
@@ -43,20 +230,25 @@ class EurothermServicer(service_pb2_grpc.EurothermServicer):
         logger.info('[Request] ServerHealthCheck')
         return service_pb2.Empty()
 
-    def StreamProcessValues(
-        self,
-        request: service_pb2.StreamProcessValuesRequest,
-        context: grpc.ServicerContext,
-    ):
-        logger.info('[Request] StreamTemperatures')
+    def _stream(self, request, context, convert, *operators, batched=False):
+        # stream (filtered and optionally batched) process values
+        try:
+            stream_filter = StreamFilter(request)
+        except ValueError as ex:
+            logger.error(ex)
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(ex))
 
         # start acquisition thread if necessary
         self.io.start()
 
-        # place streamed values into a synchronized queue
+        # place streamed values into a bounded synchronized queue
         # (this works because the observable emits all values
         # on a different ThreadPool thread)
-        q = Queue[TData]()
+        q = StreamQueue(
+            self.cfg.server.stream_queue_size,
+            OVERFLOW_POLICIES.get(request.overflow, self.cfg.server.stream_overflow),
+            batched=batched,
+        )
         finished = threading.Event()
 
         def errored(e: Exception):
@@ -69,14 +261,25 @@ class EurothermServicer(service_pb2_grpc.EurothermServicer):
             logger.error(ex)
             return
 
-        subscription = observable.subscribe(
+        # live samples pass through a gate, which replays buffered samples
+        # first (if the client resumes a stream)
+        source = reactivex.Subject[TData]()
+        pipeline = source.pipe(op.filter(stream_filter), *operators)
+        subscription = pipeline.subscribe(
             q.put,
             on_completed=finished.set,
             on_error=errored,
         )
+        gate = ResumeGate(request.resumeFrom, source.on_next)
+        live = observable.subscribe(
+            gate.on_next,
+            on_completed=source.on_completed,
+            on_error=source.on_error,
+        )
+        gate.replay(self.io.history)
 
         def cancel():
-            return finished.is_set() or self.stop_event.is_set()
+            return finished.is_set() or self.stop_event.is_set() or q.overflowed
 
         try:
             logger.info('Starting stream...')
@@ -84,16 +287,59 @@ class EurothermServicer(service_pb2_grpc.EurothermServicer):
                 try:
                     da = q.get(timeout=5)
                     # _logger.info(f'Yielding at {timestamp}')
-                    yield da.to_grpc_response()
+                    response = convert(da, stream_filter.fields)
+                    response.dropped = q.dropped
+                    yield response
                 except EmptyError:
                     pass
         except Exception as ex:
             logger.error(ex)
         finally:
             # dispose subscription once iteration completes or terminates
+            live.dispose()
             subscription.dispose()
             logger.info('...stream stopped.')
 
+        if q.overflowed:
+            logger.warning('Stream client does not keep up: stream closed')
+            context.abort(
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+                f'Stream queue overflow (queue size={q.maxsize})',
+            )
+
+    def StreamProcessValues(
+        self,
+        request: service_pb2.StreamProcessValuesRequest,
+        context: grpc.ServicerContext,
+    ):
+        logger.info('[Request] StreamTemperatures')
+        yield from self._stream(request, context, TData.to_grpc_response)
+
+    def StreamProcessValuesBatched(
+        self,
+        request: service_pb2.StreamProcessValuesRequest,
+        context: grpc.ServicerContext,
+    ):
+        logger.info('[Request] StreamProcessValuesBatched')
+
+        size = request.batchSize
+        interval = timedelta(seconds=request.batchInterval or 1.0)
+        if size and request.batchInterval:
+            batch = op.buffer_with_time_or_count(interval, size)
+        elif size:
+            batch = op.buffer_with_count(size)
+        else:
+            batch = op.buffer_with_time(interval)
+
+        yield from self._stream(
+            request,
+            context,
+            TData.to_grpc_batch,
+            batch,
+            op.filter(lambda items: len(items) > 0),
+            batched=True,
+        )
+
     def GetProcessValues(
         self,
         request: service_pb2.GetProcessValuesRequest,
@@ -109,15 +355,50 @@ class EurothermServicer(service_pb2_grpc.EurothermServicer):
         # start acquisition thread if necessary
         self.io.start()
 
-        observable = self.io.observable
-
-        values: TData = observable.pipe(
-            op.filter(lambda x: x.deviceName == request.deviceName),
-            op.take(1),
-        ).run()
+        max_age = request.maxAge if request.HasField('maxAge') else None
+        values = self.io.current_process_values(request.deviceName, max_age)
 
         return values.to_grpc_response()
 
+    def GetHistory(
+        self,
+        request: service_pb2.GetHistoryRequest,
+        context: grpc.ServicerContext,
+    ):
+        device = request.deviceName
+        start = request.start.ToDatetime() if request.HasField('start') else None
+        end = request.end.ToDatetime() if request.HasField('end') else None
+        logger.info(
+            f'[Request] [{repr(device)}] Get history ({start} to {end or "now"})'
+        )
+
+        # recent samples are served from the acquisition engine's buffer
+        records = history.select(self.io.history(device, since=start), end=end)
+
+        # older samples are read from the data log files (if any)
+        if start is not None and self.data_logger is not None:
+            buffered = records['timestamp'][0] if len(records) else None
+            if buffered is None or buffered > np.datetime64(start, 'us'):
+                logged = self._logged_history(device, start, end)
+                if buffered is not None:
+                    logged = logged[logged['timestamp'] < buffered]
+                records = np.concatenate([logged, records])
+
+        records = history.downsample(records, request.maxPoints)
+        return history.to_grpc_batch(device, records)
+
+    def _logged_history(
+        self, device: str, start: datetime, end: Optional[datetime]
+    ) -> np.ndarray:
+        # only files written by this process are read (FileDataLogger.files)
+        frame = self.data_logger.read(start, end)
+        if 'deviceName' in frame:
+            frame = frame[frame['deviceName'] == device]
+        elif [item.name for item in self.cfg.devices] != [device]:
+            # samples of several devices cannot be told apart
+            frame = frame.iloc[:0]
+        return history.from_frame(frame, frame.attrs['units'])
+
     def ToggleRemoteSetpoint(
         self,
         request: service_pb2.ToggleRemoteSetpointRequest,
@@ -241,6 +522,35 @@ class EurothermServicer(service_pb2_grpc.EurothermServicer):
         return service_pb2.Empty()
 
 
+class ProcessValuesStream:
+    """Iterator over streamed process values.
+
+    Keeps track of the number of samples the server dropped from the
+    stream because the client did not keep up.
+    """
+
+    def __init__(self, responses, convert: Callable[[Any], Any]):
+        self._responses = responses
+        self._convert = convert
+        self.dropped = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        response = next(self._responses)
+        if response.dropped > self.dropped:
+            logger.warning(
+                f'Server dropped {response.dropped - self.dropped} samples '
+                f'({response.dropped} in total)'
+            )
+            self.dropped = response.dropped
+        return self._convert(response)
+
+    def cancel(self):
+        self._responses.cancel()
+
+
 class EurothermClient:
     def __init__(self, channel: grpc.Channel, cfg: ServerConfig) -> None:
         self._client = service_pb2_grpc.EurothermStub(channel)
@@ -256,17 +566,110 @@ class EurothermClient:
     def is_alive(self):
         self._client.ServerHealthCheck(service_pb2.Empty(), timeout=self.timeout)
 
-    def stream_process_values(self):
-        request = service_pb2.StreamProcessValuesRequest()
-        for response in self._client.StreamProcessValues(request):
-            yield TData.from_grpc_response(response)
+    def stream_process_values(
+        self,
+        devices: Optional[Iterable[str]] = None,
+        max_rate: Optional[FrequencyQ] = None,
+        decimation: Optional[int] = None,
+        fields: Optional[Iterable[str]] = None,
+        resume_from: Optional[Mapping[str, int]] = None,
+        overflow: Optional[OverflowPolicy] = None,
+    ):
+        """Stream process values.
+
+        The server only sends samples of the given `devices`, at most
+        `max_rate` samples per second and device, and every `decimation`-th
+        sample. If `fields` is given, all other fields (besides `deviceName`,
+        `timestamp` and `sequence`) are left at their default values.
+
+        To resume an interrupted stream, pass the `sequence` of the last
+        received sample of each device as `resume_from`: the server first
+        replays the (still buffered) samples following it.
+
+        If the client does not keep up, the server applies the `overflow`
+        policy (default: configured on the server). The number of dropped
+        samples is available as the `dropped` attribute of the stream.
+        """
+        request = service_pb2.StreamProcessValuesRequest(
+            deviceNames=devices or [],
+            maxRate=max_rate.m_as('Hz') if max_rate is not None else 0.0,
+            decimation=decimation or 0,
+            fields=fields or [],
+            resumeFrom=resume_from or {},
+            overflow=_overflow_policy(overflow),
+        )
+        return ProcessValuesStream(
+            self._client.StreamProcessValues(request), TData.from_grpc_response
+        )
+
+    def stream_process_values_batched(
+        self,
+        devices: Optional[Iterable[str]] = None,
+        max_rate: Optional[FrequencyQ] = None,
+        decimation: Optional[int] = None,
+        fields: Optional[Iterable[str]] = None,
+        batch_size: Optional[int] = None,
+        batch_interval: Optional[TimeQ] = None,
+        resume_from: Optional[Mapping[str, int]] = None,
+        overflow: Optional[OverflowPolicy] = None,
+    ):
+        """Stream process values in batches (lists of samples).
+
+        A batch is sent when it contains `batch_size` samples or spans
+        `batch_interval` (default: 1s), whichever comes first. See
+        `stream_process_values` for the remaining arguments.
+        """
+        request = service_pb2.StreamProcessValuesRequest(
+            deviceNames=devices or [],
+            maxRate=max_rate.m_as('Hz') if max_rate is not None else 0.0,
+            decimation=decimation or 0,
+            fields=fields or [],
+            batchSize=batch_size or 0,
+            batchInterval=(
+                batch_interval.m_as('s') if batch_interval is not None else 0.0
+            ),
+            resumeFrom=resume_from or {},
+            overflow=_overflow_policy(overflow),
+        )
+        return ProcessValuesStream(
+            self._client.StreamProcessValuesBatched(request), TData.from_grpc_batch
+        )
 
-    def current_process_values(self, device: str):
+    def current_process_values(self, device: str, max_age: Optional[TimeQ] = None):
         logger.info(f'[{repr(device)}] Reading process values')
         request = service_pb2.GetProcessValuesRequest(deviceName=device)
+        if max_age is not None:
+            request.maxAge = max_age.m_as('s')
         response = self._client.GetProcessValues(request, timeout=self.timeout)
         return TData.from_grpc_response(response)
 
+    def get_history(
+        self,
+        device: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        max_points: Optional[int] = None,
+    ):
+        """Recorded process values of a device between `start` and `end`.
+
+        Without `start`, all samples buffered by the server are returned;
+        older samples are read from the data log files of the running server
+        (files of earlier server processes are not searched). If several
+        devices are configured, logged samples are only returned if the
+        logged columns include `deviceName`. If `max_points` is given, the
+        server returns an evenly spaced subset.
+        """
+        logger.info(f'[{repr(device)}] Reading history')
+        request = service_pb2.GetHistoryRequest(
+            deviceName=device, maxPoints=max_points or 0
+        )
+        if start is not None:
+            request.start.FromDatetime(start)
+        if end is not None:
+            request.end.FromDatetime(end)
+        response = self._client.GetHistory(request, timeout=self.timeout)
+        return TData.from_grpc_batch(response)
+
     def toggle_remote_setpoint(
         self,
         device: str,
@@ -322,6 +725,12 @@ class EurothermClient:
         )
 
 
+def _overflow_policy(policy: Optional[OverflowPolicy]) -> int:
+    if policy is None:
+        return service_pb2.OverflowPolicy.OVERFLOW_DEFAULT
+    return next(key for key, value in OVERFLOW_POLICIES.items() if value == policy)
+
+
 def is_alive(cfg: Config | ServerConfig):
     logger.info('Checking server health.')
     if isinstance(cfg, Config):
@@ -334,10 +743,15 @@ def is_alive(cfg: Config | ServerConfig):
         return False
 
 
-def serve(cfg: Config):
+def serve(cfg: Config, log_data: bool = False):
+    if cfg.server.servicer == 'asyncio':
+        from .async_servicer import serve_async
+
+        return serve_async(cfg, log_data=log_data)
+
     executor = futures.ThreadPoolExecutor()
     server = grpc.server(executor)
-    servicer = EurothermServicer(cfg)
+    servicer = EurothermServicer(cfg, log_data=log_data)
     service_pb2_grpc.add_EurothermServicer_to_server(servicer, server)
 
     server_address = f'{cfg.server.ip}:{cfg.server.port}'
@@ -0,0 +1,159 @@
+import itertools
+from concurrent import futures
+from dataclasses import dataclass, replace
+from typing import Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .pid import BatchPID
+from .plant import ThermalPlant
+
+METRICS = ['rise_time', 'overshoot', 'settling_time', 'iae']
+
+
+@dataclass
+class StepResponse:
+    """Metrics of the step responses of a set of loops (one value per loop).
+
+    Times are in s, infinite if the response never reaches the level
+    (rise time) or does not stay within the band until the end of the
+    simulation (settling time).
+    """
+
+    rise_time: np.ndarray  # from 10 % to 90 % of the step [s]
+    overshoot: np.ndarray  # maximum excess over the setpoint [% of the step]
+    settling_time: np.ndarray  # [s]
+    iae: np.ndarray  # integrated absolute error [K s]
+
+
+def parse_range(text: str) -> np.ndarray:
+    """Values given as a list (``a,b,c``) or range (``start:stop:num[:log]``).
+
+    Ranges include both ends and are spaced geometrically if ``log`` is
+    appended.
+    """
+    if ':' not in text:
+        return np.array([float(value) for value in text.split(',')])
+
+    match text.split(':'):
+        case [start, stop, num]:
+            return np.linspace(float(start), float(stop), int(num))
+        case [start, stop, num, 'log']:
+            return np.geomspace(float(start), float(stop), int(num))
+        case _:
+            raise ValueError(f'Invalid range (start:stop:num[:log]): {text}')
+
+
+def _run(
+    Kp, Ki, Kd, plant: ThermalPlant, setpoint: float, duration: float, dt: float
+) -> Iterator[Tuple[float, np.ndarray]]:
+    # step responses of loops heating a plant each (from the plant's state)
+    Kp, Ki, Kd = np.broadcast_arrays(*(np.atleast_1d(k) for k in (Kp, Ki, Kd)))
+    pid = BatchPID(
+        Kp, Ki, Kd, setpoint=setpoint, sample_time=None, output_limits=(0.0, 1.0)
+    )
+    plants = replace(plant, temperature=np.full(Kp.shape, float(plant.temperature)))
+
+    for k in range(1, int(round(duration / dt)) + 1):
+        output = pid(plants.temperature, dt=dt)
+        yield k * dt, plants.update(output, dt)
+
+
+def evaluate(
+    Kp,
+    Ki,
+    Kd,
+    plant: ThermalPlant,
+    setpoint: float,
+    duration: float,
+    dt: float = 1.0,
+    band: float = 0.02,
+) -> StepResponse:
+    """Simulates the step responses of loops with the tunings (Kp, Ki, Kd).
+
+    Every loop heats a `plant` of its own from its current temperature to
+    the `setpoint` [°C] (output limited to 0..1) for `duration` [s] in
+    steps of `dt`. The settling time is the time after which the response
+    stays within the `band` (relative to the step).
+    """
+    start = float(plant.temperature)
+    step = setpoint - start
+    if step == 0:
+        raise ValueError('The setpoint must differ from the start temperature')
+
+    rise_start = rise_end = last_outside = iae = peak = None
+    for time, temperature in _run(Kp, Ki, Kd, plant, setpoint, duration, dt):
+        if peak is None:
+            rise_start = np.full(temperature.shape, np.inf)
+            rise_end = np.full(temperature.shape, np.inf)
+            last_outside = np.zeros(temperature.shape)
+            iae = np.zeros(temperature.shape)
+            peak = np.full(temperature.shape, -np.inf)
+
+        # progress of the step (0 at the start, 1 at the setpoint)
+        progress = (temperature - start) / step
+        rise_start = np.where((progress >= 0.1) & (rise_start > time), time, rise_start)
+        rise_end = np.where((progress >= 0.9) & (rise_end > time), time, rise_end)
+        peak = np.maximum(peak, progress)
+        last_outside = np.where(np.abs(progress - 1) > band, time, last_outside)
+        iae += np.abs(setpoint - temperature) * dt
+
+    return StepResponse(
+        rise_time=rise_end - rise_start,
+        overshoot=100.0 * np.maximum(peak - 1, 0.0),
+        settling_time=np.where(last_outside >= duration, np.inf, last_outside),
+        iae=iae,
+    )
+
+
+def step_response(
+    Kp, Ki, Kd, plant: ThermalPlant, setpoint: float, duration: float, dt: float = 1.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Times [s] and temperatures [°C] (one column per loop) of step responses."""
+    times, temperatures = zip(*_run(Kp, Ki, Kd, plant, setpoint, duration, dt))
+    return np.array(times), np.array(temperatures)
+
+
+def _evaluate_frame(frame: pd.DataFrame, *args) -> pd.DataFrame:
+    response = evaluate(frame['Kp'], frame['Ki'], frame['Kd'], *args)
+    return frame.assign(**{name: getattr(response, name) for name in METRICS})
+
+
+def sweep(
+    Kp,
+    Ki,
+    Kd,
+    plant: ThermalPlant,
+    setpoint: float,
+    duration: float,
+    dt: float = 1.0,
+    band: float = 0.02,
+    workers: int = 1,
+) -> pd.DataFrame:
+    """Evaluates all combinations of the gains (see `evaluate`).
+
+    All candidates are simulated at once (vectorized). With more than one
+    worker, the candidates are split among a pool of processes.
+    """
+    grid = pd.DataFrame(list(itertools.product(Kp, Ki, Kd)), columns=['Kp', 'Ki', 'Kd'])
+    args = (plant, setpoint, duration, dt, band)
+    if workers <= 1:
+        return _evaluate_frame(grid, *args)
+
+    chunks = [grid.iloc[rows] for rows in np.array_split(range(len(grid)), workers)]
+    with futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_evaluate_frame, chunks, *([arg] * workers for arg in args))
+        return pd.concat(list(results))
+
+
+def best(results: pd.DataFrame, max_overshoot: float = 5.0, count: int = 10):
+    """The `count` tunings that settle first (ties: smallest IAE).
+
+    Only tunings which settle and overshoot at most `max_overshoot` [%] are
+    considered.
+    """
+    candidates = results[
+        (results['overshoot'] <= max_overshoot) & np.isfinite(results['settling_time'])
+    ]
+    return candidates.sort_values(['settling_time', 'iae']).head(count)
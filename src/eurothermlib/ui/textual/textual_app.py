@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timedelta
 from itertools import cycle
+from typing import Dict
 
+import grpc
 import reactivex as rx
 from reactivex import operators as op
 from reactivex.scheduler import ThreadPoolScheduler
@@ -26,6 +29,10 @@ thread_pool = ThreadPoolScheduler()
 
 UNITS = cycle(['°C', 'K'])
 
+# recorded process values shown when connecting to the server
+BACKFILL = timedelta(minutes=15)
+BACKFILL_POINTS = 900
+
 
 class EurothermApp(App):
     """A Textual app to manage stopwatches."""
@@ -44,6 +51,8 @@ class EurothermApp(App):
     def __init__(self, config: Config):
         super().__init__(watch_css=True)
         self.cfg = config
+        # sequence number of the last received sample of each device
+        self.sequences: Dict[str, int] = {}
 
     def connect_to_server(self):
         def on_error(ex: Exception = None):
@@ -52,7 +61,15 @@ class EurothermApp(App):
             )
 
         self.client = connect(self.cfg)
-        self.observable = rx.from_iterable(self.client.stream_process_values())
+        if not self.sequences:
+            self.backfill()
+        # after a reconnect, the server replays the samples missed meanwhile
+        self.observable = rx.from_iterable(
+            self.client.stream_process_values(
+                devices=[device.name for device in self.cfg.devices],
+                resume_from=dict(self.sequences),
+            )
+        )
         self.observable.pipe(
             op.subscribe_on(thread_pool),
             # op.throttle_first(timedelta(seconds=1)),
@@ -63,6 +80,18 @@ class EurothermApp(App):
             on_completed=on_error,
         )
 
+    def backfill(self):
+        start = datetime.now() - BACKFILL
+        for device in self.cfg.devices:
+            try:
+                history = self.client.get_history(
+                    device.name, start=start, max_points=BACKFILL_POINTS
+                )
+            except grpc.RpcError as ex:
+                logger.warning(f'[{repr(device.name)}] No history available: {ex}')
+                continue
+            self.query_one(f'#{device.name}').backfill(history)
+
     def on_mount(self):
         self.connect_to_server()
 
@@ -76,6 +105,7 @@ class EurothermApp(App):
         self.push_screen(ErrorScreen(), check_result)
 
     def update_readings(self, values: TData):
+        self.sequences[values.deviceName] = values.sequence
         self.query_one(f'#{values.deviceName}').update_values(values)
 
     def compose(self) -> ComposeResult:
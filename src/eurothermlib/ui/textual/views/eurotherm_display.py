@@ -1,4 +1,5 @@
 import logging
+from typing import List
 
 import numpy as np
 from reactivex.scheduler import ThreadPoolScheduler
@@ -19,6 +20,7 @@ from textual_plotext import PlotextPlot
 
 from eurothermlib.controllers import InstrumentStatus
 from eurothermlib.server.acquisition import TData, TemperatureRampState
+from eurothermlib.utils import TemperatureQ
 
 from .setpoint_display import SetpointDisplay
 
@@ -197,22 +199,8 @@ class EurothermDisplay(Static):
             )
 
             # append data
-            self.time.append(np.datetime64(values.timestamp))
-            self.data.append(values.processValue)
-
-            # only keep the last 30min
-            while self.time[-1] - self.time[0] > np.timedelta64(15, 'm'):
-                self.time.pop(0)
-                self.data.pop(0)
-
-            time = (np.array(self.time) - self.time[0]) / np.timedelta64(1, 'm')
-            data = [y.m_as(self.units) for y in self.data]
-
-            plt = self.query_one(PlotextPlot).plt
-            plt.clear_data()
-            plt.scatter(time, data)
-            plt.xlabel('minutes')
-            self.query_one(PlotextPlot).refresh()
+            self._append(values)
+            self._update_plot()
         else:
             logger.warn(
                 (
@@ -222,6 +210,41 @@ class EurothermDisplay(Static):
                 )
             )
 
+    def backfill(self, history: List[TData]):
+        """Prepend recorded process values to the plot."""
+        time, data = self.time, self.data
+        self.time, self.data = [], []
+        for values in history:
+            self._append(values)
+        if time:
+            # drop recorded values overlapping with the received ones
+            while self.time and self.time[-1] >= time[0]:
+                self.time.pop()
+                self.data.pop()
+        self.time.extend(time)
+        self.data.extend(data)
+        if self.time:
+            self._update_plot()
+
+    def _append(self, values: TData):
+        self.time.append(np.datetime64(values.timestamp))
+        self.data.append(values.processValue.m_as('K'))
+
+        # only keep the last 15min
+        while self.time[-1] - self.time[0] > np.timedelta64(15, 'm'):
+            self.time.pop(0)
+            self.data.pop(0)
+
+    def _update_plot(self):
+        time = (np.array(self.time) - self.time[0]) / np.timedelta64(1, 'm')
+        data = TemperatureQ(np.array(self.data), 'K').m_as(self.units)
+
+        plt = self.query_one(PlotextPlot).plt
+        plt.clear_data()
+        plt.scatter(time, data)
+        plt.xlabel('minutes')
+        self.query_one(PlotextPlot).refresh()
+
     def on_mount(self):
         pass
 
@@ -1,7 +1,9 @@
 # %%
+import functools
 import re
 import tokenize
-from typing import Any, ClassVar, Type, TypeAlias
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Dict, Tuple, Type, TypeAlias
 
 import pint
 from pydantic import GetCoreSchemaHandler
@@ -9,11 +11,35 @@ from pydantic_core import CoreSchema, core_schema
 
 
 # %%
+ZERO_CELSIUS = 273.15  # 0 °C in K
+
+# (dimensionality, units) -> parsed units of quantities that passed the
+# dimensionality check of a TypedQuantity
+_VALIDATED_UNITS: Dict[Tuple[str | None, Any], Any] = {}
+
+# magnitude followed by units, e.g. "20 degC", "20degC" or "1.5 [K/min]"
+_EXPRESSION = re.compile(
+    rf'(?P<number>{tokenize.Number}){tokenize.Whitespace}(?P<unit>(\[(.*)\])|(.*))'
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _lookup_units(registry: pint.UnitRegistry, units: str):
+    return registry.parse_units_as_container(units)
+
+
 class TypedQuantity(pint.Quantity):
     __dimensionality__: ClassVar[str | None] = None
+    _subclass_cache: ClassVar[Dict[Tuple[type, str], type]] = {}
 
     def __class_getitem__(cls, item):
-        return type(cls.__name__, (cls,), {"__dimensionality__": item})
+        # one subclass per dimensionality (so that subscripting at runtime,
+        # e.g. in validators, does not create new classes)
+        try:
+            return TypedQuantity._subclass_cache[cls, item]
+        except KeyError:
+            subclass = type(cls.__name__, (cls,), {"__dimensionality__": item})
+            return TypedQuantity._subclass_cache.setdefault((cls, item), subclass)
 
     # def __init__(self, *args, **kwargs):
     #     if not self.check(self.__dimensionality__):  # type: ignore
@@ -23,22 +49,33 @@ class TypedQuantity(pint.Quantity):
     #             extra_msg=f' (value = {self})',
     #         )
 
-    def __new__(cls, *args, **kwargs):
-        obj = pint.Quantity.__new__(pint.Quantity, *args, **kwargs)
+    def __new__(cls, value, units=None):
+        # fast path: units that already passed the dimensionality check
+        fast = (units is not None) and not isinstance(value, str)
+        if fast:
+            try:
+                container = _VALIDATED_UNITS[cls.__dimensionality__, units]
+                return pint.Quantity.__new__(pint.Quantity, value, container)
+            except (KeyError, TypeError):  # not yet validated or not hashable
+                pass
+
+        obj = pint.Quantity.__new__(pint.Quantity, value, units)
         if not obj.check(cls.__dimensionality__):  # type: ignore
             raise pint.DimensionalityError(
                 units2=cls.__dimensionality__,
                 units1=obj.units,
                 extra_msg=f' (value = {obj})',
             )
+        if fast:
+            try:
+                _VALIDATED_UNITS[cls.__dimensionality__, units] = obj._units
+            except TypeError:
+                pass
         return obj
 
     @staticmethod
     def parse_expression(input_string: str):
-        if m := re.match(
-            rf'(?P<number>{tokenize.Number}){tokenize.Whitespace}(?P<unit>(\[(.*)\])|(.*))',
-            input_string,
-        ):
+        if m := _EXPRESSION.match(input_string):
             number = m.group('number')
             try:
                 number = int(number)
@@ -74,7 +111,10 @@ class TypedQuantity(pint.Quantity):
                     parsed = TypedQuantity.parse_expression(source_value)
                     if parsed is not None:
                         source_value, units = parsed
-                value = ureg.Quantity(source_value, units=units)  # type: ignore
+                container = (
+                    _lookup_units(ureg, units) if isinstance(units, str) else units
+                )
+                value = ureg.Quantity(source_value, units=container)  # type: ignore
                 # value = cls(source_value, units=units)  # type: ignore
         except pint.UndefinedUnitError as ex:
             raise ValueError(f'Cannot convert "{source_value}" to quantity') from ex
@@ -111,6 +151,47 @@ class TypedQuantity(pint.Quantity):
         return str(value)
 
 
+class LazyQuantity:
+    """Dataclass field holding the magnitude of a quantity in fixed units.
+
+    The magnitude is stored as a plain float (in the attribute ``_<name>``)
+    and the quantity is only created on access. Assigned quantities are
+    converted to `units`; plain numbers are taken to be in `units` already.
+    """
+
+    def __init__(self, qtype: Type[TypedQuantity], units: str):
+        self.qtype = qtype
+        self.units = units
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.attribute = self._attribute(name)
+
+    @staticmethod
+    def _attribute(name: str) -> str:
+        return f'_{name}'
+
+    @staticmethod
+    def magnitude_getter(*names: str) -> Callable[[Any], Any]:
+        """Getter of the magnitudes of the fields `names` (in their units).
+
+        Works like `operator.attrgetter` (a tuple is returned for several
+        names), but no quantities are created.
+        """
+        return attrgetter(*map(LazyQuantity._attribute, names))
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            # no default value (see dataclasses: descriptor-typed fields)
+            raise AttributeError(self.name)
+        return self.qtype(getattr(obj, self.attribute), self.units)
+
+    def __set__(self, obj, value):
+        if isinstance(value, pint.Quantity):
+            value = value.m_as(self.units)
+        setattr(obj, self.attribute, float(value))
+
+
 VoltageQ: TypeAlias = TypedQuantity['[electric_potential]']
 TemperatureQ: TypeAlias = TypedQuantity['[temperature]']
 TemperatureRateQ: TypeAlias = TypedQuantity['[temperature]/[time]']
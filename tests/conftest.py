@@ -1,5 +1,36 @@
+from datetime import datetime
+from typing import Optional
+
 import pytest
 
+from eurothermlib.controllers import InstrumentStatus
+from eurothermlib.server.acquisition import TData, TemperatureRampState
+from eurothermlib.utils import DimensionlessQ, TemperatureQ
+
+
+def create_data(
+    device: str = 'test',
+    timestamp: Optional[datetime] = None,
+    sequence: int = 0,
+    temperature: float = 20.0,
+    status: InstrumentStatus = InstrumentStatus.Ok,
+    scheduled: Optional[datetime] = None,
+) -> TData:
+    """Sample of a device (`temperature` in °C, default timestamp: now)."""
+    return TData(
+        deviceName=device,
+        timestamp=timestamp or datetime.now(),
+        processValue=TemperatureQ(temperature, '°C'),
+        setpoint=TemperatureQ(25.0, '°C'),
+        workingSetpoint=TemperatureQ(30.0, '°C'),
+        remoteSetpoint=TemperatureQ(25.0, '°C'),
+        workingOutput=DimensionlessQ(1.2, '%'),
+        status=status,
+        rampStatus=TemperatureRampState.NoRamp,
+        scheduledTimestamp=scheduled,
+        sequence=sequence,
+    )
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -1,7 +1,87 @@
-from eurothermlib.controllers.generic import GenericAddress
+from concurrent import futures
+
+import pytest
+
+from eurothermlib.controllers import InstrumentStatus
+from eurothermlib.controllers.generic import GenericAddress, GenericEurothermController
+
+
+class FakeResponse:
+    def __init__(self, registers):
+        self.registers = registers
+
+    def isError(self):
+        return False
+
+
+class FakeConnection:
+    def __init__(self, registers):
+        self.registers = registers
+        self.reads = []
+
+    def read_holding_registers(self, unit_address, register_address, num_registers=1):
+        self.reads.append((register_address, num_registers))
+        future = futures.Future()
+        future.set_result(
+            FakeResponse(
+                [
+                    self.registers.get(register_address + k, 0)
+                    for k in range(num_registers)
+                ]
+            )
+        )
+        return future
 
 
 class TestGenericAddress:
     def test_address_values(self):
         # ensure that we only write to the correct volatile address
         assert GenericAddress.RmSP == 26
+
+
+class TestGenericEurothermController:
+    @pytest.fixture
+    def registers(self):
+        return {
+            GenericAddress.PVIN: 2512,  # 251.2 °C
+            GenericAddress.TGSP: 3000,  # 300.0 °C
+            GenericAddress.WRKOP: 455,  # 45.5 %
+            GenericAddress.WKGSP: 0xFF9C,  # -10.0 °C
+            GenericAddress.STAT: (1 << 0) | (1 << 12),
+            GenericAddress.LR: 1,
+        }
+
+    def test_block_read_plan(self, registers):
+        connection = FakeConnection(registers)
+        controller = GenericEurothermController(1, connection, read_plan='block')
+
+        values = controller.get_process_values()
+
+        assert connection.reads == [
+            (GenericAddress.PVIN, GenericAddress.STAT),
+            (GenericAddress.LR, 1),
+        ]
+        assert values.processValue.m_as('°C') == pytest.approx(251.2)
+        assert values.setpoint.m_as('°C') == pytest.approx(300.0)
+        assert values.workingSetpoint.m_as('°C') == pytest.approx(-10.0)
+        assert values.workingOutput.m_as('%') == pytest.approx(45.5)
+        assert values.status == (
+            InstrumentStatus.Ok
+            | InstrumentStatus.Alarm1
+            | InstrumentStatus.NewAlarm
+            | InstrumentStatus.LocalRemoteSPSelect
+        )
+
+    def test_block_read_plan_decimal_places(self, registers):
+        connection = FakeConnection(registers)
+        controller = GenericEurothermController(
+            1, connection, read_plan='block', decimal_places=0
+        )
+
+        values = controller.get_process_values()
+        assert values.processValue.m_as('°C') == pytest.approx(2512)
+        assert values.workingOutput.m_as('%') == pytest.approx(45.5)
+
+    def test_decode_status(self):
+        status = GenericEurothermController._decode_status(1 << 5, 0)
+        assert status == InstrumentStatus.Ok | InstrumentStatus.SensorBreak
@@ -0,0 +1,209 @@
+import asyncio
+import time
+
+import pytest
+from pymodbus import ModbusException
+
+from eurothermlib.configuration import DeviceConfig, SerialPortConfig
+from eurothermlib.controllers import (
+    AsyncGenericEurothermController,
+    AsyncModbusSerialConnection,
+    InstrumentStatus,
+    ModbusSerialConnection,
+)
+from eurothermlib.controllers.controller import RemoteSetpointState
+from eurothermlib.controllers.generic import GenericAddress, GenericEurothermController
+from eurothermlib.controllers.modbus_slave import (
+    EurothermModbusSlave,
+    EurothermRegisters,
+    create_slaves,
+)
+from eurothermlib.utils import TemperatureQ
+
+
+@pytest.fixture
+def slave():
+    with EurothermModbusSlave(units=(1, 2)) as slave:
+        slave[1][GenericAddress.PVIN] = 251.2
+        slave[1][GenericAddress.TGSP] = 300.0
+        slave[1][GenericAddress.WRKOP] = 45.5
+        slave[1][GenericAddress.STAT] = (1 << 0) | (1 << 12)
+        yield slave
+
+
+@pytest.fixture
+def connection(slave: EurothermModbusSlave):
+    connection = ModbusSerialConnection(SerialPortConfig(port=slave.url))
+    yield connection
+    connection.close()
+    ModbusSerialConnection.__connections__.pop(slave.url)
+
+
+class TestEurothermRegisters:
+    def test_float_mirror(self):
+        registers = EurothermRegisters()
+        registers[GenericAddress.PVIN] = 251.2
+
+        values = registers.getValues(3, 0x8000 + 2 * GenericAddress.PVIN, 2)
+
+        assert GenericEurothermController._unpack(values) == [pytest.approx(251.2)]
+
+    def test_scaled_integers(self):
+        registers = EurothermRegisters(decimal_places=2)
+        registers[GenericAddress.PVIN] = -10.0
+        registers[GenericAddress.WRKOP] = 45.5
+
+        values = registers.getValues(3, GenericAddress.PVIN, 4)
+
+        assert values == [0xFC18, 2000, 0, 455]
+
+    def test_validate(self):
+        registers = EurothermRegisters()
+        assert registers.validate(3, GenericAddress.PVIN, 75)
+        assert registers.validate(3, 0x8002, 10)
+        assert not registers.validate(3, 0x8003, 2)
+        assert not registers.validate(6, 0x8002, 1)
+
+    def test_remote_setpoint(self):
+        registers = EurothermRegisters()
+        registers[GenericAddress.RmSP] = 150.0
+        assert registers[GenericAddress.WKGSP] == 20.0
+
+        registers[GenericAddress.LR] = 1
+        assert registers[GenericAddress.WKGSP] == 150.0
+
+        registers[GenericAddress.LR] = 0
+        assert registers[GenericAddress.WKGSP] == 20.0
+
+    def test_acknowledge_alarms(self):
+        registers = EurothermRegisters()
+        registers[GenericAddress.STAT] = (1 << 1) | (1 << 5) | (1 << 12)
+
+        registers.setValues(6, GenericAddress.AcALL, [1])
+
+        assert registers[GenericAddress.STAT] == 1 << 5
+        assert registers[GenericAddress.AcALL] == 0
+
+
+class TestEurothermModbusSlave:
+    @pytest.mark.parametrize('read_plan', ['separate', 'block'])
+    def test_process_values(self, connection, read_plan):
+        controller = GenericEurothermController(1, connection, read_plan=read_plan)
+
+        values = controller.get_process_values()
+
+        assert values.processValue.m_as('degC') == pytest.approx(251.2, abs=1e-4)
+        assert values.setpoint.m_as('degC') == pytest.approx(300.0)
+        assert values.workingSetpoint.m_as('degC') == pytest.approx(300.0)
+        assert values.workingOutput.m_as('%') == pytest.approx(45.5)
+        assert values.status == (
+            InstrumentStatus.Ok | InstrumentStatus.Alarm1 | InstrumentStatus.NewAlarm
+        )
+
+    def test_units(self, slave, connection):
+        slave[2][GenericAddress.PVIN] = 100.0
+        first = GenericEurothermController(1, connection).get_process_values()
+        second = GenericEurothermController(2, connection).get_process_values()
+        assert first.processValue.m_as('degC') == pytest.approx(251.2, abs=1e-4)
+        assert second.processValue.m_as('degC') == pytest.approx(100.0)
+
+    def test_remote_setpoint(self, slave, connection):
+        controller = GenericEurothermController(1, connection, decimal_places=1)
+
+        controller.toggle_remote_setpoint(RemoteSetpointState.ENABLE)
+        controller.write_remote_setpoint(TemperatureQ(-12.3, 'degC'))
+
+        assert slave[1][GenericAddress.RmSP] == pytest.approx(-12.3)
+        values = controller.get_process_values()
+        assert values.workingSetpoint.m_as('degC') == pytest.approx(-12.3)
+        assert InstrumentStatus.LocalRemoteSPSelect in values.status
+
+    def test_acknowledge_all_alarms(self, connection):
+        controller = GenericEurothermController(1, connection)
+
+        controller.acknowledge_all_alarms()
+
+        assert controller.status == InstrumentStatus.Ok
+
+    def test_retry_on_error(self, slave, connection):
+        controller = GenericEurothermController(1, connection)
+        slave.fail_next(2)
+
+        values = controller.get_process_values()
+
+        assert values.processValue.m_as('degC') == pytest.approx(251.2, abs=1e-4)
+        assert slave.statistics.errors == 2
+
+    def test_error(self, slave, connection):
+        controller = GenericEurothermController(1, connection)
+        slave.fail_next(3)
+
+        with pytest.raises(ModbusException):
+            controller.get_process_values()
+
+    def test_error_rate(self, slave, connection):
+        slave.error_rate = 1.0
+        controller = GenericEurothermController(1, connection)
+
+        with pytest.raises(ModbusException):
+            controller.status
+
+        assert slave.statistics.errors == 3  # attempts
+
+    def test_latency(self, slave, connection):
+        slave[1].latency = 0.05
+        controller = GenericEurothermController(1, connection, read_plan='block')
+
+        start = time.perf_counter()
+        controller.get_process_values()
+
+        # two transactions (integer block and LR)
+        assert time.perf_counter() - start >= 0.1
+
+    def test_async_connection(self, slave):
+        async def read():
+            connection = AsyncModbusSerialConnection(SerialPortConfig(port=slave.url))
+            try:
+                controller = AsyncGenericEurothermController(1, connection)
+                return await controller.get_process_values()
+            finally:
+                connection.close()
+                AsyncModbusSerialConnection.__connections__.pop(slave.url)
+
+        values = asyncio.run(read())
+
+        assert values.processValue.m_as('degC') == pytest.approx(251.2, abs=1e-4)
+
+    def test_from_url(self):
+        slave = EurothermModbusSlave.from_url('socket://127.0.0.1:5020')
+        assert slave.url == 'socket://127.0.0.1:5020'
+
+        with pytest.raises(ValueError):
+            EurothermModbusSlave.from_url('/dev/ttyUSB0')
+
+
+class TestCreateSlaves:
+    def test_devices_sharing_a_port(self):
+        port = 'socket://127.0.0.1:5020'
+        devices = [
+            DeviceConfig(
+                name='a', driver='generic', unitAddress=1, connection={'port': port}
+            ),
+            DeviceConfig(
+                name='b',
+                driver='generic',
+                unitAddress=2,
+                decimal_places=2,
+                connection={'port': port},
+            ),
+            DeviceConfig(name='c', driver='generic', connection={'port': 'COM3'}),
+            DeviceConfig(name='d', driver='simulate', connection={'port': port}),
+        ]
+
+        slaves = create_slaves(devices, latency=0.01)
+
+        assert len(slaves) == 1
+        assert slaves[0].url == port
+        assert set(slaves[0].units) == {1, 2}
+        assert slaves[0][2].decimal_places == 2
+        assert slaves[0][1].latency == 0.01
@@ -0,0 +1,82 @@
+import threading
+import time
+
+from eurothermlib.configuration import SerialPortConfig
+from eurothermlib.controllers import BusScheduler
+
+
+class TestBusScheduler:
+    def test_single_scheduler_per_port(self):
+        s1 = BusScheduler(SerialPortConfig(port='bus1'))
+        s2 = BusScheduler(SerialPortConfig(port='bus2'))
+        s3 = BusScheduler(SerialPortConfig(port='bus1'))
+        assert s1 is not s2
+        assert s1 is s3
+
+    def test_poll_devices(self):
+        scheduler = BusScheduler(SerialPortConfig(port='bus-poll'))
+        calls = {'a': 0, 'b': 0}
+
+        def poll(name):
+            def wrapper(scheduled):
+                calls[name] += 1
+
+            return wrapper
+
+        scheduler.register('a', 20.0, poll('a'))
+        scheduler.register('b', 10.0, poll('b'))
+        time.sleep(0.5)
+        stats = scheduler.statistics()
+        scheduler.unregister('a')
+        scheduler.unregister('b')
+
+        assert 8 <= calls['a'] <= 12
+        assert 4 <= calls['b'] <= 7
+        assert stats['a'].requested == 20.0
+        assert stats['a'].achieved > 15.0
+        assert stats['b'].requested == 10.0
+
+    def test_interleave_writes(self):
+        scheduler = BusScheduler(SerialPortConfig(port='bus-write'))
+        log = []
+        polled = threading.Event()
+
+        def poll(scheduled):
+            log.append('read')
+            polled.set()
+
+        scheduler.register('a', 10.0, poll)
+        polled.wait(1.0)
+        result = scheduler.submit(lambda x: log.append('write') or x, 42).result(1.0)
+        scheduler.unregister('a')
+
+        assert result == 42
+        assert log[:2] == ['read', 'write']
+
+    def test_missed_slots(self):
+        scheduler = BusScheduler(SerialPortConfig(port='bus-slow'))
+
+        scheduler.register('a', 50.0, lambda _: time.sleep(0.05))
+        time.sleep(0.3)
+        stats = scheduler.statistics()['a']
+        scheduler.unregister('a')
+
+        assert stats.missed > 0
+        assert stats.achieved < 25.0
+
+    def test_failed_poll_keeps_job(self):
+        scheduler = BusScheduler(SerialPortConfig(port='bus-error'))
+        calls = []
+
+        def poll(scheduled):
+            calls.append(scheduled)
+            if len(calls) == 1:
+                raise IOError('transient bus error')
+
+        scheduler.register('a', 20.0, poll)
+        time.sleep(0.3)
+        stats = scheduler.statistics()
+        scheduler.unregister('a')
+
+        assert 'a' in stats
+        assert len(calls) > 2
@@ -0,0 +1,103 @@
+import pytest
+
+from eurothermlib.controllers import (
+    EurothermSimulator,
+    InstrumentStatus,
+    SimulationEngine,
+)
+from eurothermlib.controllers.controller import RemoteSetpointState
+from eurothermlib.plant import ThermalPlant
+from eurothermlib.utils import TemperatureQ
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def engine(clock):
+    return SimulationEngine(time_fn=clock)
+
+
+class TestSimulationEngine:
+    def test_same_results_as_simulators(self, clock, engine):
+        setups = [
+            # (remote setpoint [°C], setpoint rate [K/s], plant)
+            (300.0, None, ThermalPlant()),
+            (150.0, 0.5, ThermalPlant()),
+            (800.0, None, ThermalPlant(max_power=2000.0)),
+            (20.0, None, ThermalPlant(temperature=100.0)),
+        ]
+        pairs = []
+        for k, (setpoint, rate, plant) in enumerate(setups):
+            simulator = EurothermSimulator(
+                ThermalPlant(**vars(plant)), setpoint_rate=rate, time_fn=clock
+            )
+            virtual = engine.controller(f'device{k}', plant, setpoint_rate=rate)
+            for controller in (simulator, virtual):
+                controller.toggle_remote_setpoint(RemoteSetpointState.ENABLE)
+                controller.write_remote_setpoint(TemperatureQ(setpoint, '°C'))
+            pairs.append((simulator, virtual))
+
+        for minute in (1, 5, 30, 120):
+            clock.now = minute * 60.0
+            for simulator, virtual in pairs:
+                expected = simulator.get_process_values()
+                actual = virtual.get_process_values()
+                for field in ('processValue', 'workingSetpoint', 'workingOutput'):
+                    assert getattr(actual, field).m == pytest.approx(
+                        getattr(expected, field).m
+                    )
+                assert actual.status == expected.status
+
+    def test_controller_per_device(self, engine):
+        first = engine.controller('first')
+        second = engine.controller('second')
+
+        assert engine.controller('first') is first
+        assert first is not second
+        assert len(engine) == 2
+
+    def test_add_device(self, clock, engine):
+        heated = engine.controller('heated')
+        heated.toggle_remote_setpoint(RemoteSetpointState.ENABLE)
+        heated.write_remote_setpoint(TemperatureQ(300.0, '°C'))
+        clock.now = 600.0
+        temperature = heated.process_value
+
+        # devices added later start in their initial state
+        added = engine.controller('added')
+
+        assert added.process_value.m_as('°C') == pytest.approx(20.0)
+        assert heated.process_value == temperature
+        clock.now = 1200.0
+        assert heated.process_value > temperature
+
+    def test_status(self, clock, engine):
+        controller = engine.controller('device', setpoint_rate=1.0)
+        assert controller.status == InstrumentStatus.Ok
+
+        controller.toggle_remote_setpoint(RemoteSetpointState.ENABLE)
+        controller.write_remote_setpoint(TemperatureQ(100.0, '°C'))
+        clock.now = 1.0
+        assert controller.status == (
+            InstrumentStatus.Ok
+            | InstrumentStatus.LocalRemoteSPSelect
+            | InstrumentStatus.TimerRampRunning
+        )
+
+        clock.now = 120.0
+        assert controller.working_setpoint.m_as('°C') == pytest.approx(100.0)
+        assert InstrumentStatus.TimerRampRunning not in controller.status
+
+    def test_shared(self):
+        assert SimulationEngine.shared() is SimulationEngine.shared()
@@ -0,0 +1,93 @@
+import pytest
+
+from eurothermlib.controllers import EurothermSimulator, InstrumentStatus
+from eurothermlib.controllers.controller import RemoteSetpointState
+from eurothermlib.utils import TemperatureQ
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestEurothermSimulator:
+    def test_idle(self, clock):
+        simulator = EurothermSimulator(time_fn=clock)
+        clock.now = 3600.0
+
+        values = simulator.get_process_values()
+
+        assert values.processValue.m_as('°C') == pytest.approx(20.0)
+        assert values.workingOutput.m_as('%') == 0.0
+        assert values.status == InstrumentStatus.Ok
+
+    def test_remote_setpoint(self, clock):
+        simulator = EurothermSimulator(time_fn=clock)
+        simulator.toggle_remote_setpoint(RemoteSetpointState.ENABLE)
+        simulator.write_remote_setpoint(TemperatureQ(300.0, '°C'))
+
+        clock.now = 60.0
+        values = simulator.get_process_values()
+        assert values.processValue.m_as('°C') > 20.0
+        assert values.workingSetpoint.m_as('°C') == pytest.approx(300.0)
+        assert values.setpoint.m_as('°C') == pytest.approx(20.0)
+        assert values.workingOutput.m_as('%') == pytest.approx(100.0)
+        assert InstrumentStatus.LocalRemoteSPSelect in values.status
+
+        clock.now = 3 * 3600.0
+        values = simulator.get_process_values()
+        assert values.processValue.m_as('°C') == pytest.approx(300.0, abs=0.1)
+        assert 0.0 < values.workingOutput.m_as('%') < 100.0
+
+    def test_remote_setpoint_disabled(self, clock):
+        simulator = EurothermSimulator(time_fn=clock)
+        simulator.write_remote_setpoint(TemperatureQ(300.0, '°C'))
+
+        clock.now = 600.0
+
+        assert simulator.process_value.m_as('°C') == pytest.approx(20.0)
+        assert simulator.working_setpoint.m_as('°C') == pytest.approx(20.0)
+
+    def test_setpoint_rate(self, clock):
+        simulator = EurothermSimulator(time_fn=clock, setpoint_rate=1.0)
+        simulator.toggle_remote_setpoint(RemoteSetpointState.ENABLE)
+        simulator.write_remote_setpoint(TemperatureQ(100.0, '°C'))
+
+        clock.now = 30.0
+        assert simulator.working_setpoint.m_as('°C') == pytest.approx(50.0)
+        assert InstrumentStatus.TimerRampRunning in simulator.status
+
+        clock.now = 120.0
+        assert simulator.working_setpoint.m_as('°C') == pytest.approx(100.0)
+        assert InstrumentStatus.TimerRampRunning not in simulator.status
+
+    def test_sample_time(self, clock):
+        simulator = EurothermSimulator(time_fn=clock, sample_time=1.0)
+        simulator.toggle_remote_setpoint(RemoteSetpointState.ENABLE)
+        simulator.write_remote_setpoint(TemperatureQ(300.0, '°C'))
+
+        # the remainder of a step is carried over to the next access
+        clock.now = 0.6
+        first = simulator.process_value
+        clock.now = 1.2
+        second = simulator.process_value
+
+        assert first.m_as('°C') == 20.0
+        assert second.m_as('°C') > 20.0
+
+    def test_measured_value(self, clock):
+        simulator = EurothermSimulator(time_fn=clock)
+
+        simulator.plant.temperature = 300.0
+        assert simulator.measured_value.m_as('mV') == pytest.approx(12.209)
+
+        simulator.plant.temperature = 250.0
+        assert simulator.measured_value.m_as('mV') == pytest.approx(10.1735)
@@ -0,0 +1,113 @@
+import threading
+import time
+import pandas as pd
+import reactivex
+
+from eurothermlib.configuration import LoggingConfig
+from eurothermlib.logging import DataLoggerSink
+from eurothermlib.server.acquisition import TData
+from tests.conftest import create_data
+
+
+class RecordingDataLogger:
+    def __init__(self):
+        self.frames = []
+
+    def log_data(self, data: pd.DataFrame):
+        self.frames.append(data)
+
+    def close(self):
+        pass
+
+
+class BlockingDataLogger(RecordingDataLogger):
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def log_data(self, data: pd.DataFrame):
+        self.release.wait()
+        super().log_data(data)
+
+
+class TestDataLoggerSink:
+    def test_flush_on_completion(self):
+        data_logger = RecordingDataLogger()
+        sink = DataLoggerSink(LoggingConfig(), data_logger)  # type: ignore
+        subject = reactivex.Subject[TData]()
+        sink.attach(subject)
+
+        subject.on_next(create_data('a'))
+        subject.on_next(create_data('b'))
+        assert data_logger.frames == []
+
+        subject.on_completed()
+        assert len(data_logger.frames) == 1
+        assert list(data_logger.frames[0]['deviceName']) == ['a', 'b']
+
+    def test_write_interval(self):
+        data_logger = RecordingDataLogger()
+        cfg = LoggingConfig(write_interval='50ms')  # type: ignore
+        sink = DataLoggerSink(cfg, data_logger)  # type: ignore
+        subject = reactivex.Subject[TData]()
+        sink.attach(subject)
+
+        try:
+            subject.on_next(create_data('a'))
+            time.sleep(0.2)
+            assert len(data_logger.frames) == 1
+
+            # nothing is written for empty buffers
+            time.sleep(0.1)
+            assert len(data_logger.frames) == 1
+        finally:
+            sink.close()
+
+    def test_dropped_batches(self):
+        data_logger = BlockingDataLogger()
+        cfg = LoggingConfig(write_interval='10ms', queue_size=1)  # type: ignore
+        sink = DataLoggerSink(cfg, data_logger)  # type: ignore
+        subject = reactivex.Subject[TData]()
+        sink.attach(subject)
+
+        try:
+            # the writer is blocked: one batch is taken, one is queued
+            for _ in range(4):
+                subject.on_next(create_data('a'))
+                time.sleep(0.05)
+            assert sink.dropped >= 1
+        finally:
+            data_logger.release.set()
+            sink.close()
+        assert sink.delayed >= 1
+
+    def test_close_waits_for_pending_close(self):
+        data_logger = BlockingDataLogger()
+        sink = DataLoggerSink(LoggingConfig(), data_logger)  # type: ignore
+        subject = reactivex.Subject[TData]()
+        sink.attach(subject)
+        subject.on_next(create_data('a'))
+
+        # the completion closes the sink first (the writer is blocked)
+        completer = threading.Thread(target=subject.on_completed)
+        completer.start()
+        time.sleep(0.05)
+        threading.Timer(0.1, data_logger.release.set).start()
+
+        sink.close()
+        assert len(data_logger.frames) == 1
+        completer.join()
+
+    def test_close_timeout(self):
+        data_logger = BlockingDataLogger()
+        sink = DataLoggerSink(LoggingConfig(), data_logger)  # type: ignore
+        subject = reactivex.Subject[TData]()
+        sink.attach(subject)
+        subject.on_next(create_data('a'))
+
+        sink.close(timeout=0.05)
+        assert data_logger.frames == []
+
+        data_logger.release.set()
+        sink.close()
+        assert len(data_logger.frames) == 1
@@ -1,41 +1,29 @@
 from datetime import datetime
 import pandas as pd
 import pint
+import pytest
 from eurothermlib.configuration import LoggingConfig
 from eurothermlib.controllers.controller import InstrumentStatus
-from eurothermlib.logging import FileDataLogger
+from eurothermlib.logging import FileDataLogger, ParquetDataLogger, create_data_logger
 from eurothermlib.server.acquisition import TData, TemperatureRampState
 
 
 class TestFileDataLogger:
-    def test_format_value(self):
+    def test_build_line(self):
         logger = FileDataLogger(LoggingConfig())
 
-        assert logger._format_value(None, 'test') == 'test'
-        assert (
-            logger._format_value(None, datetime(2024, 7, 26, 10, 12, 32))
-            == '2024-07-26T10:12:32'
-        )
-        assert logger._format_value(None, 2.123456789) == '2.12346'
-        assert (
-            logger._format_value('processValue', pint.Quantity(25.12345678, '°C'))
-            == '298.273'
-        )
-        assert logger._format_value('workingOutput', pint.Quantity(0.8)) == '80'
-
-    def test_format_line(self):
-        logger = FileDataLogger(LoggingConfig())
-
-        line = logger._format_line(
-            dict(
-                timestamp=datetime(2024, 7, 26, 10, 12, 32),
-                processValue=pint.Quantity(25.12345678, '°C'),
-                workingOutput=pint.Quantity(0.8),
-                workingSetpoint=pint.Quantity(300, 'K'),
-            )
+        data = pd.DataFrame(
+            [
+                dict(
+                    timestamp=datetime(2024, 7, 26, 10, 12, 32),
+                    processValue=pint.Quantity(25.12345678, '°C'),
+                    workingOutput=pint.Quantity(0.8),
+                    workingSetpoint=pint.Quantity(300, 'K'),
+                )
+            ]
         )
 
-        assert line == '2024-07-26T10:12:32;298.273;80;300'
+        assert logger._build_lines(data) == ['2024-07-26T10:12:32;298.273;80;300']
 
     def test_build_lines(self):
         logger = FileDataLogger(LoggingConfig())
@@ -73,3 +61,157 @@ class TestFileDataLogger:
             '2024-07-26T10:12:32;298.273;80;300',
             '2024-07-26T10:14:32;299.273;70;300',
         ]
+
+    def test_build_lines_mixed_units(self):
+        logger = FileDataLogger(LoggingConfig())
+
+        data = pd.DataFrame(
+            [
+                dict(
+                    timestamp=datetime(2024, 7, 26, 10, 12, 32),
+                    processValue=pint.Quantity(25.0, '°C'),
+                    workingOutput=pint.Quantity(80.0, '%'),
+                    workingSetpoint=pint.Quantity(300, 'K'),
+                ),
+                dict(
+                    timestamp=datetime(2024, 7, 26, 10, 12, 33),
+                    processValue=pint.Quantity(300.0, 'K'),
+                    workingOutput=pint.Quantity(0.7),
+                    workingSetpoint=pint.Quantity(300, 'K'),
+                ),
+            ]
+        )
+
+        assert logger._build_lines(data) == [
+            '2024-07-26T10:12:32;298.15;80;300',
+            '2024-07-26T10:12:33;300;70;300',
+        ]
+        assert logger._build_lines(data.iloc[:0]) == []
+
+    def test_build_lines_from_magnitudes(self):
+        logger = FileDataLogger(LoggingConfig())
+
+        data = TData.to_frame(
+            [
+                TData(
+                    deviceName='reactor',
+                    timestamp=datetime(2024, 7, 26, 10, 12, 32),
+                    processValue=pint.Quantity(25.12345678, '°C'),
+                    setpoint=pint.Quantity(310, 'K'),
+                    workingSetpoint=pint.Quantity(300, 'K'),
+                    remoteSetpoint=pint.Quantity(320, 'K'),
+                    workingOutput=pint.Quantity(0.8),
+                    status=InstrumentStatus.NewAlarm,
+                    rampStatus=TemperatureRampState.NoRamp,
+                )
+            ]
+        )
+        assert data.attrs['units']['processValue'] == 'K'
+        assert data['workingOutput'][0] == pytest.approx(80.0)
+
+        assert logger._build_lines(data) == ['2024-07-26T10:12:32;298.273;80;300']
+
+    def test_read(self, tmp_path):
+        cfg = LoggingConfig(directory=str(tmp_path))
+        logger = FileDataLogger(cfg)
+
+        def create_frame(second: int):
+            return pd.DataFrame(
+                [
+                    dict(
+                        timestamp=datetime(2024, 7, 26, 10, 12, second),
+                        processValue=pint.Quantity(25.0, '°C'),
+                        workingOutput=pint.Quantity(0.8),
+                        workingSetpoint=pint.Quantity(300, 'K'),
+                    )
+                ]
+            )
+
+        for second in range(5):
+            logger.log_data(create_frame(second))
+
+        # the current file can be read while it is written
+        data = logger.read(
+            datetime(2024, 7, 26, 10, 12, 1), datetime(2024, 7, 26, 10, 12, 3)
+        )
+        assert list(data['timestamp'].dt.second) == [1, 2, 3]
+        assert list(data['processValue']) == pytest.approx([298.15] * 3)
+        assert data.attrs['units'] == cfg.units
+        assert len(logger.read()) == 5
+        logger.close()
+
+        assert logger.read(datetime(2024, 7, 27)).empty
+
+
+class TestParquetDataLogger:
+    def test_log_data(self, tmp_path):
+        pq = pytest.importorskip('pyarrow.parquet')
+        cfg = LoggingConfig(
+            backend='parquet',
+            directory=str(tmp_path),
+            columns=['deviceName', 'timestamp', 'processValue', 'status'],
+        )
+        logger = create_data_logger(cfg)
+        assert isinstance(logger, ParquetDataLogger)
+
+        def create_frame(value: float):
+            return pd.DataFrame(
+                [
+                    TData(
+                        deviceName='reactor',
+                        timestamp=datetime(2024, 7, 26, 10, 12, 32),
+                        processValue=pint.Quantity(value, '°C'),
+                        setpoint=pint.Quantity(310, 'K'),
+                        workingSetpoint=pint.Quantity(300, 'K'),
+                        remoteSetpoint=pint.Quantity(320, 'K'),
+                        workingOutput=pint.Quantity(0.8),
+                        status=InstrumentStatus.NewAlarm,
+                        rampStatus=TemperatureRampState.NoRamp,
+                    )
+                ]
+            )
+
+        logger.log_data(create_frame(25.0))
+        logger.log_data(create_frame(26.0))
+        file = logger.current_file
+        logger.close()
+
+        assert file.suffix == '.parquet'
+        table = pq.read_table(file)
+        assert table.column_names == cfg.columns
+        assert table.schema.field('processValue').metadata == {b'units': b'K'}
+
+        df = table.to_pandas()
+        assert list(df['deviceName']) == ['reactor', 'reactor']
+        assert list(df['processValue']) == pytest.approx([298.15, 299.15])
+        assert list(df['status']) == [int(InstrumentStatus.NewAlarm)] * 2
+        assert df['timestamp'][0] == datetime(2024, 7, 26, 10, 12, 32)
+
+    def test_file_handle(self, tmp_path):
+        cfg = LoggingConfig(directory=str(tmp_path), flush='fsync')
+        logger = FileDataLogger(cfg)
+
+        data = pd.DataFrame(
+            [
+                dict(
+                    timestamp=datetime(2024, 7, 26, 10, 12, 32),
+                    processValue=pint.Quantity(25.0, '°C'),
+                    workingOutput=pint.Quantity(0.8),
+                    workingSetpoint=pint.Quantity(300, 'K'),
+                )
+            ]
+        )
+        logger.log_data(data)
+        handle = logger._file
+        logger.log_data(data)
+        assert logger._file is handle  # file is kept open
+
+        # data is visible before the file is closed
+        assert logger.current_file.read_text().splitlines() == [
+            'timestamp;processValue;workingOutput;workingSetpoint',
+            '2024-07-26T10:12:32;298.15;80;300',
+            '2024-07-26T10:12:32;298.15;80;300',
+        ]
+
+        logger.close()
+        assert handle.closed
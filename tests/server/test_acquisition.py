@@ -1,14 +1,26 @@
+import threading
+import time
 from datetime import datetime
 import pytest
 from reactivex import operators as op
 
-from eurothermlib.configuration import DeviceConfig
-from eurothermlib.controllers import InstrumentStatus
-from eurothermlib.server.acquisition import EurothermIO, TData, TemperatureRampState
+from eurothermlib.configuration import DeviceConfig, SerialPortConfig
+from eurothermlib.controllers import InstrumentStatus, ModbusSerialConnection
+from eurothermlib.controllers.generic import GenericAddress
+from eurothermlib.controllers.modbus_slave import EurothermModbusSlave
+from eurothermlib.server.acquisition import (
+    EurothermIO,
+    IOThread,
+    SingletonMeta,
+    TData,
+    TemperatureRampState,
+)
 from eurothermlib.server.proto import service_pb2
-from eurothermlib.utils import TemperatureQ, DimensionlessQ
+from eurothermlib.utils import TemperatureQ, TemperatureRateQ, DimensionlessQ
 from google.protobuf.timestamp_pb2 import Timestamp
 
+from tests.conftest import create_data
+
 
 class TestTData:
     def test_to_grpc_response(self):
@@ -37,6 +49,26 @@ class TestTData:
             InstrumentStatus.RemoteSPFail | InstrumentStatus.NewAlarm
         )
         assert response.rampStatus == int(TemperatureRampState.NoRamp)
+        assert not response.HasField('scheduledTimestamp')
+
+    def test_scheduled_timestamp(self):
+        now = datetime.now()
+        data = TData(
+            deviceName='test',
+            timestamp=now,
+            processValue=TemperatureQ(20.0, '°C'),
+            setpoint=TemperatureQ(25.0, '°C'),
+            workingSetpoint=TemperatureQ(30.0, '°C'),
+            remoteSetpoint=TemperatureQ(25.0, '°C'),
+            workingOutput=DimensionlessQ(1.2, '%'),
+            status=InstrumentStatus.Ok,
+            rampStatus=TemperatureRampState.NoRamp,
+            scheduledTimestamp=now,
+        )
+
+        result = TData.from_grpc_response(data.to_grpc_response())
+        assert result.timestamp == now
+        assert result.scheduledTimestamp == now
 
     def test_from_grpc_response(self):
         now = datetime.now()
@@ -63,8 +95,116 @@ class TestTData:
         assert data.workingOutput == DimensionlessQ(1.2, '%')
         assert data.status == InstrumentStatus.RemoteSPFail | InstrumentStatus.NewAlarm
 
+    def test_grpc_batch(self):
+        now = datetime.now()
+        batch = [
+            TData(
+                deviceName=name,
+                timestamp=now,
+                processValue=TemperatureQ(20.0 + i, '°C'),
+                setpoint=TemperatureQ(25.0, '°C'),
+                workingSetpoint=TemperatureQ(30.0, '°C'),
+                remoteSetpoint=TemperatureQ(25.0, '°C'),
+                workingOutput=DimensionlessQ(1.2, '%'),
+                status=InstrumentStatus.Ok,
+                rampStatus=TemperatureRampState.NoRamp,
+                scheduledTimestamp=now if name == 'a' else None,
+            )
+            for i, name in enumerate(['a', 'b', 'a'])
+        ]
+
+        response = TData.to_grpc_batch(batch)
+        assert list(response.devices) == ['a', 'b']
+        assert list(response.deviceIndex) == [0, 1, 0]
+        assert len(response.processValue) == 3
+
+        result = TData.from_grpc_batch(response)
+        assert [d.deviceName for d in result] == ['a', 'b', 'a']
+        assert [d.timestamp for d in result] == [now] * 3
+        assert [d.scheduledTimestamp for d in result] == [now, None, now]
+        assert result[2].processValue.m_as('°C') == pytest.approx(22.0)
+        assert result[1].workingOutput == DimensionlessQ(1.2, '%')
+
+    def test_grpc_batch_fields(self):
+        now = datetime.now()
+        data = TData(
+            deviceName='test',
+            timestamp=now,
+            processValue=TemperatureQ(20.0, '°C'),
+            setpoint=TemperatureQ(25.0, '°C'),
+            workingSetpoint=TemperatureQ(30.0, '°C'),
+            remoteSetpoint=TemperatureQ(25.0, '°C'),
+            workingOutput=DimensionlessQ(1.2, '%'),
+            status=InstrumentStatus.Ok,
+            rampStatus=TemperatureRampState.NoRamp,
+        )
+
+        response = TData.to_grpc_batch([data, data], fields=['processValue'])
+        assert len(response.processValue) == 2
+        assert len(response.setpoint) == 0
+
+        result = TData.from_grpc_batch(response)
+        assert result[0].processValue == TemperatureQ(20.0, '°C')
+        assert result[0].setpoint.m_as('K') == 0.0
+
+
+def wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def io():
+    # EurothermIO is a singleton: use a separate (subclass) instance per test
+    cls = type('EurothermIOUnderTest', (EurothermIO,), {})
+    yield cls([])
+    SingletonMeta._instance.pop(cls, None)
+
 
 class TestEurothermIO:
+    def test_emit_does_not_block(self, io):
+        received = []
+        subscription = io.observable.subscribe(received.append)
+
+        # emitting samples does not wait for a lock held by a control call
+        held, release = threading.Event(), threading.Event()
+
+        def hold_lock():
+            with io._lock:
+                held.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        held.wait(5)
+        try:
+            started = time.monotonic()
+            for _ in range(3):
+                io._emit(create_data('emit-test'))
+            assert time.monotonic() - started < 0.5
+            assert wait_for(lambda: len(received) == 3)
+        finally:
+            release.set()
+            thread.join()
+            subscription.dispose()
+
+        sequences = [data.sequence for data in received]
+        assert sequences == sorted(sequences)
+
+    def test_complete(self, io):
+        received, completed = [], threading.Event()
+        io.observable.subscribe(received.append, on_completed=completed.set)
+
+        for _ in range(100):
+            io._emit(create_data('complete-test'))
+        io.complete()
+
+        # pending samples are delivered before completion
+        assert completed.wait(5)
+        assert len(received) == 100
+
     @pytest.mark.slow
     def test_stream_values(self):
         cfg = [
@@ -83,3 +223,63 @@ class TestEurothermIO:
         assert len(data) == 10
 
         io.stop()
+
+
+class TestIOThread:
+    @pytest.mark.slow
+    def test_modbus_device(self):
+        received = []
+        with EurothermModbusSlave() as slave:
+            slave[1][GenericAddress.PVIN] = 251.2
+            slave[1][GenericAddress.LR] = 1
+            device = DeviceConfig(
+                name='modbus',
+                driver='generic',
+                sampling_rate='20Hz',
+                connection=SerialPortConfig(port=slave.url),
+            )
+            thread = IOThread(device, received.append)
+            thread.start()
+            try:
+                assert wait_for(lambda: len(received) >= 5)
+            finally:
+                thread.cancel()
+                thread.join(5)
+                ModbusSerialConnection.__connections__.pop(slave.url).close()
+
+            # the remote setpoint is written while remote control is selected
+            assert slave[1][GenericAddress.RmSP] == thread.remote_setpoint.m_as('°C')
+
+        assert received[0].deviceName == 'modbus'
+        assert received[0].processValue.m_as('°C') == pytest.approx(251.2, abs=1e-4)
+        assert InstrumentStatus.LocalRemoteSPSelect in received[0].status
+
+    @pytest.mark.slow
+    def test_ramp_with_scheduler(self):
+        with EurothermModbusSlave(latency=0.01) as slave:
+            slave[1][GenericAddress.PVIN] = 100.0
+            device = DeviceConfig(
+                name='scheduled',
+                driver='generic',
+                sampling_rate='50Hz',
+                connection=SerialPortConfig(port=slave.url, scheduled=True),
+            )
+            thread = IOThread(device, lambda data: time.sleep(0.005))
+            thread.start()
+            try:
+                # starting a ramp reads the temperature through the scheduler
+                # while the device is being polled
+                for _ in range(3):
+                    starter = threading.Thread(
+                        target=thread.start_temperature_ramp,
+                        args=(TemperatureQ(200.0, '°C'), TemperatureRateQ(1, 'K/min')),
+                    )
+                    starter.start()
+                    starter.join(5)
+                    assert not starter.is_alive()
+                assert thread.ramp_status == TemperatureRampState.Running
+                thread.stop_temperature_ramp()
+            finally:
+                thread.cancel()
+                thread.join(5)
+                ModbusSerialConnection.__connections__.pop(slave.url).close()
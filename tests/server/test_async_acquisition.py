@@ -0,0 +1,106 @@
+import dataclasses
+import logging
+
+import numpy as np
+import pytest
+from reactivex import operators as op
+
+from eurothermlib.configuration import DeviceConfig, SerialPortConfig
+from eurothermlib.controllers import AsyncModbusSerialConnection
+from eurothermlib.controllers.generic import GenericAddress
+from eurothermlib.controllers.modbus_slave import EurothermModbusSlave
+from eurothermlib.server.async_acquisition import AsyncEurothermIO
+from eurothermlib.server.acquisition import SingletonMeta, TemperatureRampState
+from eurothermlib.utils import TemperatureQ, TemperatureRateQ
+
+
+@pytest.fixture(scope='module')
+def io():
+    cfg = [
+        DeviceConfig(name='device1', sampling_rate='20Hz'),
+        DeviceConfig(name='device2', sampling_rate='10Hz'),
+    ]
+    io = AsyncEurothermIO(cfg)
+    io.start()
+    yield io
+    io.stop()
+
+
+class TestAsyncEurothermIO:
+    def test_stream_values(self, io):
+        data = io.observable.pipe(op.take(10), op.to_list()).run()
+        assert len(data) == 10
+        assert {d.deviceName for d in data} == {'device1', 'device2'}
+
+    def test_remote_setpoint(self, io):
+        io.set_remote_setpoint('device1', TemperatureQ(50.0, '°C'))
+        data = io.observable.pipe(
+            op.filter(lambda x: x.deviceName == 'device1'), op.take(1)
+        ).run()
+        assert data.remoteSetpoint == TemperatureQ(50.0, '°C')
+
+    def test_temperature_ramp(self, io):
+        observable = io.start_temperature_ramp(
+            'device2', TemperatureQ(30.0, '°C'), TemperatureRateQ(1.0, 'K/s')
+        )
+        values = observable.pipe(op.take(2), op.to_list()).run()
+        assert values[1] > values[0]
+
+        data = io.observable.pipe(
+            op.filter(lambda x: x.deviceName == 'device2'), op.take(1)
+        ).run()
+        assert data.rampStatus == TemperatureRampState.Running
+
+        io.stop_temperature_ramp('device2')
+        data = io.observable.pipe(
+            op.filter(lambda x: x.deviceName == 'device2'), op.take(1)
+        ).run()
+        assert data.rampStatus == TemperatureRampState.Stopped
+
+    def test_current_process_values(self, io):
+        data = io.current_process_values('device1')
+        assert data.deviceName == 'device1'
+
+        # cached values are returned immediately
+        cached = dataclasses.replace(data, deviceName='cached')
+        io._emit(cached)
+        assert io.current_process_values('cached') is cached
+        assert io.latest('cached')[1] >= 0.0
+
+        # force a fresh sample
+        fresh = io.current_process_values('device1', max_age=0.0)
+        assert fresh.timestamp > data.timestamp
+
+    def test_history(self, io):
+        data = io.current_process_values('device1', max_age=0.0)
+        history = io.history('device1')
+        assert len(history) >= 1
+        assert history['timestamp'][-1] >= np.datetime64(data.timestamp, 'us')
+        assert len(io.history('unknown')) == 0
+
+
+class TestAsyncModbusDevice:
+    @pytest.mark.slow
+    def test_connection_closed_on_stop(self, caplog):
+        # AsyncEurothermIO is a singleton: use a separate (subclass) instance
+        cls = type('AsyncEurothermIOUnderTest', (AsyncEurothermIO,), {})
+        with EurothermModbusSlave() as slave:
+            slave[1][GenericAddress.PVIN] = 251.2
+            device = DeviceConfig(
+                name='modbus',
+                driver='generic',
+                sampling_rate='20Hz',
+                connection=SerialPortConfig(port=slave.url, scheduled=True),
+            )
+            io = cls([device])
+            try:
+                with caplog.at_level(logging.WARNING):
+                    io.start()
+                data = io.observable.pipe(op.take(2), op.to_list()).run()
+                io.stop()
+            finally:
+                SingletonMeta._instance.pop(cls, None)
+
+        assert data[0].processValue.m_as('°C') == pytest.approx(251.2, abs=1e-4)
+        assert slave.url not in AsyncModbusSerialConnection.__connections__
+        assert 'scheduled=True' in caplog.text
@@ -0,0 +1,100 @@
+import asyncio
+import threading
+
+import pytest
+from toolz.curried import pipe, take
+
+from eurothermlib.configuration import Config, DeviceConfig, ServerConfig
+from eurothermlib.server import connect, is_alive, serve
+from eurothermlib.server.async_servicer import StreamBridge
+from eurothermlib.server.servicer import StreamQueue
+from tests.conftest import create_data
+
+
+class TestStreamBridge:
+    def test_put_from_thread(self):
+        async def run():
+            bridge = StreamBridge(
+                asyncio.get_running_loop(), StreamQueue(10, 'drop-oldest')
+            )
+
+            def produce():
+                for sequence in range(1, 4):
+                    bridge.put(create_data('a', sequence=sequence))
+                bridge.complete()
+
+            threading.Thread(target=produce).start()
+            received = []
+            while (item := await bridge.get()) is not None:
+                received.append(item.sequence)
+            return received
+
+        assert asyncio.run(run()) == [1, 2, 3]
+
+    def test_timeout(self):
+        async def run():
+            bridge = StreamBridge(
+                asyncio.get_running_loop(), StreamQueue(10, 'drop-oldest')
+            )
+            return await bridge.get(timeout=0.05)
+
+        assert asyncio.run(run()) is None
+
+    def test_overflow(self):
+        async def run():
+            bridge = StreamBridge(
+                asyncio.get_running_loop(), StreamQueue(2, 'disconnect')
+            )
+            for _ in range(3):
+                bridge.put(create_data('a'))
+            return await bridge.get()
+
+        assert asyncio.run(run()) is None
+
+
+class TestAsyncServer:
+    @pytest.mark.slow
+    def test_serve(self):
+        config = Config(
+            server=ServerConfig(port=50062, servicer='asyncio'),  # type: ignore
+            devices=[
+                DeviceConfig(name='device1', sampling_rate='5Hz'),  # type: ignore
+            ],
+        )
+
+        future = serve(config)
+        assert future.running()
+        client = connect(config)
+
+        try:
+            assert is_alive(config)
+            data = pipe(
+                client.stream_process_values(devices=['device1']), take(3), list
+            )
+            assert [d.deviceName for d in data] == ['device1'] * 3
+
+            batches = pipe(
+                client.stream_process_values_batched(devices=['device1'], batch_size=2),
+                take(2),
+                list,
+            )
+            assert [len(batch) for batch in batches] == [2, 2]
+
+            resumed = pipe(
+                client.stream_process_values(
+                    devices=['device1'], resume_from={'device1': data[0].sequence}
+                ),
+                take(2),
+                list,
+            )
+            assert resumed == data[1:]
+
+            # open streams end when the server stops
+            stream = client.stream_process_values()
+            next(stream)
+        finally:
+            client.stop_server()
+
+        assert all(True for _ in stream)
+        future.result(timeout=30)
+        assert not is_alive(config)
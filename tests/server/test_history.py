@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eurothermlib.controllers import InstrumentStatus
+from eurothermlib.server.acquisition import TData
+from eurothermlib.server import history
+from eurothermlib.server.history import SampleHistory
+from tests.conftest import create_data as create_sample
+
+T0 = datetime(2024, 7, 26, 10, 12, 32)
+
+
+def create_data(i: int):
+    return create_sample(
+        timestamp=T0 + timedelta(seconds=i),
+        temperature=float(i),
+        status=InstrumentStatus.NewAlarm,
+        scheduled=T0 if i == 0 else None,
+    )
+
+
+class TestSampleHistory:
+    def test_empty(self):
+        history = SampleHistory(4)
+        assert len(history) == 0
+        assert len(history.window()) == 0
+
+    def test_append(self):
+        history = SampleHistory(4)
+        for i in range(3):
+            history.append(create_data(i))
+
+        window = history.window()
+        assert len(history) == 3
+        assert window['processValue'] - 273.15 == pytest.approx([0.0, 1.0, 2.0])
+        assert window['workingOutput'] == pytest.approx([1.2] * 3)
+        assert list(window['status']) == [int(InstrumentStatus.NewAlarm)] * 3
+        assert window['timestamp'][0] == np.datetime64(T0, 'us')
+        assert window['scheduledTimestamp'][0] == np.datetime64(T0, 'us')
+        assert np.isnat(window['scheduledTimestamp'][1])
+
+    def test_wrap_around(self):
+        history = SampleHistory(4)
+        for i in range(10):
+            history.append(create_data(i))
+            window = history.window()
+            expected = list(range(max(0, i - 3), i + 1))
+            assert window['processValue'] - 273.15 == pytest.approx(expected)
+
+        assert len(history) == 4
+
+    def test_window_is_copy(self):
+        history = SampleHistory(4)
+        for i in range(4):
+            history.append(create_data(i))
+
+        # the buffer is full: the next sample replaces the oldest one
+        window = history.window()
+        history.append(create_data(4))
+
+        assert not np.shares_memory(window, history._buffer)
+        assert window['processValue'] - 273.15 == pytest.approx([0, 1, 2, 3])
+
+    def test_window(self):
+        history = SampleHistory(8)
+        for i in range(10):
+            history.append(create_data(i))
+
+        assert history.window(3)['processValue'] - 273.15 == pytest.approx([7, 8, 9])
+        since = history.window(since=T0 + timedelta(seconds=5.5))
+        assert since['processValue'] - 273.15 == pytest.approx([6, 7, 8, 9])
+        assert len(history.window(2, since=T0)) == 2
+
+    def test_capacity(self):
+        with pytest.raises(ValueError):
+            SampleHistory(0)
+
+
+def create_records(n: int):
+    samples = SampleHistory(n)
+    for i in range(n):
+        samples.append(create_data(i))
+    return samples.window()
+
+
+class TestHistoryQueries:
+    def test_select(self):
+        records = create_records(10)
+        selected = history.select(
+            records, T0 + timedelta(seconds=2), T0 + timedelta(seconds=4)
+        )
+        assert selected['processValue'] - 273.15 == pytest.approx([2, 3, 4])
+        assert len(history.select(records)) == 10
+
+    def test_downsample(self):
+        records = create_records(10)
+        assert len(history.downsample(records, 0)) == 10
+        assert len(history.downsample(records, 20)) == 10
+        assert history.downsample(records, 1)['processValue'] - 273.15 == (
+            pytest.approx([9])
+        )
+        sampled = history.downsample(records, 4)
+        assert sampled['processValue'] - 273.15 == pytest.approx([0, 3, 6, 9])
+
+    def test_to_grpc_batch(self):
+        records = create_records(3)
+        data = TData.from_grpc_batch(history.to_grpc_batch('test', records))
+        assert data == [create_data(i) for i in range(3)]
+
+    def test_from_frame(self):
+        frame = pd.DataFrame(
+            dict(
+                timestamp=[(T0 + timedelta(seconds=i)).isoformat() for i in range(2)],
+                processValue=[20.0, 21.0],
+                workingOutput=[80.0, 81.0],
+            )
+        )
+        records = history.from_frame(
+            frame, {'processValue': '°C', 'workingOutput': '%'}
+        )
+        assert records['timestamp'][1] == np.datetime64(T0 + timedelta(seconds=1))
+        assert records['processValue'] == pytest.approx([293.15, 294.15])
+        assert records['workingOutput'] == pytest.approx([80.0, 81.0])
+        assert np.isnan(records['setpoint']).all()
+        assert np.isnat(records['scheduledTimestamp']).all()
+
+    def test_from_history(self):
+        records = create_records(3)
+        assert TData.from_history('test', records) == [create_data(i) for i in range(3)]
@@ -1,8 +1,167 @@
+from datetime import datetime, timedelta
+from queue import Empty
+
 import pytest
 from toolz.curried import pipe, take
 
 from eurothermlib.configuration import Config, DeviceConfig, ServerConfig
 from eurothermlib.server import connect, is_alive, serve
+from eurothermlib.server.acquisition import TData
+from eurothermlib.server.proto import service_pb2
+from eurothermlib.server.history import SampleHistory
+from eurothermlib.server.servicer import (
+    ProcessValuesStream,
+    ResumeGate,
+    StreamFilter,
+    StreamQueue,
+)
+from tests.conftest import create_data
+
+
+class TestStreamFilter:
+    def test_default(self):
+        stream_filter = StreamFilter(service_pb2.StreamProcessValuesRequest())
+        assert stream_filter(create_data('a', datetime.now()))
+        assert stream_filter(create_data('b', datetime.now()))
+        assert stream_filter.fields is None
+
+    def test_devices(self):
+        stream_filter = StreamFilter(
+            service_pb2.StreamProcessValuesRequest(deviceNames=['a'])
+        )
+        assert stream_filter(create_data('a', datetime.now()))
+        assert not stream_filter(create_data('b', datetime.now()))
+
+    def test_decimation(self):
+        stream_filter = StreamFilter(
+            service_pb2.StreamProcessValuesRequest(decimation=3)
+        )
+        now = datetime.now()
+        result = [stream_filter(create_data('a', now)) for _ in range(7)]
+        assert result == [True, False, False, True, False, False, True]
+
+    def test_max_rate(self):
+        stream_filter = StreamFilter(
+            service_pb2.StreamProcessValuesRequest(maxRate=2.0)
+        )
+        t0 = datetime.now()
+        result = [
+            stream_filter(create_data(device, t0 + timedelta(seconds=0.1 * k)))
+            for k in range(11)
+            for device in ['a', 'b']
+        ]
+        assert result[::2] == result[1::2]
+        assert result[::2] == [True] + 4 * [False] + [True] + 4 * [False] + [True]
+
+    def test_fields(self):
+        stream_filter = StreamFilter(
+            service_pb2.StreamProcessValuesRequest(fields=['processValue'])
+        )
+        response = create_data('a', datetime.now()).to_grpc_response(
+            stream_filter.fields
+        )
+        assert response.processValue == pytest.approx(293.15)
+        assert response.setpoint == 0.0
+
+    def test_unknown_fields(self):
+        with pytest.raises(ValueError):
+            StreamFilter(service_pb2.StreamProcessValuesRequest(fields=['unknown']))
+
+
+class TestStreamQueue:
+    def fill(self, q: StreamQueue, devices: str):
+        now = datetime.now()
+        for sequence, device in enumerate(devices, start=1):
+            q.put(create_data(device, now, sequence))
+
+    def drain(self, q: StreamQueue):
+        return [(d.deviceName, d.sequence) for d in (q.get(0) for _ in range(len(q)))]
+
+    def test_drop_oldest(self):
+        q = StreamQueue(3, 'drop-oldest')
+        self.fill(q, 'aaaaa')
+        assert q.dropped == 2
+        assert self.drain(q) == [('a', 3), ('a', 4), ('a', 5)]
+
+    def test_drop_newest(self):
+        q = StreamQueue(3, 'drop-newest')
+        self.fill(q, 'aaaaa')
+        assert q.dropped == 2
+        assert self.drain(q) == [('a', 1), ('a', 2), ('a', 3)]
+
+    def test_coalesce(self):
+        q = StreamQueue(3, 'coalesce')
+        self.fill(q, 'abcaa')
+        assert q.dropped == 2
+        assert self.drain(q) == [('b', 2), ('c', 3), ('a', 5)]
+
+    def test_disconnect(self):
+        q = StreamQueue(3, 'disconnect')
+        self.fill(q, 'aaaa')
+        assert q.overflowed
+        with pytest.raises(Empty):
+            q.get(0)
+
+    def test_batched(self):
+        q = StreamQueue(1, 'coalesce', batched=True)
+        q.put([create_data('a', datetime.now())] * 3)
+        q.put([create_data('a', datetime.now())] * 2)
+        assert q.dropped == 3
+        assert len(q.get(0)) == 2
+
+
+class TestProcessValuesStream:
+    def test_dropped(self):
+        responses = iter(
+            [
+                service_pb2.ProcessValues(sequence=i, dropped=d)
+                for i, d in enumerate([0, 2, 2])
+            ]
+        )
+        stream = ProcessValuesStream(responses, TData.from_grpc_response)
+        assert [d.sequence for d in stream] == [0, 1, 2]
+        assert stream.dropped == 2
+
+
+class TestResumeGate:
+    def create_history(self, n: int):
+        history = SampleHistory(n)
+        for i in range(n):
+            history.append(
+                create_data('device1', datetime.now() + timedelta(seconds=i), i + 1)
+            )
+        return history
+
+    def test_replay(self):
+        history = self.create_history(5)
+        received = []
+        gate = ResumeGate({'device1': 2}, received.append)
+
+        # live samples are held back during the replay
+        gate.on_next(create_data('device1', datetime.now(), 5))
+        gate.on_next(create_data('device1', datetime.now(), 6))
+        gate.on_next(create_data('device2', datetime.now(), 1))
+        assert received == []
+
+        gate.replay(lambda device: history.window())
+        assert [(d.deviceName, d.sequence) for d in received] == [
+            ('device1', 3),
+            ('device1', 4),
+            ('device1', 5),
+            ('device1', 6),
+            ('device2', 1),
+        ]
+
+        # replayed samples are not passed on twice
+        gate.on_next(create_data('device1', datetime.now(), 7))
+        assert received[-1].sequence == 7
+
+    def test_no_resume(self):
+        received = []
+        gate = ResumeGate({}, received.append)
+        gate.replay(lambda device: pytest.fail('unexpected history access'))
+        gate.on_next(create_data('device1', datetime.now(), 1))
+        assert len(received) == 1
 
 
 class TestServer:
@@ -22,6 +181,7 @@ class TestServer:
 
         client = connect(config)
         client.stop_server()
+        future.result(timeout=30)  # wait for the server to shut down
         assert not is_alive(config)
 
 
@@ -51,3 +211,118 @@ class TestClient:
 
         finally:
             client.stop_server()
+
+    @pytest.mark.slow
+    def test_stream_filtered_process_values(self):
+        config = Config(
+            server=ServerConfig(),
+            devices=[
+                DeviceConfig(name='device1', sampling_rate='5Hz'),  # type: ignore
+                DeviceConfig(name='device2', sampling_rate='5Hz'),  # type: ignore
+            ],
+        )
+
+        future = serve(config)
+        assert future.running()
+        client = connect(config)
+
+        try:
+            data = pipe(
+                client.stream_process_values(devices=['device2'], decimation=2),
+                take(3),
+                list,
+            )
+            assert [d.deviceName for d in data] == ['device2'] * 3
+
+        finally:
+            client.stop_server()
+
+    @pytest.mark.slow
+    def test_stream_batched_process_values(self):
+        config = Config(
+            server=ServerConfig(),
+            devices=[
+                DeviceConfig(name='device1', sampling_rate='5Hz'),  # type: ignore
+                DeviceConfig(name='device2', sampling_rate='5Hz'),  # type: ignore
+            ],
+        )
+
+        future = serve(config)
+        assert future.running()
+        client = connect(config)
+
+        try:
+            batches = pipe(
+                client.stream_process_values_batched(batch_size=4),
+                take(2),
+                list,
+            )
+            assert [len(batch) for batch in batches] == [4, 4]
+            assert all(isinstance(d, TData) for d in batches[0])
+
+        finally:
+            client.stop_server()
+
+    @pytest.mark.slow
+    def test_get_history(self):
+        config = Config(
+            server=ServerConfig(),
+            devices=[
+                DeviceConfig(name='device1', sampling_rate='5Hz'),  # type: ignore
+            ],
+        )
+
+        future = serve(config)
+        assert future.running()
+        client = connect(config)
+
+        try:
+            pipe(client.stream_process_values(devices=['device1']), take(5), list)
+            data = client.get_history('device1')
+            assert len(data) >= 5
+            assert all(d.deviceName == 'device1' for d in data)
+            assert data == sorted(data, key=lambda d: d.timestamp)
+
+            start = data[1].timestamp
+            assert client.get_history('device1', start=start)[0] == data[1]
+            assert len(client.get_history('device1', max_points=2)) == 2
+            assert client.get_history('unknown') == []
+
+        finally:
+            client.stop_server()
+
+    @pytest.mark.slow
+    def test_resume_stream(self):
+        config = Config(
+            server=ServerConfig(),
+            devices=[
+                DeviceConfig(name='device1', sampling_rate='5Hz'),  # type: ignore
+            ],
+        )
+
+        future = serve(config)
+        assert future.running()
+        client = connect(config)
+
+        try:
+            data = pipe(
+                client.stream_process_values(devices=['device1']), take(3), list
+            )
+            sequences = [d.sequence for d in data]
+            assert sequences == list(range(sequences[0], sequences[0] + 3))
+
+            # samples emitted since the first sample are replayed
+            resumed = pipe(
+                client.stream_process_values(
+                    devices=['device1'], resume_from={'device1': sequences[0]}
+                ),
+                take(5),
+                list,
+            )
+            assert [d.sequence for d in resumed] == list(
+                range(sequences[0] + 1, sequences[0] + 6)
+            )
+            assert resumed[:2] == data[1:]
+
+        finally:
+            client.stop_server()
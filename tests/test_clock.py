@@ -0,0 +1,47 @@
+import pytest
+
+from eurothermlib.clock import SamplingClock
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSamplingClock:
+    def test_deadlines_do_not_drift(self):
+        time_fn = FakeTime()
+        clock = SamplingClock(0.5, time_fn=time_fn)
+        assert clock.delay() == 0.0
+
+        for k in range(1, 5):
+            # I/O time must not shift the following deadlines
+            time_fn.now += 0.1
+            assert clock.advance() == 0
+            assert clock.deadline == pytest.approx(100.0 + k * 0.5)
+            time_fn.now = clock.deadline
+
+        assert clock.missed == 0
+
+    def test_skip_missed_slots(self):
+        time_fn = FakeTime()
+        clock = SamplingClock(1.0, time_fn=time_fn)
+
+        # sample took 2.5 intervals -> slots at 101 and 102 are skipped
+        time_fn.now += 2.5
+        assert clock.advance() == 2
+        assert clock.deadline == pytest.approx(103.0)
+        assert clock.delay() == pytest.approx(0.5)
+        assert clock.missed == 2
+
+    def test_scheduled_datetime(self):
+        time_fn = FakeTime()
+        clock = SamplingClock(0.25, time_fn=time_fn)
+        t0 = clock.scheduled_datetime()
+
+        clock.advance()
+        clock.advance()
+        assert (clock.scheduled_datetime() - t0).total_seconds() == pytest.approx(0.5)
@@ -0,0 +1,158 @@
+import numpy as np
+import pytest
+
+from eurothermlib.pid import PID, BatchPID
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def outputs(pids, inputs, dt=None):
+    return np.array(
+        [np.nan if (v := pid(x, dt)) is None else v for pid, x in zip(pids, inputs)]
+    )
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(42)
+
+
+@pytest.fixture
+def loops(rng):
+    # parameters of 8 loops covering all combinations of the modes
+    count = 8
+    return dict(
+        Kp=rng.uniform(0.1, 2.0, count),
+        Ki=rng.uniform(0.0, 0.5, count),
+        Kd=rng.uniform(0.0, 0.2, count),
+        setpoint=rng.uniform(-10.0, 10.0, count),
+        proportional_on_measurement=np.arange(count) % 2 == 0,
+        differential_on_measurement=np.arange(count) % 4 < 2,
+    )
+
+
+def scalar_pids(loops, **kwargs):
+    count = len(loops['Kp'])
+    return [
+        PID(**{name: value[k] for name, value in loops.items()}, **kwargs)
+        for k in range(count)
+    ]
+
+
+class TestBatchPID:
+    @pytest.mark.parametrize(
+        'limits',
+        [(None, None), (-1.0, 1.0), (0.0, None)],
+    )
+    def test_same_outputs_as_pid(self, rng, loops, limits):
+        pids = scalar_pids(loops, sample_time=None, output_limits=limits)
+        batch = BatchPID(**loops, sample_time=None, output_limits=limits)
+
+        for _ in range(50):
+            inputs = rng.uniform(-10.0, 10.0, len(pids))
+            expected = outputs(pids, inputs, dt=0.1)
+            np.testing.assert_allclose(batch(inputs, dt=0.1), expected)
+
+        for k, pid in enumerate(pids):
+            np.testing.assert_allclose(
+                [component[k] for component in batch.components], pid.components
+            )
+
+    def test_auto_mode(self, rng, loops):
+        pids = scalar_pids(loops, sample_time=None, output_limits=(-5.0, 5.0))
+        batch = BatchPID(**loops, sample_time=None, output_limits=(-5.0, 5.0))
+        manual = np.arange(len(pids)) < 3
+
+        for step in range(30):
+            if step == 10:
+                for pid in np.array(pids)[manual]:
+                    pid.auto_mode = False
+                batch.auto_mode = ~manual
+            if step == 20:
+                for pid in np.array(pids)[manual]:
+                    pid.set_auto_mode(True, last_output=1.5)
+                batch.set_auto_mode(True, last_output=1.5)
+
+            inputs = rng.uniform(-10.0, 10.0, len(pids))
+            expected = outputs(pids, inputs, dt=0.5)
+            np.testing.assert_allclose(batch(inputs, dt=0.5), expected)
+
+    def test_sample_time(self, loops):
+        clock = FakeClock()
+        pids = scalar_pids(loops, sample_time=1.0, time_fn=clock)
+        batch = BatchPID(**loops, sample_time=1.0, time_fn=clock)
+        inputs = np.linspace(-5.0, 5.0, len(pids))
+
+        for now in (0.5, 0.8, 1.6, 2.0, 2.7, 4.0):
+            clock.now = now
+            np.testing.assert_allclose(batch(inputs), outputs(pids, inputs))
+
+    def test_manual_mode_without_output(self):
+        batch = BatchPID(Kp=[1.0, 1.0], auto_mode=[True, False], sample_time=None)
+
+        output = batch([1.0, 1.0], dt=1.0)
+
+        assert output[0] == -1.0
+        assert np.isnan(output[1])
+
+    def test_error_map(self, rng, loops):
+        pids = scalar_pids(loops, sample_time=None, error_map=np.tanh)
+        batch = BatchPID(**loops, sample_time=None, error_map=np.tanh)
+
+        for _ in range(10):
+            inputs = rng.uniform(-10.0, 10.0, len(pids))
+            expected = outputs(pids, inputs, dt=0.1)
+            np.testing.assert_allclose(batch(inputs, dt=0.1), expected)
+
+    def test_size(self):
+        batch = BatchPID(Kp=2.0, setpoint=1.0, size=3)
+
+        assert len(batch) == 3
+        np.testing.assert_allclose(batch([0.0, 1.0, 2.0], dt=1.0), [2.0, 0.0, -2.0])
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            BatchPID(Kp=[1.0, 2.0], Ki=[1.0, 2.0, 3.0])
+        with pytest.raises(ValueError):
+            BatchPID(output_limits=([0.0, 2.0], 1.0))
+        with pytest.raises(ValueError):
+            BatchPID(size=2)(np.zeros(2), dt=-1.0)
+
+    def test_output_limits(self):
+        batch = BatchPID(Kp=1.0, setpoint=[5.0, -5.0], sample_time=None)
+        batch.output_limits = (-1.0, 2.0)
+
+        np.testing.assert_allclose(batch([0.0, 0.0], dt=1.0), [2.0, -1.0])
+        lower, upper = batch.output_limits
+        np.testing.assert_allclose(lower, [-1.0, -1.0])
+
+    def test_extend(self, rng, loops):
+        pids = scalar_pids(loops, sample_time=None, output_limits=(-1.0, 1.0))
+        half = len(pids) // 2
+        first, second = (
+            BatchPID(
+                **{name: value[part] for name, value in loops.items()},
+                sample_time=None,
+                output_limits=(-1.0, 1.0),
+            )
+            for part in (slice(None, half), slice(half, None))
+        )
+
+        # loops keep their state when they are added to another batch
+        inputs = rng.uniform(-10.0, 10.0, len(pids))
+        outputs(pids, inputs, dt=0.1)
+        first(inputs[:half], dt=0.1)
+        second(inputs[half:], dt=0.1)
+        first.extend(second)
+
+        assert len(first) == len(pids)
+        for _ in range(10):
+            inputs = rng.uniform(-10.0, 10.0, len(pids))
+            expected = outputs(pids, inputs, dt=0.1)
+            np.testing.assert_allclose(first(inputs, dt=0.1), expected)
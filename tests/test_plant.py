@@ -0,0 +1,36 @@
+import math
+
+import numpy as np
+import pytest
+
+from eurothermlib.plant import ThermalPlant
+
+
+class TestThermalPlant:
+    def test_time_constant(self):
+        plant = ThermalPlant()
+        assert plant.time_constant == pytest.approx(1502.4)
+
+    def test_steady_state(self):
+        plant = ThermalPlant()
+        assert plant.steady_state(0.0) == plant.room_temperature
+        assert plant.steady_state(1.0) == pytest.approx(500.0)
+
+    def test_update(self):
+        plant = ThermalPlant()
+
+        plant.update(1.0, plant.time_constant)
+
+        assert plant.temperature == pytest.approx(500.0 - 480.0 / math.e)
+
+    def test_large_time_step(self):
+        plant = ThermalPlant(temperature=500.0)
+        assert plant.update(0.0, 1e6) == pytest.approx(plant.room_temperature)
+
+    def test_arrays(self):
+        plant = ThermalPlant(temperature=np.array([20.0, 20.0]))
+
+        plant.update(np.array([0.0, 1.0]), 60.0)
+
+        assert plant.temperature[0] == 20.0
+        assert plant.temperature[1] > 20.0
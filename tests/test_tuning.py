@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eurothermlib.pid import PID
+from eurothermlib.plant import ThermalPlant
+from eurothermlib.tuning import best, evaluate, parse_range, step_response, sweep
+
+TUNINGS = [(0.05, 1e-4, 0.0), (1.0, 1e-2, 0.0), (0.5, 0.0, 10.0)]
+
+
+def simulate(tunings, setpoint=300.0, duration=3600.0, dt=1.0):
+    # reference: scalar PID controlling a scalar plant
+    plant = ThermalPlant()
+    pid = PID(*tunings, setpoint=setpoint, sample_time=None, output_limits=(0, 1))
+    temperatures = []
+    for _ in range(int(duration / dt)):
+        temperatures.append(plant.update(pid(plant.temperature, dt=dt), dt))
+    return np.array(temperatures)
+
+
+class TestParseRange:
+    def test_list(self):
+        assert parse_range('1,2.5,1e-3').tolist() == [1.0, 2.5, 1e-3]
+
+    def test_linear(self):
+        assert parse_range('0:1:5').tolist() == [0.0, 0.25, 0.5, 0.75, 1.0]
+
+    def test_log(self):
+        assert parse_range('1e-3:1:4:log') == pytest.approx([1e-3, 1e-2, 1e-1, 1])
+
+    @pytest.mark.parametrize('text', ['1:2', '1:2:3:lin', 'a,b'])
+    def test_invalid(self, text):
+        with pytest.raises(ValueError):
+            parse_range(text)
+
+
+class TestEvaluate:
+    def test_step_response(self):
+        Kp, Ki, Kd = np.array(TUNINGS).T
+
+        times, temperatures = step_response(Kp, Ki, Kd, ThermalPlant(), 300.0, 3600)
+
+        assert times[0] == 1.0 and times[-1] == 3600.0
+        for k, tunings in enumerate(TUNINGS):
+            assert temperatures[:, k] == pytest.approx(simulate(tunings))
+
+    def test_metrics(self):
+        Kp, Ki, Kd = np.array(TUNINGS).T
+
+        response = evaluate(Kp, Ki, Kd, ThermalPlant(), 300.0, 3600)
+
+        for k, tunings in enumerate(TUNINGS):
+            progress = (simulate(tunings) - 20.0) / 280.0
+            times = np.arange(1, len(progress) + 1)
+            rise = times[progress >= 0.9][0] - times[progress >= 0.1][0]
+            assert response.rise_time[k] == rise
+            overshoot = max(progress.max() - 1, 0) * 100
+            assert response.overshoot[k] == pytest.approx(overshoot)
+            outside = times[np.abs(progress - 1) > 0.02]
+            settling = np.inf if outside[-1] == 3600 else outside[-1]
+            assert response.settling_time[k] == settling
+            iae = np.abs(300.0 - progress * 280.0 - 20.0).sum()
+            assert response.iae[k] == pytest.approx(iae)
+
+    def test_not_settled(self):
+        # too slow to settle within the duration
+        response = evaluate(0.01, 0.0, 0.0, ThermalPlant(), 300.0, 600)
+
+        assert response.rise_time == [np.inf]
+        assert response.settling_time == [np.inf]
+        assert response.overshoot == [0.0]
+
+    def test_cooling(self):
+        plant = ThermalPlant(temperature=300.0)
+
+        response = evaluate(1.0, 1e-2, 0.0, plant, 200.0, 3600)
+
+        assert np.isfinite(response.settling_time).all()
+
+    def test_no_step(self):
+        with pytest.raises(ValueError):
+            evaluate(1.0, 0.0, 0.0, ThermalPlant(), 20.0, 60)
+
+
+class TestSweep:
+    def test_grid(self):
+        results = sweep([0.1, 1.0], [1e-4, 1e-3, 1e-2], [0.0], ThermalPlant(), 300, 600)
+
+        assert len(results) == 6
+        assert results[['Kp', 'Ki']].drop_duplicates().shape == (6, 2)
+        single = evaluate(1.0, 1e-3, 0.0, ThermalPlant(), 300.0, 600)
+        row = results[(results['Kp'] == 1.0) & (results['Ki'] == 1e-3)].iloc[0]
+        assert row['iae'] == pytest.approx(single.iae[0])
+
+    @pytest.mark.slow
+    def test_workers(self):
+        args = ([0.1, 0.5, 1.0], [1e-4, 1e-3, 1e-2], [0.0], ThermalPlant(), 300, 600)
+
+        expected = sweep(*args)
+        results = sweep(*args, workers=2)
+
+        pd.testing.assert_frame_equal(results, expected)
+
+    def test_best(self):
+        results = pd.DataFrame(
+            dict(
+                Kp=[1.0, 2.0, 3.0, 4.0],
+                Ki=0.0,
+                Kd=0.0,
+                rise_time=100.0,
+                overshoot=[1.0, 10.0, 0.0, 0.0],
+                settling_time=[200.0, 100.0, np.inf, 200.0],
+                iae=[2.0, 1.0, 1.0, 1.0],
+            )
+        )
+
+        ranking = best(results, max_overshoot=5.0)
+
+        assert ranking['Kp'].tolist() == [4.0, 1.0]
+        assert best(results, count=1)['Kp'].tolist() == [4.0]
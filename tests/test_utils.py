@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+
+import pint
+import pytest
+
+from eurothermlib.utils import (
+    DimensionlessQ,
+    LazyQuantity,
+    TemperatureQ,
+    TimeQ,
+    TypedQuantity,
+)
+
+
+class TestTypedQuantity:
+    def test_construction(self):
+        for _ in range(2):  # second iteration uses validated units
+            value = TemperatureQ(25.0, '°C')
+            assert type(value) is pint.Quantity
+            assert value.m_as('K') == pytest.approx(298.15)
+            assert DimensionlessQ(80, '%').m_as('') == pytest.approx(0.8)
+            assert TemperatureQ(value, 'K').m == pytest.approx(298.15)
+
+    def test_dimensionality_error(self):
+        TimeQ(1.0, 's')
+        for _ in range(2):
+            with pytest.raises(pint.DimensionalityError):
+                TemperatureQ(1.0, 's')
+            with pytest.raises(pint.DimensionalityError):
+                TimeQ(1.0, 'K')
+
+    def test_units_from_value(self):
+        assert TimeQ('5 s').m_as('s') == 5
+        with pytest.raises(pint.DimensionalityError):
+            TemperatureQ('5 s')
+
+    def test_class_cache(self):
+        assert TypedQuantity['[temperature]'] is TemperatureQ
+        assert TypedQuantity['[time]'] is TypedQuantity['[time]']
+        assert TypedQuantity['[time]'] is not TemperatureQ
+
+    def test_validate(self):
+        assert TemperatureQ._validate('20degC').m_as('K') == pytest.approx(293.15)
+        assert TimeQ._validate('1.5 [min]').m_as('s') == pytest.approx(90)
+        with pytest.raises(ValueError):
+            TemperatureQ._validate('20 min')
+        with pytest.raises(ValueError):
+            TemperatureQ._validate('20 foo')
+
+
+@dataclass
+class Record:
+    name: str
+    temperature: TemperatureQ = LazyQuantity(TemperatureQ, 'K')
+    output: DimensionlessQ = LazyQuantity(DimensionlessQ, '%')
+
+
+class TestLazyQuantity:
+    def test_quantities(self):
+        record = Record('a', temperature=TemperatureQ(25.0, '°C'), output=80)
+        assert record._temperature == pytest.approx(298.15)
+        assert record._output == 80.0
+        assert record.temperature.m_as('°C') == pytest.approx(25.0)
+        assert record.output.m_as('') == pytest.approx(0.8)
+
+    def test_required(self):
+        with pytest.raises(TypeError):
+            Record('a', temperature=300.0)  # type: ignore
+
+    def test_magnitude_getter(self):
+        record = Record('a', temperature=TemperatureQ(25.0, '°C'), output=80)
+
+        assert LazyQuantity.magnitude_getter('output')(record) == 80.0
+        temperature, output = LazyQuantity.magnitude_getter('temperature', 'output')(
+            record
+        )
+        assert temperature == pytest.approx(298.15)
+        assert output == 80.0